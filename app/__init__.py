@@ -1,4 +1,12 @@
-from .config import AppConfig, BridgeRouteEnvSettings, DiscordSettings, load_config
+from .config import (
+    AppConfig,
+    BridgeRouteEnvSettings,
+    DiscordSettings,
+    LoggingSettings,
+    MetricsSettings,
+    StorageSettings,
+    load_config,
+)
 from .container import BridgeApplication, build_bridge_app
 
 __all__ = [
@@ -6,6 +14,9 @@ __all__ = [
     "BridgeApplication",
     "BridgeRouteEnvSettings",
     "DiscordSettings",
+    "LoggingSettings",
+    "MetricsSettings",
+    "StorageSettings",
     "build_bridge_app",
     "load_config",
 ]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -16,6 +16,8 @@ class DiscordSettings:
     """Discord 関連の設定値を保持する。"""
 
     token: str
+    sharding: bool = False
+    shard_count: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,6 +28,7 @@ class BridgeRouteEnvSettings:
     routes_json: str | None
     require_reciprocal: bool
     strict: bool
+    routes_file: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,13 +39,160 @@ class SupabaseSettings:
     service_role_key: str
 
 
+STORAGE_BACKENDS = ("supabase", "postgres", "sqlite", "memory")
+
+
+@dataclass(frozen=True, slots=True)
+class StorageSettings:
+    """永続化バックエンドの選択と接続先。"""
+
+    backend: str = "supabase"
+    sqlite_path: Path = Path("data/bridge.sqlite3")
+    postgres_dsn: str | None = None
+    postgres_pool_min_size: int = 1
+    postgres_pool_max_size: int = 5
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSettings:
+    """メトリクス公開エンドポイントの設定。"""
+
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 9108
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionSettings:
+    """ブリッジ記録を定期削除するバックグラウンドタスクの設定。"""
+
+    enabled: bool = False
+    max_age_hours: float = 24.0
+    interval_seconds: float = 3600.0
+    batch_size: int = 500
+
+
+@dataclass(frozen=True, slots=True)
+class DeletionSettings:
+    """送信元メッセージ削除時の同期動作。"""
+
+    propagate_to_mirrors: bool = False
+    batch_window_seconds: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class EditSettings:
+    """送信元メッセージ編集時の同期動作。"""
+
+    debounce_seconds: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencySettings:
+    """重複配信されたメッセージイベントを二重にミラーしないための設定。"""
+
+    enabled: bool = False
+    cache_size: int = 65536
+
+
+@dataclass(frozen=True, slots=True)
+class TranscodeSettings:
+    """送信先の上限を超える添付画像をプロセスプールで縮小する設定。"""
+
+    enabled: bool = False
+    workers: int = 2
+    max_dimension: int = 2048
+    quality: int = 85
+    max_source_mb: int = 50
+    cache_size: int = 32
+
+
+@dataclass(frozen=True, slots=True)
+class AttachmentFanoutSettings:
+    """複数の送信先へ同じ添付を転送するときのアップロード方法。"""
+
+    mode: str = "each"
+    relay_channel_id: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class OutboundRetrySettings:
+    """一時的に失敗した Discord 送信操作の再送とジャーナル設定。"""
+
+    enabled: bool = False
+    journal_path: Path = Path("data/outbound_journal.jsonl")
+    base_delay_seconds: float = 2.0
+    max_delay_seconds: float = 300.0
+    max_attempts: int = 8
+    fsync_interval_seconds: float = 0.2
+    drain_timeout_seconds: float = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class DispatchSettings:
+    """ゲートウェイイベントをチャンネル単位で並列処理するワーカープールの設定。"""
+
+    enabled: bool = True
+    shards: int = 8
+    queue_size: int = 1000
+    overflow: str = "block"
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionSettings:
+    """送信元ギルド・チャンネル単位のトークンバケットによる流量制限の設定。"""
+
+    enabled: bool = False
+    guild_rate: float = 5.0
+    guild_burst: float = 30.0
+    channel_rate: float = 2.0
+    channel_burst: float = 10.0
+    policy: str = "shed"
+
+
+@dataclass(frozen=True, slots=True)
+class ClusterSettings:
+    """複数の Bot プロセスでチャンネル (またはシャード) を分担する設定。"""
+
+    enabled: bool = False
+    scope: str = "channel"
+    node_id: str | None = None
+    lease_ttl: float = 30.0
+    renew_interval: float = 10.0
+    nodes: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingSettings:
+    """ログ出力形式とサンプリング・抑制ポリシーの設定。"""
+
+    format: str = "text"
+    level: str = "INFO"
+    sample_rates: dict[str, float] = field(default_factory=dict)
+    warning_interval: float = 0.0
+    queue_enabled: bool = True
+
+
 @dataclass(frozen=True, slots=True)
 class AppConfig:
     """ブリッジ専用アプリケーション全体の設定。"""
 
     discord: DiscordSettings
     bridge_routes_env: BridgeRouteEnvSettings
-    supabase: SupabaseSettings
+    supabase: SupabaseSettings | None
+    storage: StorageSettings = field(default_factory=StorageSettings)
+    metrics: MetricsSettings = field(default_factory=MetricsSettings)
+    logging: LoggingSettings = field(default_factory=LoggingSettings)
+    retention: RetentionSettings = field(default_factory=RetentionSettings)
+    deletion: DeletionSettings = field(default_factory=DeletionSettings)
+    retry: OutboundRetrySettings = field(default_factory=OutboundRetrySettings)
+    dispatch: DispatchSettings = field(default_factory=DispatchSettings)
+    admission: AdmissionSettings = field(default_factory=AdmissionSettings)
+    edit: EditSettings = field(default_factory=EditSettings)
+    cluster: ClusterSettings = field(default_factory=ClusterSettings)
+    idempotency: IdempotencySettings = field(default_factory=IdempotencySettings)
+    transcode: TranscodeSettings = field(default_factory=TranscodeSettings)
+    attachment_fanout: AttachmentFanoutSettings = field(default_factory=AttachmentFanoutSettings)
 
 
 def _load_env_file(env_file: str | Path | None) -> None:
@@ -69,17 +219,59 @@ def load_config(env_file: str | Path | None = None) -> AppConfig:
 
     token = _prepare_client_token(raw_token=os.getenv("DISCORD_BOT_TOKEN"))
     bridge_routes_env = _load_bridge_env_settings()
-    supabase = SupabaseSettings(
-        url=_prepare_supabase_url(os.getenv("SUPABASE_URL")),
-        service_role_key=_prepare_supabase_key(os.getenv("SUPABASE_SERVICE_ROLE_KEY")),
-    )
+    storage = _load_storage_settings()
+    supabase: SupabaseSettings | None = None
+    if storage.backend == "supabase":
+        supabase = SupabaseSettings(
+            url=_prepare_supabase_url(os.getenv("SUPABASE_URL")),
+            service_role_key=_prepare_supabase_key(os.getenv("SUPABASE_SERVICE_ROLE_KEY")),
+        )
+
+    metrics = _load_metrics_settings()
+    logging_settings = _load_logging_settings()
+    retention = _load_retention_settings()
+    deletion = _load_deletion_settings()
+    retry = _load_retry_settings()
+    dispatch = _load_dispatch_settings()
+    admission = _load_admission_settings()
+    edit = _load_edit_settings()
+    idempotency = _load_idempotency_settings()
+    transcode = _load_transcode_settings()
+    attachment_fanout = _load_attachment_fanout_settings()
+    discord_settings = _load_discord_settings(token)
+    cluster = _load_cluster_settings(discord_settings, storage)
 
     LOGGER.info("bridge_base 設定の読み込みが完了しました。")
 
     return AppConfig(
-        discord=DiscordSettings(token=token),
+        discord=discord_settings,
         bridge_routes_env=bridge_routes_env,
         supabase=supabase,
+        storage=storage,
+        metrics=metrics,
+        logging=logging_settings,
+        retention=retention,
+        deletion=deletion,
+        retry=retry,
+        dispatch=dispatch,
+        admission=admission,
+        edit=edit,
+        cluster=cluster,
+        idempotency=idempotency,
+        transcode=transcode,
+        attachment_fanout=attachment_fanout,
+    )
+
+
+def _load_discord_settings(token: str) -> DiscordSettings:
+    sharding = _read_bool_env("DISCORD_SHARDING_ENABLED", default=False)
+    shard_count = _read_int_env("DISCORD_SHARD_COUNT", default=0, minimum=0)
+    if shard_count and not sharding:
+        LOGGER.warning("DISCORD_SHARD_COUNT は DISCORD_SHARDING_ENABLED=true のときのみ有効です。")
+    return DiscordSettings(
+        token=token,
+        sharding=sharding,
+        shard_count=shard_count or None,
     )
 
 
@@ -88,19 +280,372 @@ def _load_bridge_env_settings() -> BridgeRouteEnvSettings:
     require_reciprocal = _read_bool_env("BRIDGE_ROUTES_REQUIRE_RECIPROCAL", default=False)
     strict = _read_bool_env("BRIDGE_ROUTES_STRICT", default=False)
     routes_json = os.getenv("BRIDGE_ROUTES")
-
-    if enabled and (routes_json is None or routes_json.strip() == ""):
-        raise ValueError("BRIDGE_ROUTES_ENABLED=true ですが BRIDGE_ROUTES が未設定です。")
+    routes_file = (os.getenv("BRIDGE_ROUTES_FILE") or "").strip() or None
 
     if routes_json is not None and routes_json.strip() == "":
         routes_json = None
 
+    if enabled and routes_json is None and routes_file is None:
+        raise ValueError(
+            "BRIDGE_ROUTES_ENABLED=true ですが BRIDGE_ROUTES と BRIDGE_ROUTES_FILE が未設定です。"
+        )
+    if routes_json is not None and routes_file is not None:
+        raise ValueError("BRIDGE_ROUTES と BRIDGE_ROUTES_FILE はどちらか一方のみ設定してください。")
+
     return BridgeRouteEnvSettings(
         enabled=enabled,
         routes_json=routes_json,
         require_reciprocal=require_reciprocal,
         strict=strict,
+        routes_file=routes_file,
+    )
+
+
+def _load_storage_settings() -> StorageSettings:
+    defaults = StorageSettings()
+    backend = (os.getenv("BRIDGE_STORAGE_BACKEND") or defaults.backend).strip().lower()
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(
+            f"BRIDGE_STORAGE_BACKEND={backend} は未対応です。"
+            f"{', '.join(STORAGE_BACKENDS)} のいずれかを指定してください。"
+        )
+    raw_path = (os.getenv("BRIDGE_SQLITE_PATH") or "").strip()
+    postgres_dsn = (os.getenv("BRIDGE_POSTGRES_DSN") or "").strip() or None
+    if backend == "postgres" and postgres_dsn is None:
+        raise ValueError("BRIDGE_STORAGE_BACKEND=postgres ですが BRIDGE_POSTGRES_DSN が未設定です。")
+    pool_min_size = _read_int_env(
+        "BRIDGE_POSTGRES_POOL_MIN_SIZE",
+        default=defaults.postgres_pool_min_size,
+        minimum=0,
+    )
+    pool_max_size = _read_int_env(
+        "BRIDGE_POSTGRES_POOL_MAX_SIZE",
+        default=defaults.postgres_pool_max_size,
+        minimum=1,
+    )
+    if pool_max_size < pool_min_size:
+        LOGGER.warning(
+            "BRIDGE_POSTGRES_POOL_MAX_SIZE (%s) が最小サイズ (%s) を下回るため最小サイズに揃えます。",
+            pool_max_size,
+            pool_min_size,
+        )
+        pool_max_size = max(pool_min_size, 1)
+    return StorageSettings(
+        backend=backend,
+        sqlite_path=Path(raw_path) if raw_path else defaults.sqlite_path,
+        postgres_dsn=postgres_dsn,
+        postgres_pool_min_size=pool_min_size,
+        postgres_pool_max_size=pool_max_size,
+    )
+
+
+def _load_metrics_settings() -> MetricsSettings:
+    defaults = MetricsSettings()
+    host = (os.getenv("BRIDGE_METRICS_HOST") or "").strip() or defaults.host
+    return MetricsSettings(
+        enabled=_read_bool_env("BRIDGE_METRICS_ENABLED", default=defaults.enabled),
+        host=host,
+        port=_read_int_env("BRIDGE_METRICS_PORT", default=defaults.port, minimum=0),
+    )
+
+
+def _load_retention_settings() -> RetentionSettings:
+    defaults = RetentionSettings()
+    return RetentionSettings(
+        enabled=_read_bool_env("BRIDGE_RETENTION_ENABLED", default=defaults.enabled),
+        max_age_hours=_read_float_env(
+            "BRIDGE_RETENTION_HOURS",
+            default=defaults.max_age_hours,
+            minimum=0.0,
+        ),
+        interval_seconds=_read_float_env(
+            "BRIDGE_RETENTION_INTERVAL_SECONDS",
+            default=defaults.interval_seconds,
+            minimum=1.0,
+        ),
+        batch_size=_read_int_env(
+            "BRIDGE_RETENTION_BATCH_SIZE",
+            default=defaults.batch_size,
+            minimum=1,
+        ),
+    )
+
+
+def _load_deletion_settings() -> DeletionSettings:
+    defaults = DeletionSettings()
+    return DeletionSettings(
+        propagate_to_mirrors=_read_bool_env(
+            "BRIDGE_DELETE_PROPAGATION",
+            default=defaults.propagate_to_mirrors,
+        ),
+        batch_window_seconds=_read_float_env(
+            "BRIDGE_DELETE_BATCH_WINDOW_SECONDS",
+            default=defaults.batch_window_seconds,
+            minimum=0.0,
+        ),
+    )
+
+
+def _load_edit_settings() -> EditSettings:
+    defaults = EditSettings()
+    return EditSettings(
+        debounce_seconds=_read_float_env(
+            "BRIDGE_EDIT_DEBOUNCE_SECONDS",
+            default=defaults.debounce_seconds,
+            minimum=0.0,
+        ),
+    )
+
+
+def _load_idempotency_settings() -> IdempotencySettings:
+    defaults = IdempotencySettings()
+    return IdempotencySettings(
+        enabled=_read_bool_env("BRIDGE_IDEMPOTENCY_ENABLED", default=defaults.enabled),
+        cache_size=_read_int_env(
+            "BRIDGE_IDEMPOTENCY_CACHE_SIZE",
+            default=defaults.cache_size,
+            minimum=1,
+        ),
+    )
+
+
+def _load_transcode_settings() -> TranscodeSettings:
+    defaults = TranscodeSettings()
+    return TranscodeSettings(
+        enabled=_read_bool_env("BRIDGE_TRANSCODE_ENABLED", default=defaults.enabled),
+        workers=_read_int_env("BRIDGE_TRANSCODE_WORKERS", default=defaults.workers, minimum=1),
+        max_dimension=_read_int_env(
+            "BRIDGE_TRANSCODE_MAX_DIMENSION",
+            default=defaults.max_dimension,
+            minimum=160,
+        ),
+        quality=_read_int_env("BRIDGE_TRANSCODE_QUALITY", default=defaults.quality, minimum=40),
+        max_source_mb=_read_int_env(
+            "BRIDGE_TRANSCODE_MAX_SOURCE_MB",
+            default=defaults.max_source_mb,
+            minimum=1,
+        ),
+        cache_size=_read_int_env("BRIDGE_TRANSCODE_CACHE_SIZE", default=defaults.cache_size, minimum=1),
+    )
+
+
+ATTACHMENT_FANOUT_MODES = ("each", "once", "relay")
+
+
+def _load_attachment_fanout_settings() -> AttachmentFanoutSettings:
+    defaults = AttachmentFanoutSettings()
+    mode = (os.getenv("BRIDGE_ATTACHMENT_FANOUT") or defaults.mode).strip().lower()
+    if mode not in ATTACHMENT_FANOUT_MODES:
+        LOGGER.warning(
+            "BRIDGE_ATTACHMENT_FANOUT=%s は未対応のため %s を使用します。",
+            mode,
+            defaults.mode,
+        )
+        mode = defaults.mode
+    relay_channel_id = _read_int_env("BRIDGE_ATTACHMENT_RELAY_CHANNEL_ID", default=0, minimum=0) or None
+    if mode == "relay" and relay_channel_id is None:
+        raise ValueError("BRIDGE_ATTACHMENT_FANOUT=relay には BRIDGE_ATTACHMENT_RELAY_CHANNEL_ID の設定が必要です。")
+    return AttachmentFanoutSettings(mode=mode, relay_channel_id=relay_channel_id)
+
+
+def _load_retry_settings() -> OutboundRetrySettings:
+    defaults = OutboundRetrySettings()
+    raw_path = (os.getenv("BRIDGE_RETRY_JOURNAL_PATH") or "").strip()
+    return OutboundRetrySettings(
+        enabled=_read_bool_env("BRIDGE_RETRY_ENABLED", default=defaults.enabled),
+        journal_path=Path(raw_path) if raw_path else defaults.journal_path,
+        base_delay_seconds=_read_float_env(
+            "BRIDGE_RETRY_BASE_DELAY_SECONDS",
+            default=defaults.base_delay_seconds,
+            minimum=0.1,
+        ),
+        max_delay_seconds=_read_float_env(
+            "BRIDGE_RETRY_MAX_DELAY_SECONDS",
+            default=defaults.max_delay_seconds,
+            minimum=0.1,
+        ),
+        max_attempts=_read_int_env(
+            "BRIDGE_RETRY_MAX_ATTEMPTS",
+            default=defaults.max_attempts,
+            minimum=1,
+        ),
+        fsync_interval_seconds=_read_float_env(
+            "BRIDGE_RETRY_FSYNC_INTERVAL_SECONDS",
+            default=defaults.fsync_interval_seconds,
+            minimum=0.01,
+        ),
+        drain_timeout_seconds=_read_float_env(
+            "BRIDGE_RETRY_DRAIN_TIMEOUT_SECONDS",
+            default=defaults.drain_timeout_seconds,
+            minimum=0.0,
+        ),
+    )
+
+
+DISPATCH_OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+
+def _load_dispatch_settings() -> DispatchSettings:
+    defaults = DispatchSettings()
+    overflow = (os.getenv("BRIDGE_DISPATCH_OVERFLOW") or defaults.overflow).strip().lower()
+    if overflow not in DISPATCH_OVERFLOW_POLICIES:
+        LOGGER.warning(
+            "BRIDGE_DISPATCH_OVERFLOW=%s は未対応のため %s を使用します。",
+            overflow,
+            defaults.overflow,
+        )
+        overflow = defaults.overflow
+    return DispatchSettings(
+        enabled=_read_bool_env("BRIDGE_DISPATCH_ENABLED", default=defaults.enabled),
+        shards=_read_int_env("BRIDGE_DISPATCH_SHARDS", default=defaults.shards, minimum=1),
+        queue_size=_read_int_env(
+            "BRIDGE_DISPATCH_QUEUE_SIZE",
+            default=defaults.queue_size,
+            minimum=1,
+        ),
+        overflow=overflow,
+    )
+
+
+ADMISSION_POLICIES = ("shed", "summarize")
+
+
+def _load_admission_settings() -> AdmissionSettings:
+    defaults = AdmissionSettings()
+    policy = (os.getenv("BRIDGE_ADMISSION_POLICY") or defaults.policy).strip().lower()
+    if policy not in ADMISSION_POLICIES:
+        LOGGER.warning(
+            "BRIDGE_ADMISSION_POLICY=%s は未対応のため %s を使用します。",
+            policy,
+            defaults.policy,
+        )
+        policy = defaults.policy
+    return AdmissionSettings(
+        enabled=_read_bool_env("BRIDGE_ADMISSION_ENABLED", default=defaults.enabled),
+        guild_rate=_read_float_env(
+            "BRIDGE_ADMISSION_GUILD_RATE",
+            default=defaults.guild_rate,
+            minimum=0.01,
+        ),
+        guild_burst=_read_float_env(
+            "BRIDGE_ADMISSION_GUILD_BURST",
+            default=defaults.guild_burst,
+            minimum=1.0,
+        ),
+        channel_rate=_read_float_env(
+            "BRIDGE_ADMISSION_CHANNEL_RATE",
+            default=defaults.channel_rate,
+            minimum=0.01,
+        ),
+        channel_burst=_read_float_env(
+            "BRIDGE_ADMISSION_CHANNEL_BURST",
+            default=defaults.channel_burst,
+            minimum=1.0,
+        ),
+        policy=policy,
+    )
+
+
+CLUSTER_SCOPES = ("channel", "shard")
+
+
+def _load_cluster_settings(discord: DiscordSettings, storage: StorageSettings) -> ClusterSettings:
+    defaults = ClusterSettings()
+    enabled = _read_bool_env("BRIDGE_CLUSTER_ENABLED", default=defaults.enabled)
+    scope = (os.getenv("BRIDGE_CLUSTER_SCOPE") or defaults.scope).strip().lower()
+    if scope not in CLUSTER_SCOPES:
+        LOGGER.warning(
+            "BRIDGE_CLUSTER_SCOPE=%s は未対応のため %s を使用します。",
+            scope,
+            defaults.scope,
+        )
+        scope = defaults.scope
+    renew_interval = _read_float_env(
+        "BRIDGE_CLUSTER_RENEW_INTERVAL_SECONDS",
+        default=defaults.renew_interval,
+        minimum=1.0,
     )
+    lease_ttl = _read_float_env(
+        "BRIDGE_CLUSTER_LEASE_TTL_SECONDS",
+        default=defaults.lease_ttl,
+        minimum=1.0,
+    )
+    nodes = _read_int_env("BRIDGE_CLUSTER_NODES", default=0, minimum=0)
+    settings = ClusterSettings(
+        enabled=enabled,
+        scope=scope,
+        node_id=(os.getenv("BRIDGE_CLUSTER_NODE_ID") or "").strip() or None,
+        lease_ttl=lease_ttl,
+        renew_interval=renew_interval,
+        nodes=nodes or None,
+    )
+    if not enabled:
+        return settings
+    if storage.backend == "memory":
+        raise ValueError(
+            "BRIDGE_CLUSTER_ENABLED=true ではプロセス間で共有できるストア "
+            "(sqlite / supabase / postgres) が必要です。"
+        )
+    if lease_ttl <= renew_interval:
+        raise ValueError(
+            "BRIDGE_CLUSTER_LEASE_TTL_SECONDS は BRIDGE_CLUSTER_RENEW_INTERVAL_SECONDS より長くしてください。"
+        )
+    if scope == "shard" and not (discord.sharding and discord.shard_count and settings.nodes):
+        raise ValueError(
+            "BRIDGE_CLUSTER_SCOPE=shard には DISCORD_SHARDING_ENABLED=true、"
+            "DISCORD_SHARD_COUNT と BRIDGE_CLUSTER_NODES の設定が必要です。"
+        )
+    return settings
+
+
+LOG_FORMATS = ("text", "json")
+
+
+def _load_logging_settings() -> LoggingSettings:
+    defaults = LoggingSettings()
+    log_format = (os.getenv("BRIDGE_LOG_FORMAT") or defaults.format).strip().lower()
+    if log_format not in LOG_FORMATS:
+        LOGGER.warning(
+            "BRIDGE_LOG_FORMAT=%s は未対応のため %s を使用します。",
+            log_format,
+            defaults.format,
+        )
+        log_format = defaults.format
+    level = (os.getenv("BRIDGE_LOG_LEVEL") or defaults.level).strip().upper()
+    if not isinstance(logging.getLevelName(level), int):
+        LOGGER.warning("BRIDGE_LOG_LEVEL=%s は未対応のため %s を使用します。", level, defaults.level)
+        level = defaults.level
+    return LoggingSettings(
+        format=log_format,
+        level=level,
+        sample_rates=_parse_sample_rates(os.getenv("BRIDGE_LOG_SAMPLE_RATES")),
+        warning_interval=_read_float_env(
+            "BRIDGE_LOG_WARNING_INTERVAL",
+            default=defaults.warning_interval,
+            minimum=0.0,
+        ),
+        queue_enabled=_read_bool_env("BRIDGE_LOG_QUEUE", default=defaults.queue_enabled),
+    )
+
+
+def _parse_sample_rates(raw: str | None) -> dict[str, float]:
+    rates: dict[str, float] = {}
+    if raw is None:
+        return rates
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        event, separator, value = item.partition("=")
+        try:
+            if not separator or not event.strip():
+                raise ValueError(item)
+            rate = float(value)
+        except ValueError:
+            LOGGER.warning("BRIDGE_LOG_SAMPLE_RATES の要素 '%s' を解釈できないため無視します。", item)
+            continue
+        rates[event.strip()] = min(max(rate, 0.0), 1.0)
+    return rates
 
 
 def _read_bool_env(name: str, *, default: bool) -> bool:
@@ -121,6 +666,58 @@ def _read_bool_env(name: str, *, default: bool) -> bool:
     return default
 
 
+def _read_int_env(name: str, *, default: int, minimum: int | None = None) -> int:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = int(raw.strip())
+    except ValueError:
+        LOGGER.warning(
+            "環境変数 %s の値 '%s' は整数として解釈できません。既定値 %s を使用します。",
+            name,
+            raw,
+            default,
+        )
+        return default
+    if minimum is not None and value < minimum:
+        LOGGER.warning(
+            "環境変数 %s の値 %s は %s 未満のため既定値 %s を使用します。",
+            name,
+            value,
+            minimum,
+            default,
+        )
+        return default
+    return value
+
+
+def _read_float_env(name: str, *, default: float, minimum: float | None = None) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = float(raw.strip())
+    except ValueError:
+        LOGGER.warning(
+            "環境変数 %s の値 '%s' は数値として解釈できません。既定値 %s を使用します。",
+            name,
+            raw,
+            default,
+        )
+        return default
+    if minimum is not None and value < minimum:
+        LOGGER.warning(
+            "環境変数 %s の値 %s は %s 未満のため既定値 %s を使用します。",
+            name,
+            value,
+            minimum,
+            default,
+        )
+        return default
+    return value
+
+
 def _prepare_supabase_url(raw: str | None) -> str:
     if raw is None or raw.strip() == "":
         raise ValueError("SUPABASE_URL is not set in environment variables.")
@@ -134,9 +731,22 @@ def _prepare_supabase_key(raw: str | None) -> str:
 
 
 __all__ = [
+    "AdmissionSettings",
     "AppConfig",
+    "AttachmentFanoutSettings",
     "BridgeRouteEnvSettings",
+    "ClusterSettings",
+    "DeletionSettings",
     "DiscordSettings",
+    "DispatchSettings",
+    "EditSettings",
+    "IdempotencySettings",
+    "LoggingSettings",
+    "MetricsSettings",
+    "OutboundRetrySettings",
+    "RetentionSettings",
+    "StorageSettings",
     "SupabaseSettings",
+    "TranscodeSettings",
     "load_config",
 ]
@@ -1,89 +1,301 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import timedelta
 
 from app.config import AppConfig
-from app.db import create_supabase_client
-from bot import BridgeBotClient, register_bridge_commands
+from app.db import create_storage_backend
+from bot import BridgeBotClient, ShardedBridgeBotClient, register_bridge_commands
 from bot.bridge import (
+    AdmissionController,
+    BridgeEventDispatcher,
     BridgeMessageStore,
+    BridgeMetrics,
     BridgeProfileStore,
+    BridgeRetentionTask,
     ChannelBridgeManager,
     ChannelRoute,
+    LeaseCoordinator,
+    MediaTranscoder,
+    MetricsServer,
+    OutboundJournal,
+    OutboundRetryQueue,
     load_channel_routes,
 )
+from bot.bridge.cluster import channel_resource, shard_resource
+from bot.bridge.storage import BridgeStorageBackend
 
 
 LOGGER = logging.getLogger(__name__)
 
+#: 起動ログに個別に表示するルートの最大件数。
+ROUTE_LOG_PREVIEW = 20
+
+
 @dataclass(slots=True)
 class BridgeApplication:
     """BridgeBotClient とトークンを保持し、実行処理を提供する。"""
 
-    client: BridgeBotClient
+    client: BridgeBotClient | ShardedBridgeBotClient
     token: str
+    metrics_server: MetricsServer | None = None
+    storage: BridgeStorageBackend | None = None
+    retention: BridgeRetentionTask | None = None
+    #: ストア呼び出しを実行するワーカースレッド数。None なら asyncio の既定値。
+    store_workers: int | None = None
 
     async def run(self) -> None:
-        async with self.client:
-            await self.client.start(self.token)
+        if self.store_workers is not None:
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=self.store_workers, thread_name_prefix="bridge-store")
+            )
+        if self.metrics_server is not None:
+            await self.metrics_server.start()
+        if self.retention is not None:
+            await self.retention.start()
+        try:
+            async with self.client:
+                await self.client.start(self.token)
+        finally:
+            if self.retention is not None:
+                await self.retention.close()
+            if self.metrics_server is not None:
+                await self.metrics_server.close()
+            if self.storage is not None:
+                self.storage.close()
 
 
 @dataclass(slots=True)
 class _BridgeDependencies:
+    storage: BridgeStorageBackend
     profile_store: BridgeProfileStore
     message_store: BridgeMessageStore
     routes: list[ChannelRoute]
 
 
 def _load_bridge_dependencies(config: AppConfig) -> _BridgeDependencies:
-    supabase = create_supabase_client(
-        config.supabase.url,
-        config.supabase.service_role_key,
-    )
-    profile_store = BridgeProfileStore(supabase)
-    message_store = BridgeMessageStore(supabase)
+    storage = create_storage_backend(config)
+    profile_store = BridgeProfileStore(storage)
+    message_store = BridgeMessageStore(storage, omitted_columns=_probe_message_columns(storage))
     routes = list(
         load_channel_routes(
             env_enabled=config.bridge_routes_env.enabled,
             env_payload=config.bridge_routes_env.routes_json,
+            routes_file=config.bridge_routes_env.routes_file,
             require_reciprocal=config.bridge_routes_env.require_reciprocal,
             strict=config.bridge_routes_env.strict,
         )
     )
     _log_loaded_routes(routes)
     return _BridgeDependencies(
+        storage=storage,
         profile_store=profile_store,
         message_store=message_store,
         routes=routes,
     )
 
 
+def _probe_message_columns(storage: BridgeStorageBackend) -> list[str]:
+    """起動時に 1 度だけ bridge_messages の未移行の列を調べ、書き込みから省く列を返す。"""
+    try:
+        missing = list(storage.missing_message_columns())
+    except Exception as exc:  # pragma: no cover - 接続失敗は起動前診断で報告済み
+        LOGGER.warning("bridge_messages の列を確認できませんでした: %s", exc)
+        return []
+    if missing:
+        LOGGER.warning(
+            "bridge_messages に列 %s がないため、これらの列を書き込まずにメッセージ記録を保存します。",
+            ", ".join(missing),
+        )
+    return missing
+
+
+async def _build_lease_coordinator(
+    config: AppConfig,
+    dependencies: _BridgeDependencies,
+    metrics: BridgeMetrics,
+) -> LeaseCoordinator | None:
+    settings = config.cluster
+    if not settings.enabled:
+        return None
+    owner_id = settings.node_id or f"{socket.gethostname()}:{os.getpid()}"
+    if settings.scope == "shard":
+        shard_count = int(config.discord.shard_count or 1)
+        coordinator = LeaseCoordinator(
+            dependencies.storage,
+            owner_id=owner_id,
+            scope="shard",
+            resources=[shard_resource(shard_id) for shard_id in range(shard_count)],
+            ttl=settings.lease_ttl,
+            renew_interval=settings.renew_interval,
+            max_owned=-(-shard_count // int(settings.nodes or 1)),
+            shard_count=shard_count,
+            metrics=metrics,
+        )
+        # ゲートウェイ接続はシャードを指定して開くため、起動時に担当を確定させる。
+        await asyncio.to_thread(coordinator.rebalance)
+        if not coordinator.owned:
+            raise RuntimeError("空いているシャードがありません。BRIDGE_CLUSTER_NODES を確認してください。")
+        coordinator.pin()
+    else:
+        channels = {
+            channel
+            for route in dependencies.routes
+            for channel in (route.src.channel, route.dst.channel)
+        }
+        coordinator = LeaseCoordinator(
+            dependencies.storage,
+            owner_id=owner_id,
+            scope="channel",
+            resources=[channel_resource(channel) for channel in sorted(channels)],
+            ttl=settings.lease_ttl,
+            renew_interval=settings.renew_interval,
+            metrics=metrics,
+        )
+    LOGGER.info("複数プロセス構成で起動します: node=%s scope=%s", owner_id, settings.scope)
+    return coordinator
+
+
 async def build_bridge_app(config: AppConfig) -> BridgeApplication:
     bridge_dependencies = _load_bridge_dependencies(config)
 
-    client = BridgeBotClient()
-    client.bridge_manager = ChannelBridgeManager(
+    metrics = BridgeMetrics()
+
+    retry_queue = None
+    if config.retry.enabled:
+        retry_queue = OutboundRetryQueue(
+            OutboundJournal(config.retry.journal_path),
+            base_delay=config.retry.base_delay_seconds,
+            max_delay=config.retry.max_delay_seconds,
+            max_attempts=config.retry.max_attempts,
+            fsync_interval=config.retry.fsync_interval_seconds,
+            metrics=metrics,
+        )
+
+    admission = None
+    if config.admission.enabled:
+        admission = AdmissionController(
+            guild_rate=config.admission.guild_rate,
+            guild_burst=config.admission.guild_burst,
+            channel_rate=config.admission.channel_rate,
+            channel_burst=config.admission.channel_burst,
+            policy=config.admission.policy,
+            metrics=metrics,
+        )
+
+    dispatcher = None
+    if config.dispatch.enabled:
+        dispatcher = BridgeEventDispatcher(
+            shards=config.dispatch.shards,
+            queue_size=config.dispatch.queue_size,
+            overflow=config.dispatch.overflow,
+            metrics=metrics,
+        )
+
+    transcoder = None
+    if config.transcode.enabled:
+        transcoder = MediaTranscoder(
+            workers=config.transcode.workers,
+            max_dimension=config.transcode.max_dimension,
+            quality=config.transcode.quality,
+            max_source_bytes=config.transcode.max_source_mb * 1024 * 1024,
+            cache_size=config.transcode.cache_size,
+            metrics=metrics,
+        )
+
+    ownership = await _build_lease_coordinator(config, bridge_dependencies, metrics)
+
+    client: BridgeBotClient | ShardedBridgeBotClient
+    if config.discord.sharding:
+        shard_ids = None
+        if ownership is not None and ownership.scope == "shard":
+            shard_ids = ownership.owned_shard_ids()
+        client = ShardedBridgeBotClient(
+            dispatcher=dispatcher,
+            ownership=ownership,
+            shutdown_timeout=config.retry.drain_timeout_seconds,
+            shard_count=config.discord.shard_count,
+            shard_ids=shard_ids,
+        )
+    else:
+        client = BridgeBotClient(
+            dispatcher=dispatcher,
+            ownership=ownership,
+            shutdown_timeout=config.retry.drain_timeout_seconds,
+        )
+    manager = ChannelBridgeManager(
         client=client,
         profile_store=bridge_dependencies.profile_store,
         message_store=bridge_dependencies.message_store,
         routes=bridge_dependencies.routes,
+        metrics=metrics,
+        propagate_deletes=config.deletion.propagate_to_mirrors,
+        delete_batch_window=config.deletion.batch_window_seconds,
+        retry_queue=retry_queue,
+        admission=admission,
+        edit_debounce=config.edit.debounce_seconds,
+        shared_links=ownership is not None,
+        delivery_claims=config.idempotency.enabled,
+        seen_cache_size=config.idempotency.cache_size,
+        transcoder=transcoder,
+        attachment_fanout=config.attachment_fanout.mode,
+        relay_channel_id=config.attachment_fanout.relay_channel_id,
     )
+    client.bridge_manager = manager
     await register_bridge_commands(client)
-    LOGGER.info("BridgeBotClient の初期化とコマンド登録が完了しました。")
+    LOGGER.info("%s の初期化とコマンド登録が完了しました。", type(client).__name__)
+
+    metrics_server = None
+    if config.metrics.enabled:
+        metrics_server = MetricsServer(
+            metrics,
+            host=config.metrics.host,
+            port=config.metrics.port,
+        )
+
+    retention = None
+    if config.retention.enabled:
+        retention = BridgeRetentionTask(
+            bridge_dependencies.message_store,
+            retention=timedelta(hours=config.retention.max_age_hours),
+            interval=config.retention.interval_seconds,
+            batch_size=config.retention.batch_size,
+            evict_links=manager.evict_links_before,
+            metrics=metrics,
+        )
 
     return BridgeApplication(
         client=client,
         token=config.discord.token,
+        metrics_server=metrics_server,
+        storage=bridge_dependencies.storage,
+        retention=retention,
+        store_workers=_store_workers(config),
     )
 
 
+def _store_workers(config: AppConfig) -> int | None:
+    """PostgreSQL の接続プールを使い切れるだけのワーカースレッド数を返す。"""
+    if config.storage.backend != "postgres":
+        return None
+    # ストア以外のブロッキング処理 (ジャーナルの fsync など) の分も残しておく。
+    return config.storage.postgres_pool_max_size + 4
+
+
 def _log_loaded_routes(routes: list[ChannelRoute]) -> None:
     if not routes:
         LOGGER.info("起動時に読み込まれたブリッジ設定はありません。")
         return
 
-    description = ", ".join(_describe_route(route) for route in routes)
+    # ルート数が多い構成では全件を 1 行に並べず、先頭の数件と件数だけを出力する。
+    description = ", ".join(_describe_route(route) for route in routes[:ROUTE_LOG_PREVIEW])
+    if len(routes) > ROUTE_LOG_PREVIEW:
+        description += f" ほか {len(routes) - ROUTE_LOG_PREVIEW} 件"
     LOGGER.info(
         "起動時に %s 件のブリッジ設定を読み込みました: %s",
         len(routes),
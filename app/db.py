@@ -4,6 +4,15 @@ import logging
 
 from supabase import Client, create_client
 
+from app.config import AppConfig
+from bot.bridge.storage import (
+    BridgeStorageBackend,
+    InMemoryStorageBackend,
+    PostgresStorageBackend,
+    SqliteStorageBackend,
+    SupabaseStorageBackend,
+)
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -13,4 +22,35 @@ def create_supabase_client(url: str, service_role_key: str) -> Client:
     return create_client(url, service_role_key)
 
 
-__all__ = ["create_supabase_client"]
+def create_storage_backend(config: AppConfig) -> BridgeStorageBackend:
+    """Build the storage backend selected by ``BRIDGE_STORAGE_BACKEND``."""
+    backend = config.storage.backend
+    if backend == "memory":
+        LOGGER.info("Storage backend: in-memory (data is not persisted)")
+        return InMemoryStorageBackend()
+    if backend == "sqlite":
+        LOGGER.info("Storage backend: SQLite (%s)", config.storage.sqlite_path)
+        return SqliteStorageBackend(config.storage.sqlite_path)
+    if backend == "postgres":
+        if config.storage.postgres_dsn is None:
+            raise ValueError("PostgreSQL backend requires BRIDGE_POSTGRES_DSN.")
+        LOGGER.info(
+            "Storage backend: PostgreSQL (pool %s-%s)",
+            config.storage.postgres_pool_min_size,
+            config.storage.postgres_pool_max_size,
+        )
+        return PostgresStorageBackend(
+            config.storage.postgres_dsn,
+            min_size=config.storage.postgres_pool_min_size,
+            max_size=config.storage.postgres_pool_max_size,
+        )
+    if backend == "supabase":
+        if config.supabase is None:
+            raise ValueError("Supabase backend requires SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY.")
+        return SupabaseStorageBackend(
+            create_supabase_client(config.supabase.url, config.supabase.service_role_key)
+        )
+    raise ValueError(f"Unsupported storage backend: {backend}")
+
+
+__all__ = ["create_storage_backend", "create_supabase_client"]
@@ -6,16 +6,24 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import Callable, Sequence
 
-from supabase import Client
-
 from app.config import AppConfig
-from app.db import create_supabase_client
+from app.db import create_storage_backend
 from bot.bridge.routes import ChannelRoute, load_channel_routes
+from bot.bridge.storage import BridgeStorageBackend
+from bot.bridge.storage.base import MESSAGE_COLUMN_MIGRATIONS, MESSAGES_TABLE
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+_STORAGE_LABELS = {
+    "supabase": "Supabase",
+    "postgres": "PostgreSQL",
+    "sqlite": "SQLite",
+    "memory": "インメモリストア",
+}
+
+
 class DiagnosticStatus(Enum):
     OK = auto()
     WARNING = auto()
@@ -29,11 +37,16 @@ class DiagnosticResult:
     detail: str
 
 
-DatabaseProbe = Callable[[Client], None]
+DatabaseProbe = Callable[[BridgeStorageBackend], None]
+SchemaProbe = Callable[[BridgeStorageBackend], Sequence[str]]
+
 
+def _default_database_probe(backend: BridgeStorageBackend) -> None:
+    backend.probe()
 
-def _default_database_probe(client: Client) -> None:
-    client.table("bridge_profiles").select("id").limit(1).execute()
+
+def _default_schema_probe(backend: BridgeStorageBackend) -> Sequence[str]:
+    return backend.missing_message_columns()
 
 
 class StartupDiagnostics:
@@ -45,20 +58,19 @@ class StartupDiagnostics:
         config: AppConfig,
         data_dir: Path | None = None,
         database_probe: DatabaseProbe | None = None,
+        schema_probe: SchemaProbe | None = None,
     ) -> None:
         self._config = config
         base_dir = Path(__file__).resolve().parent.parent
         self._data_dir = Path(data_dir) if data_dir is not None else base_dir / "data"
         self._database_probe = database_probe or _default_database_probe
-        self._supabase = create_supabase_client(
-            self._config.supabase.url,
-            self._config.supabase.service_role_key,
-        )
+        self._schema_probe = schema_probe or _default_schema_probe
 
     def run(self) -> list[DiagnosticResult]:
         results = [
             self._check_discord_token(),
             self._check_database_connectivity(),
+            self._check_message_schema(),
             self._check_data_directory(),
             self._check_bridge_routes(),
         ]
@@ -74,19 +86,59 @@ class StartupDiagnostics:
         )
 
     def _check_database_connectivity(self) -> DiagnosticResult:
+        label = _STORAGE_LABELS.get(self._config.storage.backend, self._config.storage.backend)
+        name = f"{label} 接続"
+        backend: BridgeStorageBackend | None = None
         try:
-            self._database_probe(self._supabase)
+            backend = create_storage_backend(self._config)
+            self._database_probe(backend)
         except Exception as exc:  # pragma: no cover - 実際の接続失敗を記録
             return DiagnosticResult(
-                name="Supabase 接続",
+                name=name,
                 status=DiagnosticStatus.ERROR,
-                detail=f"Supabase への接続に失敗しました: {exc}",
+                detail=f"{label} への接続に失敗しました: {exc}",
+            )
+        finally:
+            if backend is not None:
+                backend.close()
+
+        return DiagnosticResult(
+            name=name,
+            status=DiagnosticStatus.OK,
+            detail=f"{label} への接続確認に成功しました。",
+        )
+
+    def _check_message_schema(self) -> DiagnosticResult:
+        name = f"{MESSAGES_TABLE} スキーマ"
+        backend: BridgeStorageBackend | None = None
+        try:
+            backend = create_storage_backend(self._config)
+            missing = list(self._schema_probe(backend))
+        except Exception as exc:  # pragma: no cover - 接続失敗は接続チェック側で報告
+            return DiagnosticResult(
+                name=name,
+                status=DiagnosticStatus.WARNING,
+                detail=f"{MESSAGES_TABLE} の列を確認できませんでした: {exc}",
             )
+        finally:
+            if backend is not None:
+                backend.close()
 
+        if missing:
+            statements = " ".join(MESSAGE_COLUMN_MIGRATIONS[column] for column in missing)
+            return DiagnosticResult(
+                name=name,
+                status=DiagnosticStatus.WARNING,
+                detail=(
+                    f"{MESSAGES_TABLE} に列 {', '.join(missing)} がありません。"
+                    "メッセージ記録はこれらの列を省いて保存しますが、列を使う機能は無効になります。"
+                    f"次を実行してください: {statements}"
+                ),
+            )
         return DiagnosticResult(
-            name="Supabase 接続",
+            name=name,
             status=DiagnosticStatus.OK,
-            detail="Supabase への接続確認に成功しました。",
+            detail=f"{MESSAGES_TABLE} に必要な列がそろっています。",
         )
 
     def _check_data_directory(self) -> DiagnosticResult:
@@ -117,32 +169,34 @@ class StartupDiagnostics:
                 detail="BRIDGE_ROUTES_ENABLED=false のためルート同期は無効化されています。",
             )
 
-        if settings.routes_json is None:
+        if settings.routes_json is None and settings.routes_file is None:
             return DiagnosticResult(
                 name="ブリッジルート",
                 status=DiagnosticStatus.ERROR,
-                detail="BRIDGE_ROUTES_ENABLED=true ですが BRIDGE_ROUTES が未設定です。",
+                detail="BRIDGE_ROUTES_ENABLED=true ですが BRIDGE_ROUTES と BRIDGE_ROUTES_FILE が未設定です。",
             )
 
+        source = "環境変数 BRIDGE_ROUTES" if settings.routes_file is None else f"ファイル {settings.routes_file}"
         try:
-            routes = self._load_routes_from_env(settings.routes_json)
+            routes = self._load_routes(settings.routes_json, settings.routes_file)
         except Exception as exc:
             return DiagnosticResult(
                 name="ブリッジルート",
                 status=DiagnosticStatus.ERROR,
-                detail=f"環境変数 BRIDGE_ROUTES の検証に失敗しました: {exc}",
+                detail=f"{source} の検証に失敗しました: {exc}",
             )
 
         return DiagnosticResult(
             name="ブリッジルート",
             status=DiagnosticStatus.OK,
-            detail=f"環境変数から {len(routes)} 件のルート設定を読み込みます。",
+            detail=f"{source} から {len(routes)} 件のルート設定を読み込みます。",
         )
 
-    def _load_routes_from_env(self, payload: str) -> Sequence[ChannelRoute]:
+    def _load_routes(self, payload: str | None, routes_file: str | None) -> Sequence[ChannelRoute]:
         return load_channel_routes(
             env_enabled=True,
             env_payload=payload,
+            routes_file=routes_file,
             require_reciprocal=self._config.bridge_routes_env.require_reciprocal,
             strict=self._config.bridge_routes_env.strict,
         )
@@ -153,11 +207,13 @@ def log_startup_diagnostics(
     *,
     data_dir: Path | None = None,
     database_probe: DatabaseProbe | None = None,
+    schema_probe: SchemaProbe | None = None,
 ) -> list[DiagnosticResult]:
     runner = StartupDiagnostics(
         config=config,
         data_dir=data_dir,
         database_probe=database_probe,
+        schema_probe=schema_probe,
     )
     results = runner.run()
 
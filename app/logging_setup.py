@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Mapping, Tuple
+
+from app.config import LoggingSettings
+
+
+TEXT_LOG_FORMAT = "%(levelname)s:%(name)s:%(message)s"
+
+_RESERVED_RECORD_KEYS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__.keys()
+) | {"message", "asctime"}
+
+
+class JsonLogFormatter(logging.Formatter):
+    """ログレコードを 1 行の JSON として出力する。"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, object] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key in _RESERVED_RECORD_KEYS or key.startswith("_"):
+                continue
+            payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class EventSamplingFilter(logging.Filter):
+    """`event` 属性ごとのサンプリング率でレコードを間引く。"""
+
+    def __init__(
+        self,
+        rates: Mapping[str, float],
+        *,
+        random_source: Callable[[], float] = random.random,
+    ) -> None:
+        super().__init__()
+        self._rates = dict(rates)
+        self._random = random_source
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        event = getattr(record, "event", None)
+        if event is None:
+            return True
+        rate = self._rates.get(event)
+        if rate is None or rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        return self._random() < rate
+
+
+class RateLimitFilter(logging.Filter):
+    """同一テンプレートの WARNING 以上のログを一定間隔に 1 件へ抑える。"""
+
+    def __init__(
+        self,
+        interval: float,
+        *,
+        level: int = logging.WARNING,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self._interval = interval
+        self._level = level
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: Dict[Tuple[str, object], Tuple[float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self._interval <= 0 or record.levelno < self._level:
+            return True
+        key = (record.name, record.msg)
+        now = self._clock()
+        with self._lock:
+            last_emitted, suppressed = self._state.get(key, (None, 0))
+            if last_emitted is not None and now - last_emitted < self._interval:
+                self._state[key] = (last_emitted, suppressed + 1)
+                return False
+            self._state[key] = (now, 0)
+        if suppressed:
+            record.suppressed = suppressed
+            if isinstance(record.msg, str):
+                record.msg = f"{record.msg} (直近 {suppressed} 件の同種ログを抑制しました)"
+        return True
+
+
+class ExceptionPreservingQueueHandler(logging.handlers.QueueHandler):
+    """例外情報を本文に埋め込まずにキューへ渡す `QueueHandler`。
+
+    標準の `prepare` はトレースバックを `message` に連結して `exc_info` を消すため、
+    JSON 出力で `exc_info` フィールドが失われる。ここでは本文の引数だけを展開し、
+    トレースバックは記録時点で `exc_text` に整形して残す。
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            # トレースバックのフレームをリスナー側まで保持しない。
+            record.exc_info = None
+        return record
+
+
+class LoggingRuntime:
+    """`configure_logging` が組み立てたハンドラのライフサイクルを管理する。"""
+
+    def __init__(self, listener: logging.handlers.QueueListener | None) -> None:
+        self._listener = listener
+
+    def stop(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self._listener = None
+
+
+def configure_logging(settings: LoggingSettings) -> LoggingRuntime:
+    """設定に従ってルートロガーのハンドラを構成し直す。"""
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(settings.level)
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if settings.format == "json":
+        stream_handler.setFormatter(JsonLogFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_LOG_FORMAT))
+
+    filters: list[logging.Filter] = []
+    if settings.sample_rates:
+        filters.append(EventSamplingFilter(settings.sample_rates))
+    if settings.warning_interval > 0:
+        filters.append(RateLimitFilter(settings.warning_interval))
+
+    listener: logging.handlers.QueueListener | None = None
+    if settings.queue_enabled:
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+        front_handler: logging.Handler = ExceptionPreservingQueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(
+            log_queue,
+            stream_handler,
+            respect_handler_level=True,
+        )
+        listener.start()
+    else:
+        front_handler = stream_handler
+
+    for log_filter in filters:
+        front_handler.addFilter(log_filter)
+    root.addHandler(front_handler)
+    return LoggingRuntime(listener)
+
+
+__all__ = [
+    "EventSamplingFilter",
+    "ExceptionPreservingQueueHandler",
+    "JsonLogFormatter",
+    "LoggingRuntime",
+    "RateLimitFilter",
+    "configure_logging",
+]
@@ -0,0 +1,397 @@
+"""Offline throughput benchmark for `ChannelBridgeManager`.
+
+Run with ``python -m benchmarks.bridge_bench``. Results are written to
+``data/benchmarks/`` so runs from different commits can be compared with
+``--baseline``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from bot.bridge.manager import ChannelBridgeManager
+from bot.bridge.messages import BridgeMessageStore
+from bot.bridge.profiles import BridgeProfileStore
+from bot.bridge.routes import ChannelEndpoint, ChannelRoute
+from bot.bridge.storage import (
+    BridgeStorageBackend,
+    InMemoryStorageBackend,
+    SqliteStorageBackend,
+    SupabaseStorageBackend,
+)
+
+from .fakes import FakeAttachment, FakeDiscordClient, FakeMessage, FakeSupabaseClient
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT_DIR = ROOT / "data" / "benchmarks"
+SCENARIOS = ("message", "edit", "reaction", "delete")
+STORES = ("supabase", "memory", "sqlite")
+
+
+@dataclass(slots=True)
+class BenchmarkConfig:
+    messages: int = 200
+    fanout: int = 3
+    source_channels: int = 1
+    attachments: int = 0
+    attachment_size: int = 256 * 1024
+    store_latency_ms: float = 0.0
+    discord_latency_ms: float = 0.0
+    concurrency: int = 1
+    store: str = "supabase"
+    propagate_deletes: bool = False
+    trace_memory: bool = True
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    scenario: str
+    operations: int
+    elapsed_seconds: float
+    ops_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_kib: Optional[float]
+
+
+@dataclass(slots=True)
+class _Environment:
+    manager: ChannelBridgeManager
+    discord: FakeDiscordClient
+    storage: BridgeStorageBackend
+    sources: List[object]
+
+
+def _build_storage(config: BenchmarkConfig, workdir: Path) -> BridgeStorageBackend:
+    if config.store == "memory":
+        return InMemoryStorageBackend()
+    if config.store == "sqlite":
+        return SqliteStorageBackend(workdir / "bench.sqlite3")
+    return SupabaseStorageBackend(
+        FakeSupabaseClient(latency=config.store_latency_ms / 1000)  # type: ignore[arg-type]
+    )
+
+
+def _build_environment(config: BenchmarkConfig, workdir: Path) -> _Environment:
+    discord_client = FakeDiscordClient(latency=config.discord_latency_ms / 1000)
+    storage = _build_storage(config, workdir)
+
+    routes: List[ChannelRoute] = []
+    sources = []
+    next_channel_id = 1000
+    for source_index in range(config.source_channels):
+        src_guild = 100 + source_index
+        src_channel = discord_client.add_channel(guild_id=src_guild, channel_id=next_channel_id)
+        next_channel_id += 1
+        sources.append(src_channel)
+        for _ in range(config.fanout):
+            dst_guild = 10_000 + next_channel_id
+            discord_client.add_channel(guild_id=dst_guild, channel_id=next_channel_id)
+            routes.append(
+                ChannelRoute(
+                    src=ChannelEndpoint(guild=src_guild, channel=src_channel.id),
+                    dst=ChannelEndpoint(guild=dst_guild, channel=next_channel_id),
+                )
+            )
+            next_channel_id += 1
+
+    manager = ChannelBridgeManager(
+        client=discord_client,  # type: ignore[arg-type]
+        profile_store=BridgeProfileStore(storage),
+        message_store=BridgeMessageStore(storage),
+        routes=routes,
+        propagate_deletes=config.propagate_deletes,
+    )
+    return _Environment(manager=manager, discord=discord_client, storage=storage, sources=sources)
+
+
+def _make_source_messages(env: _Environment, config: BenchmarkConfig) -> List[FakeMessage]:
+    messages: List[FakeMessage] = []
+    for index in range(config.messages):
+        channel = env.sources[index % len(env.sources)]
+        author = SimpleNamespace(id=10 + index % 50, bot=False)
+        attachments = [
+            FakeAttachment(
+                attachment_id=env.discord.snowflakes.next(),
+                filename=f"image-{index}-{slot}.png",
+                content_type="image/png",
+                size=config.attachment_size,
+                latency=config.discord_latency_ms / 1000,
+            )
+            for slot in range(config.attachments)
+        ]
+        message = FakeMessage(
+            message_id=env.discord.snowflakes.next(),
+            channel=channel,  # type: ignore[arg-type]
+            author=author,
+            content=f"benchmark message {index}",
+            attachments=attachments,
+        )
+        channel.messages[message.id] = message  # type: ignore[attr-defined]
+        messages.append(message)
+    return messages
+
+
+async def _measure(
+    scenario: str,
+    operations: Sequence[Callable[[], Awaitable[None]]],
+    *,
+    concurrency: int,
+    trace_memory: bool,
+) -> ScenarioResult:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(operation: Callable[[], Awaitable[None]]) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await operation()
+            latencies.append(time.perf_counter() - started)
+
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(run(operation) for operation in operations))
+    elapsed = time.perf_counter() - started
+    peak_kib: Optional[float] = None
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kib = round(peak / 1024, 1)
+
+    return ScenarioResult(
+        scenario=scenario,
+        operations=len(operations),
+        elapsed_seconds=round(elapsed, 4),
+        ops_per_second=round(len(operations) / elapsed, 1) if elapsed > 0 else 0.0,
+        p50_ms=round(_percentile(latencies, 50) * 1000, 3),
+        p99_ms=round(_percentile(latencies, 99) * 1000, 3),
+        peak_memory_kib=peak_kib,
+    )
+
+
+def _percentile(samples: Sequence[float], percentile: float) -> float:
+    if not samples:
+        return 0.0
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(percentile) - 1]
+
+
+async def run_benchmark(
+    config: BenchmarkConfig,
+    *,
+    scenarios: Sequence[str] = SCENARIOS,
+) -> List[ScenarioResult]:
+    with tempfile.TemporaryDirectory() as workdir:
+        env = _build_environment(config, Path(workdir))
+        try:
+            return await _run_scenarios(env, config, scenarios)
+        finally:
+            env.storage.close()
+
+
+async def _run_scenarios(
+    env: _Environment,
+    config: BenchmarkConfig,
+    scenarios: Sequence[str],
+) -> List[ScenarioResult]:
+    sources = _make_source_messages(env, config)
+    manager = env.manager
+    results: List[ScenarioResult] = []
+
+    async def handle(message: FakeMessage) -> None:
+        await manager.handle_message(message)  # type: ignore[arg-type]
+
+    results.append(
+        await _measure(
+            "message",
+            [lambda message=message: handle(message) for message in sources],
+            concurrency=config.concurrency,
+            trace_memory=config.trace_memory,
+        )
+    )
+
+    if "edit" in scenarios:
+        async def edit(message: FakeMessage) -> None:
+            before = SimpleNamespace(**vars(message))
+            message.content = f"{message.content} (edited)"
+            await manager.handle_message_edit(before, message)  # type: ignore[arg-type]
+
+        results.append(
+            await _measure(
+                "edit",
+                [lambda message=message: edit(message) for message in sources],
+                concurrency=config.concurrency,
+                trace_memory=config.trace_memory,
+            )
+        )
+
+    if "reaction" in scenarios:
+        user = SimpleNamespace(id=42, bot=False)
+
+        async def react(message: FakeMessage) -> None:
+            reaction = SimpleNamespace(message=message, emoji="👍")
+            await manager.handle_reaction(reaction, user, add=True)  # type: ignore[arg-type]
+            await manager.handle_reaction(reaction, user, add=False)  # type: ignore[arg-type]
+
+        results.append(
+            await _measure(
+                "reaction",
+                [lambda message=message: react(message) for message in sources],
+                concurrency=config.concurrency,
+                trace_memory=config.trace_memory,
+            )
+        )
+
+    if "delete" in scenarios:
+        async def delete(message: FakeMessage) -> None:
+            await manager.handle_raw_message_delete(message.id)
+
+        results.append(
+            await _measure(
+                "delete",
+                [lambda message=message: delete(message) for message in sources],
+                concurrency=config.concurrency,
+                trace_memory=config.trace_memory,
+            )
+        )
+
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return completed.stdout.strip() or "unknown"
+
+
+def save_results(
+    config: BenchmarkConfig,
+    results: Sequence[ScenarioResult],
+    *,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+) -> Path:
+    revision = _git_revision()
+    created_at = datetime.now(timezone.utc)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"bridge-{created_at.strftime('%Y%m%dT%H%M%SZ')}-{revision}.json"
+    document = {
+        "revision": revision,
+        "created_at": created_at.isoformat(),
+        "config": asdict(config),
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _format_report(
+    results: Sequence[ScenarioResult],
+    baseline: Optional[Dict[str, Dict[str, float]]] = None,
+) -> str:
+    header = f"{'scenario':<10} {'ops':>6} {'ops/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'peak KiB':>10}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        peak = "-" if result.peak_memory_kib is None else f"{result.peak_memory_kib:.1f}"
+        line = (
+            f"{result.scenario:<10} {result.operations:>6} {result.ops_per_second:>10.1f} "
+            f"{result.p50_ms:>10.3f} {result.p99_ms:>10.3f} {peak:>10}"
+        )
+        previous = (baseline or {}).get(result.scenario)
+        if previous and previous.get("ops_per_second"):
+            delta = (result.ops_per_second / previous["ops_per_second"] - 1) * 100
+            line += f"  ({delta:+.1f}% ops/s vs baseline)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    document = json.loads(path.read_text(encoding="utf-8"))
+    return {entry["scenario"]: entry for entry in document.get("results", [])}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="bridge-bench",
+        description="ChannelBridgeManager のスループットをオフラインで計測します。",
+    )
+    defaults = BenchmarkConfig()
+    parser.add_argument("--messages", type=int, default=defaults.messages, help="送信するソースメッセージ数")
+    parser.add_argument("--fanout", type=int, default=defaults.fanout, help="ソースチャンネルあたりのルート数")
+    parser.add_argument("--source-channels", type=int, default=defaults.source_channels, help="ソースチャンネル数")
+    parser.add_argument("--attachments", type=int, default=defaults.attachments, help="メッセージあたりの添付数")
+    parser.add_argument("--attachment-size", type=int, default=defaults.attachment_size, help="添付 1 件のバイト数")
+    parser.add_argument("--store-latency-ms", type=float, default=0.0, help="ストア呼び出しごとの遅延 (ミリ秒)")
+    parser.add_argument("--discord-latency-ms", type=float, default=0.0, help="Discord REST 呼び出しごとの遅延 (ミリ秒)")
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency, help="同時に処理するイベント数")
+    parser.add_argument(
+        "--store",
+        choices=STORES,
+        default=defaults.store,
+        help="ストアバックエンド (supabase はプロセス内フェイク。遅延注入は supabase のみ有効)",
+    )
+    parser.add_argument(
+        "--propagate-deletes",
+        action="store_true",
+        help="delete シナリオで送信先ミラーも削除する",
+    )
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="実行するシナリオ (カンマ区切り)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc によるピークメモリ計測を無効化")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="結果 JSON の保存先")
+    parser.add_argument("--no-save", action="store_true", help="結果を保存しない")
+    parser.add_argument("--baseline", type=Path, help="比較対象とする過去の結果 JSON")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = sorted(set(scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"未知のシナリオです: {', '.join(unknown)}")
+
+    config = BenchmarkConfig(
+        messages=args.messages,
+        fanout=args.fanout,
+        source_channels=max(args.source_channels, 1),
+        attachments=args.attachments,
+        attachment_size=args.attachment_size,
+        store_latency_ms=args.store_latency_ms,
+        discord_latency_ms=args.discord_latency_ms,
+        concurrency=args.concurrency,
+        store=args.store,
+        propagate_deletes=args.propagate_deletes,
+        trace_memory=not args.no_memory,
+    )
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(run_benchmark(config, scenarios=scenarios))
+    baseline = _load_baseline(args.baseline) if args.baseline else None
+    print(_format_report(results, baseline))
+    if not args.no_save:
+        path = save_results(config, results, output_dir=args.output_dir)
+        print(f"\n結果を保存しました: {path}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI 直実行用
+    raise SystemExit(main())
@@ -0,0 +1,396 @@
+"""In-process stand-ins for the Discord and Supabase clients used by the benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import io
+import itertools
+import json
+import mimetypes
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional
+
+import discord
+
+DISCORD_EPOCH_MS = 1420070400000
+
+
+class SnowflakeFactory:
+    """Generate monotonically increasing Discord-style snowflakes."""
+
+    def __init__(self) -> None:
+        self._sequence = itertools.count()
+
+    def next(self) -> int:
+        timestamp = int(time.time() * 1000) - DISCORD_EPOCH_MS
+        return (timestamp << 22) | (next(self._sequence) & 0x3FFFFF)
+
+
+# --------------------------------------------------------------------------- Supabase
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    data: Any
+    count: Optional[int] = None
+
+
+class FakeSupabaseQuery:
+    def __init__(self, client: "FakeSupabaseClient", table: str) -> None:
+        self._client = client
+        self._table = table
+        self._action = "select"
+        self._payload: Any = None
+        self._on_conflict: Optional[str] = None
+        self._ignore_duplicates = False
+        self._filters: List[tuple[str, str, Any]] = []
+        self._limit: Optional[int] = None
+        self._count: Any = None
+        self._returning: Any = None
+
+    def select(self, *_columns: str, **_kwargs: Any) -> "FakeSupabaseQuery":
+        self._action = "select"
+        return self
+
+    def upsert(
+        self,
+        payload: Any,
+        *,
+        on_conflict: str = "",
+        ignore_duplicates: bool = False,
+        **_kwargs: Any,
+    ) -> "FakeSupabaseQuery":
+        self._action = "upsert"
+        self._payload = payload
+        self._on_conflict = on_conflict or None
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, payload: Dict[str, Any], **_kwargs: Any) -> "FakeSupabaseQuery":
+        self._action = "update"
+        self._payload = payload
+        return self
+
+    def delete(self, *, count: Any = None, returning: Any = None) -> "FakeSupabaseQuery":
+        self._action = "delete"
+        self._count = count
+        self._returning = returning
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeSupabaseQuery":
+        self._filters.append(("eq", column, value))
+        return self
+
+    def lt(self, column: str, value: Any) -> "FakeSupabaseQuery":
+        self._filters.append(("lt", column, value))
+        return self
+
+    def gte(self, column: str, value: Any) -> "FakeSupabaseQuery":
+        self._filters.append(("gte", column, value))
+        return self
+
+    def in_(self, column: str, values: Iterable[Any]) -> "FakeSupabaseQuery":
+        self._filters.append(("in", column, list(values)))
+        return self
+
+    def contains(self, column: str, value: Iterable[Any]) -> "FakeSupabaseQuery":
+        self._filters.append(("contains", column, list(value)))
+        return self
+
+    def or_(self, filters: str, **_kwargs: Any) -> "FakeSupabaseQuery":
+        # PostgREST の `col.cs.[value]` / `col.eq.value` 形式のみ解釈する。
+        terms: List[tuple[str, str, Any]] = []
+        for term in filters.split(","):
+            column, operator, raw = term.split(".", 2)
+            if operator == "cs":
+                terms.append(("contains", column, json.loads(raw)))
+            else:
+                terms.append((operator, column, raw))
+        self._filters.append(("or", "", terms))
+        return self
+
+    def order(self, *_args: Any, **_kwargs: Any) -> "FakeSupabaseQuery":
+        return self
+
+    def limit(self, count: int) -> "FakeSupabaseQuery":
+        self._limit = count
+        return self
+
+    def execute(self) -> FakeResponse:
+        self._client.calls += 1
+        if self._client.latency > 0:
+            time.sleep(self._client.latency)
+        rows = self._client.tables.setdefault(self._table, {})
+        if self._action == "upsert":
+            payloads = self._payload if isinstance(self._payload, list) else [self._payload]
+            key_column = self._on_conflict or "id"
+            written = []
+            for payload in payloads:
+                key = ",".join(str(payload[column]) for column in key_column.split(","))
+                if self._ignore_duplicates and key in rows:
+                    continue
+                written.append(payload)
+                merged = dict(rows.get(key, {}))
+                merged.update(copy.deepcopy(payload))
+                rows[key] = merged
+            return FakeResponse(data=copy.deepcopy(written))
+
+        matches = [key for key, row in rows.items() if self._matches(row)]
+        if self._limit is not None:
+            matches = matches[: self._limit]
+        if self._action == "select":
+            return FakeResponse(data=[copy.deepcopy(rows[key]) for key in matches])
+        if self._action == "update":
+            for key in matches:
+                rows[key].update(copy.deepcopy(self._payload))
+            return FakeResponse(data=[copy.deepcopy(rows[key]) for key in matches])
+        deleted = [rows.pop(key) for key in matches]
+        count = len(deleted) if self._count is not None else None
+        if str(getattr(self._returning, "value", self._returning)) == "minimal":
+            return FakeResponse(data=[], count=count)
+        return FakeResponse(data=deleted, count=count)
+
+    def _matches(self, row: Dict[str, Any]) -> bool:
+        return self._matches_all(row, self._filters)
+
+    def _matches_all(self, row: Dict[str, Any], filters: Iterable[tuple[str, str, Any]]) -> bool:
+        for operator, column, value in filters:
+            if operator == "or":
+                if not any(self._matches_all(row, [term]) for term in value):
+                    return False
+                continue
+            current = row.get(column)
+            if operator == "eq" and str(current) != str(value):
+                return False
+            if operator == "lt" and not (current is not None and current < value):
+                return False
+            if operator == "gte" and not (current is not None and current >= value):
+                return False
+            if operator == "in" and str(current) not in {str(item) for item in value}:
+                return False
+            if operator == "contains":
+                have = {str(item) for item in current or []}
+                if not {str(item) for item in value} <= have:
+                    return False
+        return True
+
+
+class FakeSupabaseClient:
+    """Dictionary-backed replacement for the subset of supabase-py used by the stores."""
+
+    def __init__(self, *, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls = 0
+        self.tables: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def table(self, name: str) -> FakeSupabaseQuery:
+        return FakeSupabaseQuery(self, name)
+
+
+# --------------------------------------------------------------------------- Discord
+
+
+class FakeAttachment:
+    def __init__(
+        self,
+        *,
+        attachment_id: int,
+        filename: str,
+        content_type: str,
+        size: int,
+        latency: float,
+    ) -> None:
+        self.id = attachment_id
+        self.filename = filename
+        self.content_type = content_type
+        self.size = size
+        self.url = f"https://cdn.example.invalid/attachments/{attachment_id}/{filename}"
+        self._latency = latency
+
+    async def to_file(self, **_kwargs: Any) -> discord.File:
+        if self._latency > 0:
+            await asyncio.sleep(self._latency)
+        return discord.File(io.BytesIO(bytes(self.size)), filename=self.filename)
+
+
+class FakeMessage:
+    def __init__(
+        self,
+        *,
+        message_id: int,
+        channel: "FakeChannel",
+        author: SimpleNamespace,
+        content: Optional[str] = None,
+        attachments: Optional[List[FakeAttachment]] = None,
+        embed: Optional[discord.Embed] = None,
+    ) -> None:
+        self.id = message_id
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.content = content or ""
+        self.attachments = list(attachments or [])
+        self.stickers: List[Any] = []
+        self.reference = None
+        self.embeds = [embed] if embed is not None else []
+        self.reactions: Dict[str, int] = {}
+        self.edited_at: Optional[datetime] = None
+        self.edit_calls = 0
+
+    @property
+    def jump_url(self) -> str:
+        return f"https://discord.com/channels/{self.guild.id}/{self.channel.id}/{self.id}"
+
+    async def edit(self, **kwargs: Any) -> "FakeMessage":
+        await self.channel.simulate_latency()
+        self.edit_calls += 1
+        if "content" in kwargs:
+            self.content = kwargs["content"] or ""
+        if kwargs.get("embed") is not None:
+            self.embeds = [kwargs["embed"]]
+        return self
+
+    async def add_reaction(self, emoji: Any) -> None:
+        await self.channel.simulate_latency()
+        key = str(emoji)
+        self.reactions[key] = self.reactions.get(key, 0) + 1
+
+    async def remove_reaction(self, emoji: Any, _member: Any) -> None:
+        await self.channel.simulate_latency()
+        key = str(emoji)
+        self.reactions[key] = max(self.reactions.get(key, 0) - 1, 0)
+
+    async def delete(self, **_kwargs: Any) -> None:
+        await self.channel.simulate_latency()
+        self.channel.single_delete_calls += 1
+        self.channel.messages.pop(self.id, None)
+
+
+class FakeChannel:
+    def __init__(self, *, channel_id: int, guild_id: int, client: "FakeDiscordClient") -> None:
+        self.id = channel_id
+        self.guild = SimpleNamespace(id=guild_id, filesize_limit=25 * 1024 * 1024)
+        self.messages: Dict[int, FakeMessage] = {}
+        self.sent = 0
+        self.bulk_delete_calls = 0
+        self.single_delete_calls = 0
+        self.fail_sends = 0
+        self._nonces: Dict[str, FakeMessage] = {}
+        self._client = client
+
+    async def simulate_latency(self) -> None:
+        if self._client.latency > 0:
+            await asyncio.sleep(self._client.latency)
+
+    async def send(self, **kwargs: Any) -> FakeMessage:
+        await self.simulate_latency()
+        if self.fail_sends > 0:
+            self.fail_sends -= 1
+            raise _server_error("Service Unavailable")
+        nonce = kwargs.get("nonce")
+        if nonce is not None and nonce in self._nonces:
+            # Discord は enforce_nonce 付きの重複送信に既存メッセージを返す。
+            return self._nonces[nonce]
+        message = FakeMessage(
+            message_id=self._client.snowflakes.next(),
+            channel=self,
+            author=self._client.user,
+            content=kwargs.get("content"),
+            embed=kwargs.get("embed"),
+        )
+        for file in kwargs.get("files", ()):
+            # Discord は添付ごとに CDN 上の URL を持つ Attachment を返す。
+            message.attachments.append(
+                FakeAttachment(
+                    attachment_id=self._client.snowflakes.next(),
+                    filename=file.filename,
+                    content_type=mimetypes.guess_type(file.filename)[0] or "application/octet-stream",
+                    size=len(file.fp.getvalue()) if isinstance(file.fp, io.BytesIO) else 0,
+                    latency=0.0,
+                )
+            )
+            file.close()
+        self.messages[message.id] = message
+        if nonce is not None:
+            self._nonces[nonce] = message
+        self.sent += 1
+        return message
+
+    async def fetch_message(self, message_id: int) -> FakeMessage:
+        await self.simulate_latency()
+        try:
+            return self.messages[message_id]
+        except KeyError:
+            raise _not_found("Unknown Message") from None
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        message = self.messages.get(message_id)
+        if message is None:
+            return FakeMessage(message_id=message_id, channel=self, author=self._client.user)
+        return message
+
+    async def delete_messages(self, messages: Iterable[Any], **_kwargs: Any) -> None:
+        await self.simulate_latency()
+        self.bulk_delete_calls += 1
+        for message in messages:
+            self.messages.pop(message.id, None)
+
+
+@dataclass(slots=True)
+class FakeDiscordClient:
+    """Channel registry mimicking the `discord.Client` lookups used by the manager."""
+
+    latency: float = 0.0
+    shard_count: Optional[int] = None
+    snowflakes: SnowflakeFactory = field(default_factory=SnowflakeFactory)
+    channels: Dict[int, FakeChannel] = field(default_factory=dict)
+    user: SimpleNamespace = field(
+        default_factory=lambda: SimpleNamespace(
+            id=1,
+            bot=True,
+            display_avatar=SimpleNamespace(url="https://cdn.example.invalid/avatar.png"),
+        )
+    )
+
+    def add_channel(self, *, guild_id: int, channel_id: int) -> FakeChannel:
+        channel = FakeChannel(channel_id=channel_id, guild_id=guild_id, client=self)
+        self.channels[channel_id] = channel
+        return channel
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.channels.get(channel_id)
+
+    async def fetch_channel(self, channel_id: int) -> FakeChannel:
+        await asyncio.sleep(self.latency)
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            raise _not_found("Unknown Channel")
+        return channel
+
+    def get_guild(self, guild_id: int) -> Optional[SimpleNamespace]:
+        for channel in self.channels.values():
+            if channel.guild.id == guild_id:
+                return channel.guild
+        return None
+
+
+def _not_found(message: str) -> discord.NotFound:
+    return discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), message)
+
+
+def _server_error(message: str) -> discord.DiscordServerError:
+    return discord.DiscordServerError(SimpleNamespace(status=503, reason=message), message)
+
+
+__all__ = [
+    "FakeAttachment",
+    "FakeChannel",
+    "FakeDiscordClient",
+    "FakeMessage",
+    "FakeSupabaseClient",
+    "SnowflakeFactory",
+]
@@ -0,0 +1,207 @@
+"""Throughput benchmark for the attachment transcode worker pool.
+
+Run with ``python -m benchmarks.transcode_bench`` (requires Pillow). Sample
+images are generated in memory and shrunk with
+`bot.bridge.transcode.shrink_image`, first inline on one core and then through
+a `ProcessPoolExecutor` for each requested worker count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import io
+import json
+import multiprocessing
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from bot.bridge.transcode import shrink_image
+
+from .bridge_bench import DEFAULT_OUTPUT_DIR, _git_revision
+
+
+@dataclass(slots=True)
+class TranscodeBenchConfig:
+    images: int = 32
+    side: int = 3000
+    limit: int = 1024 * 1024
+    max_dimension: int = 2048
+    quality: int = 85
+    workers: Sequence[int] = (1, 2, 4)
+
+
+@dataclass(slots=True)
+class TranscodeResult:
+    mode: str
+    workers: int
+    images: int
+    elapsed_seconds: float
+    images_per_second: float
+    p50_ms: float
+    input_mib: float
+    output_mib: float
+
+
+def make_sample_images(count: int, side: int) -> List[bytes]:
+    """Generate PNG samples: half photo-like noise, half smooth gradients."""
+    from PIL import Image
+
+    samples: List[bytes] = []
+    for index in range(count):
+        if index % 2 == 0:
+            image = Image.frombytes("RGB", (side, side), os.urandom(side * side * 3))
+        else:
+            gradient = Image.linear_gradient("L").resize((side, side))
+            image = Image.merge("RGB", (gradient, gradient.transpose(Image.Transpose.ROTATE_90), gradient))
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        samples.append(buffer.getvalue())
+    return samples
+
+
+def _summarize(
+    mode: str,
+    workers: int,
+    samples: Sequence[bytes],
+    outputs: Sequence[Optional[tuple]],
+    elapsed: float,
+    latencies: Sequence[float],
+) -> TranscodeResult:
+    return TranscodeResult(
+        mode=mode,
+        workers=workers,
+        images=len(samples),
+        elapsed_seconds=elapsed,
+        images_per_second=len(samples) / elapsed if elapsed > 0 else 0.0,
+        p50_ms=statistics.median(latencies) * 1000 if latencies else 0.0,
+        input_mib=sum(len(sample) for sample in samples) / (1024 * 1024),
+        output_mib=sum(len(output[0]) for output in outputs if output) / (1024 * 1024),
+    )
+
+
+def run_inline(config: TranscodeBenchConfig, samples: Sequence[bytes]) -> TranscodeResult:
+    latencies: List[float] = []
+    outputs = []
+    started = time.perf_counter()
+    for sample in samples:
+        image_started = time.perf_counter()
+        outputs.append(shrink_image(sample, config.limit, config.max_dimension, config.quality))
+        latencies.append(time.perf_counter() - image_started)
+    return _summarize("inline", 1, samples, outputs, time.perf_counter() - started, latencies)
+
+
+async def run_pool(config: TranscodeBenchConfig, samples: Sequence[bytes], workers: int) -> TranscodeResult:
+    loop = asyncio.get_running_loop()
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        # ワーカーの起動時間を計測から除くため、先に 1 件ずつ処理させておく。
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, shrink_image, samples[0], config.limit, 256, 60) for _ in range(workers))
+        )
+        latencies: List[float] = []
+
+        async def _one(sample: bytes) -> Optional[tuple]:
+            image_started = time.perf_counter()
+            output = await loop.run_in_executor(
+                executor, shrink_image, sample, config.limit, config.max_dimension, config.quality
+            )
+            latencies.append(time.perf_counter() - image_started)
+            return output
+
+        started = time.perf_counter()
+        outputs = await asyncio.gather(*(_one(sample) for sample in samples))
+        elapsed = time.perf_counter() - started
+    return _summarize("pool", workers, samples, outputs, elapsed, latencies)
+
+
+def _format_report(results: Sequence[TranscodeResult]) -> str:
+    header = f"{'mode':<8} {'workers':>7} {'images':>6} {'img/s':>8} {'p50 ms':>10} {'in MiB':>8} {'out MiB':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.mode:<8} {result.workers:>7} {result.images:>6} {result.images_per_second:>8.2f} "
+            f"{result.p50_ms:>10.1f} {result.input_mib:>8.1f} {result.output_mib:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def save_results(
+    config: TranscodeBenchConfig,
+    results: Sequence[TranscodeResult],
+    *,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+) -> Path:
+    revision = _git_revision()
+    created_at = datetime.now(timezone.utc)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"transcode-{created_at.strftime('%Y%m%dT%H%M%SZ')}-{revision}.json"
+    document = {
+        "revision": revision,
+        "created_at": created_at.isoformat(),
+        "config": {**asdict(config), "workers": list(config.workers)},
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="transcode-bench",
+        description="添付画像の縮小処理のスループットをワーカー数ごとに計測します。",
+    )
+    defaults = TranscodeBenchConfig()
+    parser.add_argument("--images", type=int, default=defaults.images, help="処理するサンプル画像数")
+    parser.add_argument("--side", type=int, default=defaults.side, help="サンプル画像の一辺のピクセル数")
+    parser.add_argument("--limit", type=int, default=defaults.limit, help="縮小後の上限バイト数")
+    parser.add_argument("--max-dimension", type=int, default=defaults.max_dimension, help="縮小後の長辺の最大ピクセル数")
+    parser.add_argument("--quality", type=int, default=defaults.quality, help="再圧縮時の初期品質")
+    parser.add_argument(
+        "--workers",
+        default=",".join(str(value) for value in defaults.workers),
+        help="計測するワーカー数 (カンマ区切り)",
+    )
+    parser.add_argument("--no-inline", action="store_true", help="単一コアでの逐次処理の計測を省略")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="結果 JSON の保存先")
+    parser.add_argument("--no-save", action="store_true", help="結果を保存しない")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    try:
+        workers = tuple(int(value) for value in args.workers.split(",") if value.strip())
+    except ValueError:
+        parser.error(f"ワーカー数が不正です: {args.workers}")
+    if not workers or min(workers) < 1:
+        parser.error("ワーカー数は 1 以上で指定してください")
+
+    config = TranscodeBenchConfig(
+        images=max(args.images, 1),
+        side=args.side,
+        limit=args.limit,
+        max_dimension=args.max_dimension,
+        quality=args.quality,
+        workers=workers,
+    )
+    samples = make_sample_images(config.images, config.side)
+    results: List[TranscodeResult] = []
+    if not args.no_inline:
+        results.append(run_inline(config, samples))
+    for count in config.workers:
+        results.append(asyncio.run(run_pool(config, samples, count)))
+    print(_format_report(results))
+    if not args.no_save:
+        path = save_results(config, results, output_dir=args.output_dir)
+        print(f"\n結果を保存しました: {path}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI 直実行用
+    raise SystemExit(main())
@@ -1,7 +1,8 @@
-from .client import BridgeBotClient
+from .client import BridgeBotClient, ShardedBridgeBotClient
 from .commands import register_bridge_commands
 
 __all__ = [
     "BridgeBotClient",
+    "ShardedBridgeBotClient",
     "register_bridge_commands",
 ]
@@ -1,16 +1,32 @@
+from .admission import AdmissionController
+from .cluster import LeaseCoordinator
+from .dispatcher import BridgeEventDispatcher
+from .journal import OutboundJournal, OutboundRetryQueue
 from .manager import ChannelBridgeManager
+from .metrics import BridgeMetrics, MetricsServer
 from .messages import BridgeMessageStore, BridgeMessageAttachmentMetadata, BridgeMessageRecord
+from .retention import BridgeRetentionTask
 from .profiles import BridgeProfileStore, BridgeProfile
 from .routes import ChannelRoute, ChannelEndpoint, load_channel_routes
+from .transcode import MediaTranscoder
 
 __all__ = [
+    "AdmissionController",
     "BridgeProfile",
     "BridgeProfileStore",
+    "BridgeEventDispatcher",
     "BridgeMessageAttachmentMetadata",
     "BridgeMessageRecord",
     "BridgeMessageStore",
+    "BridgeMetrics",
+    "BridgeRetentionTask",
     "ChannelBridgeManager",
     "ChannelEndpoint",
     "ChannelRoute",
+    "LeaseCoordinator",
+    "MediaTranscoder",
+    "MetricsServer",
+    "OutboundJournal",
+    "OutboundRetryQueue",
     "load_channel_routes",
 ]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from .metrics import BridgeMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+_K = TypeVar("_K", bound=Hashable)
+
+SHED_POLICIES = ("shed", "summarize")
+#: Upper bound of buckets kept per scope; the least recently used ones are evicted.
+MAX_TRACKED_BUCKETS = 10_000
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at ``rate`` tokens per second."""
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated")
+
+    def __init__(self, *, rate: float, burst: float, now: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = now
+
+    def tokens(self, now: float) -> float:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+        return self._tokens
+
+    def take(self, now: float, amount: float = 1.0) -> None:
+        self._tokens = self.tokens(now) - amount
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionDecision:
+    """Result of :meth:`AdmissionController.admit`.
+
+    ``shed_before`` is the number of messages shed in the same channel since
+    the previous admitted one; it is only reported with the ``summarize``
+    policy so the caller can post a single notice for the whole burst.
+    """
+
+    admitted: bool
+    scope: Optional[str] = None
+    shed_before: int = 0
+
+
+class AdmissionController:
+    """Per-guild and per-channel token buckets in front of message bridging.
+
+    A message is admitted only when both its guild bucket and its channel
+    bucket hold a token, so a burst in one channel cannot starve the other
+    channels of its guild and one guild cannot starve the rest of the bot.
+    """
+
+    def __init__(
+        self,
+        *,
+        guild_rate: float,
+        guild_burst: float,
+        channel_rate: float,
+        channel_burst: float,
+        policy: str = "shed",
+        metrics: Optional[BridgeMetrics] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if policy not in SHED_POLICIES:
+            raise ValueError(f"unknown shed policy: {policy}")
+        if min(guild_rate, guild_burst, channel_rate, channel_burst) <= 0:
+            raise ValueError("rates and bursts must be positive")
+        self._guild_rate = guild_rate
+        self._guild_burst = guild_burst
+        self._channel_rate = channel_rate
+        self._channel_burst = channel_burst
+        self._policy = policy
+        self._clock = clock
+        self._guild_buckets: OrderedDict[int, TokenBucket] = OrderedDict()
+        self._channel_buckets: OrderedDict[Tuple[int, int], TokenBucket] = OrderedDict()
+        self._shed_counts: Dict[Tuple[int, int], int] = {}
+        metrics = metrics or BridgeMetrics()
+        self._events = metrics.counter(
+            "bridge_admission_events_total",
+            "Messages admitted or shed by the per-guild admission controller.",
+            ("guild", "result"),
+        )
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    def admit(self, guild_id: int, channel_id: int) -> AdmissionDecision:
+        now = self._clock()
+        guild_bucket = _bucket(self._guild_buckets, guild_id, self._guild_rate, self._guild_burst, now)
+        channel_key = (guild_id, channel_id)
+        channel_bucket = _bucket(
+            self._channel_buckets, channel_key, self._channel_rate, self._channel_burst, now
+        )
+
+        scope = None
+        if channel_bucket.tokens(now) < 1.0:
+            scope = "channel"
+        elif guild_bucket.tokens(now) < 1.0:
+            scope = "guild"
+        if scope is not None:
+            shed = self._shed_counts.get(channel_key, 0) + 1
+            self._shed_counts[channel_key] = shed
+            if shed == 1:
+                LOGGER.warning(
+                    "流量制限によりメッセージの転送を抑止しています: guild_id=%s channel_id=%s scope=%s",
+                    guild_id,
+                    channel_id,
+                    scope,
+                )
+            self._events.labels(guild=guild_id, result=f"shed_{scope}").inc()
+            return AdmissionDecision(admitted=False, scope=scope)
+
+        guild_bucket.take(now)
+        channel_bucket.take(now)
+        self._events.labels(guild=guild_id, result="admitted").inc()
+        shed_before = self._shed_counts.pop(channel_key, 0)
+        if shed_before:
+            LOGGER.info(
+                "流量制限を解除しました: guild_id=%s channel_id=%s shed=%s",
+                guild_id,
+                channel_id,
+                shed_before,
+            )
+        if self._policy != "summarize":
+            shed_before = 0
+        return AdmissionDecision(admitted=True, shed_before=shed_before)
+
+
+def _bucket(
+    buckets: OrderedDict[_K, TokenBucket],
+    key: _K,
+    rate: float,
+    burst: float,
+    now: float,
+) -> TokenBucket:
+    bucket = buckets.get(key)
+    if bucket is None:
+        bucket = buckets[key] = TokenBucket(rate=rate, burst=burst, now=now)
+        if len(buckets) > MAX_TRACKED_BUCKETS:
+            buckets.popitem(last=False)
+    else:
+        buckets.move_to_end(key)
+    return bucket
+
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionDecision",
+    "SHED_POLICIES",
+    "TokenBucket",
+]
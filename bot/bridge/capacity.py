@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+from .routes import ChannelEndpoint, ChannelRoute
+
+#: REST calls the manager makes per mirror: edits and reaction syncs fetch the
+#: mirror before patching it (see ``_edit_mirror`` / ``handle_reaction``).
+CALLS_PER_MIRROR_SEND = 1
+CALLS_PER_MIRROR_EDIT = 2
+CALLS_PER_MIRROR_REACTION = 2
+
+
+@dataclass(frozen=True, slots=True)
+class DiscordLimits:
+    """Published Discord rate limits, in requests per second."""
+
+    global_rate: float = 50.0
+    #: POST /channels/{id}/messages: 5 per 5 seconds per channel.
+    channel_message_rate: float = 1.0
+    #: PATCH /channels/{id}/messages/{id}: 5 per 5 seconds per channel.
+    channel_edit_rate: float = 1.0
+    #: PUT .../reactions/{emoji}/@me: 1 per 0.25 seconds per channel.
+    channel_reaction_rate: float = 4.0
+
+
+@dataclass(frozen=True, slots=True)
+class TrafficProfile:
+    """Expected activity of every source channel."""
+
+    messages_per_minute: float = 10.0
+    #: Fraction of messages that are edited once.
+    edit_ratio: float = 0.1
+    #: Reaction changes that reach the mirrors, per message.
+    reactions_per_message: float = 0.5
+
+    @property
+    def message_rate(self) -> float:
+        return self.messages_per_minute / 60
+
+
+@dataclass(frozen=True, slots=True)
+class SourceFanout:
+    endpoint: ChannelEndpoint
+    fanout: int
+
+    @property
+    def calls_per_message(self) -> int:
+        return self.fanout * CALLS_PER_MIRROR_SEND
+
+    @property
+    def calls_per_edit(self) -> int:
+        return self.fanout * CALLS_PER_MIRROR_EDIT
+
+    @property
+    def calls_per_reaction(self) -> int:
+        return self.fanout * CALLS_PER_MIRROR_REACTION
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelLoad:
+    """Projected mirror traffic into one destination channel, in requests per second."""
+
+    endpoint: ChannelEndpoint
+    sources: int
+    message_rate: float
+    edit_rate: float
+    reaction_rate: float
+    utilization: float
+
+    @property
+    def headroom(self) -> float:
+        return 1.0 - self.utilization
+
+
+@dataclass(frozen=True, slots=True)
+class CapacityReport:
+    route_count: int
+    traffic: TrafficProfile
+    limits: DiscordLimits
+    sources: List[SourceFanout] = field(default_factory=list)
+    destinations: List[ChannelLoad] = field(default_factory=list)
+    requests_per_second: float = 0.0
+
+    @property
+    def global_utilization(self) -> float:
+        return self.requests_per_second / self.limits.global_rate
+
+    @property
+    def saturated(self) -> bool:
+        return self.global_utilization >= 1.0 or any(load.utilization >= 1.0 for load in self.destinations)
+
+
+def analyze_routes(
+    routes: Sequence[ChannelRoute],
+    *,
+    traffic: TrafficProfile = TrafficProfile(),
+    limits: DiscordLimits = DiscordLimits(),
+) -> CapacityReport:
+    """Project the REST traffic ``routes`` generate for ``traffic``.
+
+    Sources are ordered by fan-out and destinations by utilization, busiest
+    first. Mirrored messages are never mirrored again, so each source message
+    costs exactly one send per route.
+    """
+    outbound: Dict[Tuple[int, int], Tuple[ChannelEndpoint, int]] = {}
+    inbound: Dict[Tuple[int, int], Tuple[ChannelEndpoint, int]] = {}
+    for route in routes:
+        endpoint, count = outbound.get(route.src.key(), (route.src, 0))
+        outbound[route.src.key()] = (endpoint, count + 1)
+        endpoint, count = inbound.get(route.dst.key(), (route.dst, 0))
+        inbound[route.dst.key()] = (endpoint, count + 1)
+
+    rate = traffic.message_rate
+    destinations = []
+    for endpoint, count in inbound.values():
+        message_rate = count * rate * CALLS_PER_MIRROR_SEND
+        edit_rate = count * rate * traffic.edit_ratio
+        reaction_rate = count * rate * traffic.reactions_per_message
+        destinations.append(
+            ChannelLoad(
+                endpoint=endpoint,
+                sources=count,
+                message_rate=message_rate,
+                edit_rate=edit_rate,
+                reaction_rate=reaction_rate,
+                utilization=max(
+                    message_rate / limits.channel_message_rate,
+                    edit_rate / limits.channel_edit_rate,
+                    reaction_rate / limits.channel_reaction_rate,
+                ),
+            )
+        )
+    destinations.sort(key=lambda load: load.utilization, reverse=True)
+
+    sources = [SourceFanout(endpoint=endpoint, fanout=count) for endpoint, count in outbound.values()]
+    sources.sort(key=lambda source: source.fanout, reverse=True)
+    requests_per_second = sum(
+        rate
+        * (
+            source.calls_per_message
+            + traffic.edit_ratio * source.calls_per_edit
+            + traffic.reactions_per_message * source.calls_per_reaction
+        )
+        for source in sources
+    )
+    return CapacityReport(
+        route_count=len(routes),
+        traffic=traffic,
+        limits=limits,
+        sources=sources,
+        destinations=destinations,
+        requests_per_second=requests_per_second,
+    )
+
+
+def format_capacity_report(report: CapacityReport, *, top: int = 10, warn_at: float = 0.8) -> List[str]:
+    """Render ``report`` as the lines printed by ``bridge-routes-cli analyze``."""
+    traffic = report.traffic
+    lines = [
+        f"ルート数: {report.route_count} (送信元 {len(report.sources)} / 送信先 {len(report.destinations)} チャンネル)",
+        f"想定トラフィック: 送信元チャンネルごとに {traffic.messages_per_minute:g} 件/分、"
+        f"編集率 {traffic.edit_ratio:.0%}、リアクション {traffic.reactions_per_message:g} 件/メッセージ",
+    ]
+    if not report.sources:
+        return lines
+
+    fanouts = [source.fanout for source in report.sources]
+    lines.append("")
+    lines.append(
+        f"[ファンアウト] 最大 {max(fanouts)} / 平均 {sum(fanouts) / len(fanouts):.1f}"
+        f" (上位 {min(top, len(report.sources))} 件、REST 呼び出し数はメッセージ・編集・リアクション 1 件あたり)"
+    )
+    for source in report.sources[:top]:
+        lines.append(
+            f"  {source.endpoint.describe()}: 送信先 {source.fanout}"
+            f" / 送信 {source.calls_per_message} / 編集 {source.calls_per_edit}"
+            f" / リアクション {source.calls_per_reaction}"
+        )
+
+    lines.append("")
+    lines.append(
+        f"[全体] 約 {report.requests_per_second:.2f} req/s"
+        f" (グローバル上限 {report.limits.global_rate:g} req/s の {report.global_utilization:.0%})"
+        + _verdict(report.global_utilization, warn_at)
+    )
+
+    lines.append("")
+    lines.append(f"[送信先チャンネル] 使用率の高い順に上位 {min(top, len(report.destinations))} 件")
+    for load in report.destinations[:top]:
+        lines.append(
+            f"  {load.endpoint.describe()}: 流入元 {load.sources}"
+            f" / 送信 {load.message_rate:.2f} / 編集 {load.edit_rate:.2f} / リアクション {load.reaction_rate:.2f} req/s"
+            f" / 使用率 {load.utilization:.0%} (余裕 {load.headroom:.0%})"
+            + _verdict(load.utilization, warn_at)
+        )
+    over = sum(1 for load in report.destinations if load.utilization >= 1.0)
+    near = sum(1 for load in report.destinations if warn_at <= load.utilization < 1.0)
+    if over or near:
+        lines.append(f"  上限超過 {over} チャンネル / 上限接近 {near} チャンネル")
+    return lines
+
+
+def _verdict(utilization: float, warn_at: float) -> str:
+    if utilization >= 1.0:
+        return " [超過]"
+    if utilization >= warn_at:
+        return " [注意]"
+    return ""
+
+
+__all__ = [
+    "CapacityReport",
+    "ChannelLoad",
+    "DiscordLimits",
+    "SourceFanout",
+    "TrafficProfile",
+    "analyze_routes",
+    "format_capacity_report",
+]
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from .metrics import BridgeMetrics
+from .storage import BridgeStorageBackend
+
+LOGGER = logging.getLogger(__name__)
+
+CLUSTER_SCOPES = ("channel", "shard")
+_NODE_PREFIX = "node:"
+
+
+def channel_resource(channel_id: int) -> str:
+    return f"channel:{channel_id}"
+
+
+def shard_resource(shard_id: int) -> str:
+    return f"shard:{shard_id}"
+
+
+class LeaseCoordinator:
+    """Split bridge work between bot processes through lease rows in the store.
+
+    Every process holds a ``node:<owner_id>`` presence lease and claims a fair
+    share of ``resources`` (``channel:<id>`` or ``shard:<id>``), renewing them
+    every ``renew_interval`` seconds. Leases of a process that stops renewing
+    expire after ``ttl`` and are taken over by the survivors; a process holding
+    more than its share hands the surplus back when another process joins.
+    """
+
+    def __init__(
+        self,
+        backend: BridgeStorageBackend,
+        *,
+        owner_id: str,
+        scope: str,
+        resources: Iterable[str],
+        ttl: float = 30.0,
+        renew_interval: float = 10.0,
+        max_owned: Optional[int] = None,
+        shard_count: Optional[int] = None,
+        metrics: Optional[BridgeMetrics] = None,
+    ) -> None:
+        if scope not in CLUSTER_SCOPES:
+            raise ValueError(f"unknown cluster scope: {scope}")
+        if renew_interval <= 0 or ttl <= renew_interval:
+            raise ValueError("ttl must be longer than the positive renew interval")
+        if scope == "shard" and not shard_count:
+            raise ValueError("shard scope requires shard_count")
+        self._backend = backend
+        self._owner_id = owner_id
+        self._scope = scope
+        self._resources: FrozenSet[str] = frozenset(resources)
+        self._ttl = ttl
+        self._renew_interval = renew_interval
+        self._max_owned = max_owned
+        self._shard_count = shard_count
+        self._pinned = False
+        self._owned: FrozenSet[str] = frozenset()
+        # 更新に失敗し続けた場合、TTL 経過後は他プロセスに奪われている可能性がある。
+        self._valid_until = 0.0
+        self._task: Optional[asyncio.Task[None]] = None
+        metrics = metrics or BridgeMetrics()
+        self._changes = metrics.counter(
+            "bridge_cluster_lease_changes_total",
+            "Lease ownership changes of this bot process.",
+            ("change",),
+        )
+        metrics.gauge(
+            "bridge_cluster_owned_leases",
+            "Work leases (channels or shards) currently held by this bot process.",
+        ).labels().set_function(lambda: len(self._owned))
+
+    @property
+    def owner_id(self) -> str:
+        return self._owner_id
+
+    @property
+    def scope(self) -> str:
+        return self._scope
+
+    @property
+    def owned(self) -> FrozenSet[str]:
+        return self._owned
+
+    def owned_shard_ids(self) -> List[int]:
+        return sorted(
+            int(resource.split(":", 1)[1]) for resource in self._owned if resource.startswith("shard:")
+        )
+
+    def owns(self, resource: str) -> bool:
+        return resource in self._owned and time.monotonic() < self._valid_until
+
+    def owns_event(self, guild_id: Optional[int], channel_id: int) -> bool:
+        """Return whether this process should handle an event of ``channel_id``."""
+        if self._scope == "channel":
+            return self.owns(channel_resource(channel_id))
+        shard_id = 0 if guild_id is None else (guild_id >> 22) % int(self._shard_count or 1)
+        return self.owns(shard_resource(shard_id))
+
+    def pin(self) -> None:
+        """Keep exactly the leases held now: renew and re-acquire them, never rebalance.
+
+        Used for shard ownership, where the gateway connections are opened for a
+        fixed set of shards at startup.
+        """
+        self._resources = self._owned
+        self._pinned = True
+
+    def rebalance(self) -> FrozenSet[str]:
+        """Renew held leases, hand back surplus and claim free resources (blocking)."""
+        started = time.monotonic()
+        self._backend.acquire_lease(_NODE_PREFIX + self._owner_id, self._owner_id, ttl=self._ttl)
+        holders: Dict[str, str] = {}
+        nodes: Set[str] = {self._owner_id}
+        for row in self._backend.list_active_leases():
+            resource = str(row["resource"])
+            if resource.startswith(_NODE_PREFIX):
+                nodes.add(str(row["owner"]))
+            elif resource in self._resources:
+                holders[resource] = str(row["owner"])
+
+        share = len(self._resources)
+        if not self._pinned:
+            share = math.ceil(share / len(nodes))
+            if self._max_owned is not None:
+                share = min(share, self._max_owned)
+
+        owned: Set[str] = set()
+        for resource in sorted(self._owned & self._resources):
+            if self._backend.acquire_lease(resource, self._owner_id, ttl=self._ttl):
+                owned.add(resource)
+            else:
+                self._changes.labels(change="lost").inc()
+                LOGGER.warning("リースを失いました: resource=%s owner=%s", resource, self._owner_id)
+        for resource in sorted(owned, reverse=True)[: max(0, len(owned) - share)]:
+            self._backend.release_lease(resource, self._owner_id)
+            owned.discard(resource)
+            self._changes.labels(change="released").inc()
+        for resource in sorted(self._resources):
+            if len(owned) >= share:
+                break
+            if resource in owned or holders.get(resource, self._owner_id) != self._owner_id:
+                continue
+            if self._backend.acquire_lease(resource, self._owner_id, ttl=self._ttl):
+                owned.add(resource)
+                self._changes.labels(change="acquired").inc()
+
+        if owned != self._owned:
+            LOGGER.info(
+                "担当リースを更新しました: owner=%s scope=%s owned=%s/%s nodes=%s",
+                self._owner_id,
+                self._scope,
+                len(owned),
+                len(self._resources),
+                len(nodes),
+            )
+        self._owned = frozenset(owned)
+        self._valid_until = started + self._ttl
+        return self._owned
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        await asyncio.to_thread(self.rebalance)
+        self._task = asyncio.create_task(self._run(), name="bridge-cluster-leases")
+
+    async def close(self) -> None:
+        """Stop renewing and release every lease so other processes can take over."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        owned, self._owned = self._owned, frozenset()
+        await asyncio.to_thread(self._release_all, owned)
+
+    def _release_all(self, owned: Iterable[str]) -> None:
+        for resource in (*owned, _NODE_PREFIX + self._owner_id):
+            try:
+                self._backend.release_lease(resource, self._owner_id)
+            except Exception as exc:
+                LOGGER.warning("リースの解放に失敗しました: resource=%s error=%s", resource, exc)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._renew_interval)
+            try:
+                await asyncio.to_thread(self.rebalance)
+            except Exception as exc:
+                LOGGER.warning("リースの更新に失敗しました: owner=%s error=%s", self._owner_id, exc)
+
+
+__all__ = [
+    "CLUSTER_SCOPES",
+    "LeaseCoordinator",
+    "channel_resource",
+    "shard_resource",
+]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from .metrics import BridgeMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+EventHandler = Callable[[], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class _DispatchItem:
+    kind: str
+    channel_id: int
+    handler: EventHandler
+    enqueued_at: float
+
+
+class BridgeEventDispatcher:
+    """Run gateway events on a sharded worker pool.
+
+    Events are routed to a shard by their source channel id. Each shard owns a
+    bounded FIFO queue drained by a single worker, so events from one channel
+    are handled strictly in arrival order (edit after create, reaction after
+    create) while different channels proceed in parallel across shards.
+
+    When a shard queue is full the ``overflow`` policy decides what happens:
+    ``block`` waits for room (back-pressure on the gateway reader),
+    ``drop_newest`` discards the incoming event and ``drop_oldest`` discards
+    the event at the head of the queue.
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int,
+        queue_size: int,
+        overflow: str = "block",
+        metrics: Optional[BridgeMetrics] = None,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        if queue_size < 1:
+            raise ValueError("queue_size must be positive")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow}")
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._queues: List[asyncio.Queue[_DispatchItem]] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(shards)
+        ]
+        self._workers: List[asyncio.Task[None]] = []
+        metrics = metrics or BridgeMetrics()
+        self._events = metrics.counter(
+            "bridge_dispatch_events_total",
+            "Gateway events handled by the dispatcher.",
+            ("kind", "result"),
+        )
+        self._wait = metrics.histogram(
+            "bridge_dispatch_queue_wait_seconds",
+            "Time an event spent queued before a worker picked it up.",
+        )
+        metrics.gauge(
+            "bridge_queue_depth",
+            "Items currently waiting in bridge queues.",
+            ("queue",),
+        ).labels(queue="dispatch").set_function(lambda: sum(queue.qsize() for queue in self._queues))
+
+    @property
+    def shards(self) -> int:
+        return len(self._queues)
+
+    def shard_for(self, channel_id: int) -> int:
+        return channel_id % len(self._queues)
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._work(queue), name=f"bridge-dispatch-{index}")
+            for index, queue in enumerate(self._queues)
+        ]
+        LOGGER.info(
+            "イベントディスパッチャを開始しました: shards=%s queue_size=%s overflow=%s",
+            len(self._queues),
+            self._queue_size,
+            self._overflow,
+        )
+
+    async def submit(self, channel_id: int, kind: str, handler: EventHandler) -> bool:
+        """Queue ``handler`` behind earlier events of the same channel. Returns False if dropped."""
+        queue = self._queues[self.shard_for(channel_id)]
+        item = _DispatchItem(kind=kind, channel_id=channel_id, handler=handler, enqueued_at=time.perf_counter())
+        if self._overflow == "block":
+            await queue.put(item)
+            return True
+        if queue.full():
+            if self._overflow == "drop_newest":
+                self._drop(item)
+                return False
+            dropped = queue.get_nowait()
+            queue.task_done()
+            self._drop(dropped)
+        queue.put_nowait(item)
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        for queue in self._queues:
+            await queue.join()
+
+    async def close(self, *, drain_timeout: float = 0.0) -> None:
+        """Let workers finish queued events within ``drain_timeout`` and stop them."""
+        if not self._workers:
+            return
+        if drain_timeout > 0:
+            try:
+                await asyncio.wait_for(self.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                remaining = sum(queue.qsize() for queue in self._queues)
+                LOGGER.warning("未処理のイベント %s 件を破棄して終了します。", remaining)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _drop(self, item: _DispatchItem) -> None:
+        self._events.labels(kind=item.kind, result="dropped").inc()
+        LOGGER.warning(
+            "イベントキューが満杯のため破棄しました: kind=%s channel_id=%s policy=%s",
+            item.kind,
+            item.channel_id,
+            self._overflow,
+        )
+
+    async def _work(self, queue: asyncio.Queue[_DispatchItem]) -> None:
+        while True:
+            item = await queue.get()
+            try:
+                self._wait.observe(time.perf_counter() - item.enqueued_at)
+                await item.handler()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 - 1 件の失敗で同じシャードの後続を止めない
+                self._events.labels(kind=item.kind, result="failed").inc()
+                LOGGER.exception(
+                    "イベント処理中に例外が発生しました: kind=%s channel_id=%s",
+                    item.kind,
+                    item.channel_id,
+                )
+            else:
+                self._events.labels(kind=item.kind, result="processed").inc()
+            finally:
+                queue.task_done()
+
+
+__all__ = ["BridgeEventDispatcher", "OVERFLOW_POLICIES"]
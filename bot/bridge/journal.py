@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+import discord
+
+from .metrics import BridgeMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+OUTBOUND_KINDS = ("send", "edit", "reaction")
+
+#: Discord が同じ nonce の送信を重複として扱う期間 (秒)。数分とされているため短めに見積もる。
+OUTBOUND_NONCE_WINDOW = 120.0
+
+
+@dataclass(slots=True)
+class OutboundEntry:
+    """A Discord operation that failed transiently and is waiting to be retried."""
+
+    key: str
+    kind: str
+    data: Dict[str, Any]
+    attempts: int = 1
+    next_attempt_at: float = 0.0
+    created_at: float = field(default_factory=time.time)
+
+    def to_record(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "OutboundEntry":
+        return cls(
+            key=str(record["key"]),
+            kind=str(record["kind"]),
+            data=dict(record.get("data") or {}),
+            attempts=int(record.get("attempts", 1)),
+            next_attempt_at=float(record.get("next_attempt_at", 0.0)),
+            created_at=float(record.get("created_at", time.time())),
+        )
+
+
+class OutboundExpiredError(RuntimeError):
+    """Raised by an executor to drop an entry that can no longer be retried safely."""
+
+
+def outbound_nonce(source_id: int, channel_id: int) -> str:
+    """Return the deterministic message nonce used when mirroring ``source_id`` into a channel.
+
+    Discord deduplicates creates carrying the same nonce (``enforce_nonce``),
+    so a retried send never produces a second mirror.
+    """
+    return hashlib.sha1(f"{source_id}:{channel_id}".encode("ascii")).hexdigest()[:25]
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Return whether a failed Discord call is worth retrying later."""
+    if isinstance(exc, discord.DiscordServerError):
+        return True
+    if isinstance(exc, discord.HTTPException):
+        return exc.status == 429
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError))
+
+
+class OutboundJournal:
+    """Append-only JSON Lines journal of pending outbound operations.
+
+    ``put`` and ``done`` records are buffered in memory and written with a
+    single ``fsync`` per :meth:`flush`, so the cost of durability is amortised
+    over every record appended during the flush interval.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._handle: Optional[Any] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> List[OutboundEntry]:
+        """Replay the journal, compact it and return the entries still pending."""
+        pending: Dict[str, OutboundEntry] = {}
+        if self._path.exists():
+            with self._path.open("r", encoding="utf-8") as handle:
+                for line_number, line in enumerate(handle, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                        if record.get("op") == "done":
+                            pending.pop(str(record["key"]), None)
+                        else:
+                            entry = OutboundEntry.from_record(record["entry"])
+                            pending[entry.key] = entry
+                    except (ValueError, KeyError, TypeError) as exc:
+                        # 書き込み途中で停止した末尾行などは読み飛ばす。
+                        LOGGER.warning(
+                            "送信ジャーナルの行を読み飛ばしました: path=%s line=%s error=%s",
+                            self._path,
+                            line_number,
+                            exc,
+                        )
+        entries = list(pending.values())
+        self._compact(entries)
+        return entries
+
+    def put(self, entry: OutboundEntry) -> None:
+        self._append({"op": "put", "entry": entry.to_record()})
+
+    def done(self, key: str) -> None:
+        self._append({"op": "done", "key": key})
+
+    def flush(self) -> None:
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+            if not lines:
+                return
+            handle = self._open()
+            handle.write("".join(lines))
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def close(self, pending: Optional[List[OutboundEntry]] = None) -> None:
+        """Flush buffered records; rewrite the file with ``pending`` only when given."""
+        self.flush()
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+        if pending is not None:
+            self._compact(pending)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+
+    def _open(self) -> Any:
+        if self._handle is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self._path.open("a", encoding="utf-8")
+        return self._handle
+
+    def _compact(self, entries: List[OutboundEntry]) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            if not entries and not self._path.exists():
+                return
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self._path.with_suffix(self._path.suffix + ".tmp")
+            with temporary.open("w", encoding="utf-8") as handle:
+                for entry in entries:
+                    record = {"op": "put", "entry": entry.to_record()}
+                    handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary, self._path)
+
+
+OutboundExecutor = Callable[[OutboundEntry], Awaitable[None]]
+
+
+class OutboundRetryQueue:
+    """Retry journaled outbound operations with exponential backoff.
+
+    Entries are keyed so that a newer failure for the same target replaces the
+    older one (for example the latest edit of a mirror). The executor raises to
+    signal failure; retryable errors are rescheduled until ``max_attempts`` is
+    reached and anything else drops the entry.
+    """
+
+    def __init__(
+        self,
+        journal: OutboundJournal,
+        *,
+        base_delay: float = 2.0,
+        max_delay: float = 300.0,
+        max_attempts: int = 8,
+        fsync_interval: float = 0.2,
+        metrics: Optional[BridgeMetrics] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._journal = journal
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._max_attempts = max_attempts
+        self._fsync_interval = fsync_interval
+        self._clock = clock
+        self._entries: Dict[str, OutboundEntry] = {}
+        self._executor: Optional[OutboundExecutor] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        metrics = metrics or BridgeMetrics()
+        self._results = metrics.counter(
+            "bridge_outbound_retries_total",
+            "Outcome of journaled outbound retries.",
+            ("kind", "result"),
+        )
+        metrics.gauge(
+            "bridge_queue_depth",
+            "Items currently waiting in bridge queues.",
+            ("queue",),
+        ).labels(queue="outbound_retry").set_function(lambda: len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bind(self, executor: OutboundExecutor) -> None:
+        self._executor = executor
+
+    def pending(self) -> List[OutboundEntry]:
+        return list(self._entries.values())
+
+    def age(self, entry: OutboundEntry) -> float:
+        """Seconds since ``entry`` first failed."""
+        return self._clock() - entry.created_at
+
+    def submit(self, kind: str, key: str, data: Dict[str, Any]) -> OutboundEntry:
+        """Journal a failed operation for retry, replacing any pending entry with the same key."""
+        if kind not in OUTBOUND_KINDS:
+            raise ValueError(f"unknown outbound kind: {kind}")
+        previous = self._entries.get(key)
+        entry = OutboundEntry(
+            key=key,
+            kind=kind,
+            data=data,
+            attempts=previous.attempts if previous is not None else 1,
+            created_at=previous.created_at if previous is not None else self._clock(),
+        )
+        entry.next_attempt_at = self._clock() + self._backoff(entry.attempts)
+        self._entries[key] = entry
+        self._journal.put(entry)
+        self._results.labels(kind=kind, result="queued").inc()
+        return entry
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        for entry in await asyncio.to_thread(self._journal.load):
+            self._entries[entry.key] = entry
+        if self._entries:
+            LOGGER.info("送信ジャーナルから %s 件の再送待ちを復元しました。", len(self._entries))
+        self._task = asyncio.create_task(self._run(), name="bridge-outbound-retry")
+
+    async def close(self, *, drain_timeout: float = 0.0) -> None:
+        """Stop retrying; try pending entries once within ``drain_timeout`` and persist the rest."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if drain_timeout > 0 and self._entries:
+            try:
+                await asyncio.wait_for(self.run_due(force=True), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                LOGGER.warning("送信ジャーナルの排出がタイムアウトしました。残りは次回起動時に再送します。")
+        await asyncio.to_thread(self._journal.close, self.pending())
+        if self._entries:
+            LOGGER.info("再送待ち %s 件を送信ジャーナルに保存しました。", len(self._entries))
+
+    async def run_due(self, *, force: bool = False) -> int:
+        """Execute every entry whose backoff has elapsed. Returns how many were attempted."""
+        if self._executor is None:
+            return 0
+        now = self._clock()
+        due = [
+            entry
+            for entry in sorted(self._entries.values(), key=lambda item: item.next_attempt_at)
+            if force or entry.next_attempt_at <= now
+        ]
+        for entry in due:
+            await self._attempt(entry)
+        return len(due)
+
+    async def _attempt(self, entry: OutboundEntry) -> None:
+        assert self._executor is not None
+        try:
+            await self._executor(entry)
+        except Exception as exc:  # noqa: BLE001 - 失敗内容に応じて再試行か破棄を決める
+            if self._entries.get(entry.key) is not entry:
+                return
+            if not is_retryable_error(exc) or entry.attempts >= self._max_attempts:
+                LOGGER.warning(
+                    "再送を断念しました: kind=%s key=%s attempts=%s error=%s",
+                    entry.kind,
+                    entry.key,
+                    entry.attempts,
+                    exc,
+                )
+                self._finish(entry, result="dropped")
+                return
+            entry.attempts += 1
+            entry.next_attempt_at = self._clock() + self._backoff(entry.attempts)
+            self._journal.put(entry)
+            self._results.labels(kind=entry.kind, result="retried").inc()
+            return
+        if self._entries.get(entry.key) is entry:
+            self._finish(entry, result="succeeded")
+
+    def _finish(self, entry: OutboundEntry, *, result: str) -> None:
+        self._entries.pop(entry.key, None)
+        self._journal.done(entry.key)
+        self._results.labels(kind=entry.kind, result=result).inc()
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self._max_delay, self._base_delay * (2 ** max(attempts - 1, 0)))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 - ループを止めない
+                LOGGER.exception("再送処理で予期しないエラーが発生しました。")
+            await asyncio.to_thread(self._journal.flush)
+            await asyncio.sleep(self._fsync_interval)
+
+
+__all__ = [
+    "OUTBOUND_KINDS",
+    "OUTBOUND_NONCE_WINDOW",
+    "OutboundEntry",
+    "OutboundExpiredError",
+    "OutboundJournal",
+    "OutboundRetryQueue",
+    "is_retryable_error",
+    "outbound_nonce",
+]
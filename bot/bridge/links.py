@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+#: Channel recorded for a member whose location is unknown (never matches a lookup).
+UNKNOWN_CHANNEL = 0
+
+
+class LinkGroupIndex:
+    """Every copy of a bridged message (the source and its mirrors) as one group.
+
+    A group is keyed by the source message id and holds its members as a flat
+    ``array('Q')`` of ``(channel_id, message_id)`` pairs, source first. Each
+    member maps to its group with a single dict entry, so finding all copies of
+    any copy is one lookup, and a message with ``n`` mirrors costs ``n + 1``
+    dict entries and one array instead of ``n + 1`` sets plus a per-channel
+    index.
+    """
+
+    __slots__ = ("_group_of", "_members")
+
+    def __init__(self) -> None:
+        self._group_of: Dict[int, int] = {}
+        self._members: Dict[int, array] = {}
+
+    def __contains__(self, message_id: object) -> bool:
+        return message_id in self._group_of
+
+    def __len__(self) -> int:
+        """Number of groups."""
+        return len(self._members)
+
+    def member_count(self) -> int:
+        return len(self._group_of)
+
+    def message_ids(self) -> Iterator[int]:
+        return iter(self._group_of)
+
+    def link(
+        self,
+        source_id: int,
+        source_channel: Optional[int],
+        mirror_id: int,
+        mirror_channel: Optional[int],
+    ) -> None:
+        """Add ``mirror_id`` to the group of ``source_id``, creating the group if needed."""
+        members = self._members.get(source_id)
+        if members is None:
+            if source_id in self._group_of:
+                self.discard(source_id)
+            members = self._members[source_id] = array("Q", (source_channel or UNKNOWN_CHANNEL, source_id))
+            self._group_of[source_id] = source_id
+        group_id = self._group_of.get(mirror_id)
+        if group_id == source_id:
+            return
+        if group_id is not None:
+            # 別のグループに属していたミラーは移し替える。
+            self.discard(mirror_id)
+        members.extend((mirror_channel or UNKNOWN_CHANNEL, mirror_id))
+        self._group_of[mirror_id] = source_id
+
+    def discard(self, message_id: int) -> List[int]:
+        """Remove ``message_id`` from its group.
+
+        A group left with a single member is dissolved; that member's id is
+        returned so the caller can drop its remaining state.
+        """
+        group_id = self._group_of.pop(message_id, None)
+        if group_id is None:
+            return []
+        members = self._members[group_id]
+        if message_id == group_id:
+            orphans = [int(members[index]) for index in range(3, len(members), 2)]
+            for orphan in orphans:
+                del self._group_of[orphan]
+            del self._members[group_id]
+            return orphans
+        for index in range(3, len(members), 2):
+            if members[index] == message_id:
+                del members[index - 1 : index + 1]
+                break
+        if len(members) > 2:
+            return []
+        # 送信元だけが残ったグループは解消する。
+        del self._members[group_id]
+        del self._group_of[group_id]
+        return [group_id]
+
+    def source_of(self, message_id: int) -> Optional[int]:
+        return self._group_of.get(message_id)
+
+    def is_mirror(self, message_id: int) -> bool:
+        group_id = self._group_of.get(message_id)
+        return group_id is not None and group_id != message_id
+
+    def members(self, message_id: int) -> List[Tuple[int, int]]:
+        """``(channel_id, message_id)`` of every copy in the group of ``message_id``, source first."""
+        group_id = self._group_of.get(message_id)
+        if group_id is None:
+            return []
+        members = self._members[group_id]
+        return [(int(members[index]), int(members[index + 1])) for index in range(0, len(members), 2)]
+
+    def siblings(self, message_id: int) -> List[int]:
+        """Every other copy of ``message_id``.
+
+        For a source these are its mirrors; for a mirror, the source and the
+        sibling mirrors in the other destinations.
+        """
+        group_id = self._group_of.get(message_id)
+        if group_id is None:
+            return []
+        members = self._members[group_id]
+        return [int(members[index]) for index in range(1, len(members), 2) if members[index] != message_id]
+
+    def mirrors(self, source_id: int) -> List[int]:
+        """Mirror ids of ``source_id`` (empty unless it is the source of a group)."""
+        members = self._members.get(source_id)
+        if members is None:
+            return []
+        return [int(members[index]) for index in range(3, len(members), 2)]
+
+    def copy_in(self, message_id: int, channel_id: int) -> Optional[int]:
+        """Return the copy of ``message_id`` that lives in ``channel_id``, if any."""
+        group_id = self._group_of.get(message_id)
+        if group_id is None:
+            return None
+        members = self._members[group_id]
+        for index in range(0, len(members), 2):
+            if members[index] == channel_id:
+                return int(members[index + 1])
+        return None
+
+
+__all__ = ["LinkGroupIndex"]
@@ -1,24 +1,136 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import mimetypes
-from dataclasses import dataclass
-from datetime import date
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar, Union
 
 import discord
 
+from .admission import AdmissionController
 from .profiles import BridgeProfile, BridgeProfileStore
+from .journal import (
+    OUTBOUND_NONCE_WINDOW,
+    OutboundEntry,
+    OutboundExpiredError,
+    OutboundRetryQueue,
+    is_retryable_error,
+    outbound_nonce,
+)
 from .messages import (
     BridgeMessageAttachmentMetadata,
+    BridgeMessageRecord,
     BridgeMessageStore,
 )
+from .metrics import BridgeMetrics
+from .links import LinkGroupIndex
 from .routes import ChannelEndpoint, ChannelRoute
+from .stats import BridgeStatsSnapshot, RollingPercentiles, collect_bridge_stats, snowflake_lag
+from .transcode import MediaTranscoder, TranscodedMedia
 
 LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+#: Discord rejects bulk deletes for messages older than 14 days; keep a safety margin.
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+BULK_DELETE_MAX_MESSAGES = 100
+#: Upper bound of mirror ids remembered as deleted by the bridge itself.
+SELF_DELETED_CACHE_SIZE = 10_000
+#: Upper bound of reply targets remembered as having no mirrors in the store.
+REFERENCE_MISS_CACHE_SIZE = 10_000
+#: Upper bound of messages remembered as unknown to the store when hydrating shared links.
+HYDRATION_MISS_CACHE_SIZE = 10_000
+#: Seconds a hydration miss is trusted; another process may store the mirrors shortly after.
+HYDRATION_MISS_TTL = 60.0
+
+#: ``(edited_at timestamp, receive sequence)``; compared to discard stale edits.
+EditVersion = Tuple[float, int]
+
 ATTACHMENT_LABELS = {"image": "(画像)", "video": "(動画)", "audio": "(音声)", "default": "(ファイル)"}
+#: ``each`` uploads attachments to every destination, ``once`` only to the first
+#: one and ``relay`` only to a relay channel; the others link the uploaded copy.
+ATTACHMENT_FANOUT_MODES = ("each", "once", "relay")
+
+
+def mirror_payload_hash(
+    message: discord.Message,
+    *,
+    image_filename: Optional[str],
+    attachment_notes: Sequence[str],
+) -> str:
+    """Hash the parts of a source message that determine how its mirrors render.
+
+    Embed unfurls and other non-content updates leave the hash unchanged, so
+    the corresponding edit events can be skipped entirely.
+    """
+    reference = getattr(message, "reference", None)
+    material = json.dumps(
+        [
+            message.content or "",
+            [sticker.name for sticker in getattr(message, "stickers", None) or ()],
+            image_filename,
+            list(attachment_notes),
+            getattr(reference, "message_id", None),
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _fit_uploads(attachments: Sequence[Any], upload_limit: Optional[int]) -> List[bool]:
+    """Return, per attachment, whether it still fits ``upload_limit`` when re-uploaded.
+
+    Discord applies the limit to the whole request, so sizes accumulate in
+    message order; ``None`` means the limit is unknown and everything is uploaded.
+    """
+    if upload_limit is None:
+        return [True] * len(attachments)
+    fits: List[bool] = []
+    total = 0
+    for attachment in attachments:
+        size = int(getattr(attachment, "size", 0) or 0)
+        if total + size <= upload_limit:
+            total += size
+            fits.append(True)
+        else:
+            fits.append(False)
+    return fits
+
+
+def _embed_image_url(message: discord.Message) -> Optional[str]:
+    for embed in getattr(message, "embeds", None) or ():
+        url = getattr(getattr(embed, "image", None), "url", None)
+        if url and not url.startswith("attachment://"):
+            return url
+    return None
+
+
+class _EndpointLabel:
+    """Defer `ChannelEndpoint.describe()` until a log record is actually emitted."""
+
+    __slots__ = ("_endpoint",)
+
+    def __init__(self, endpoint: ChannelEndpoint) -> None:
+        self._endpoint = endpoint
+
+    def __str__(self) -> str:
+        return self._endpoint.describe()
+
+
+@dataclass(frozen=True, slots=True)
+class UploadedAttachment:
+    """CDN copy of a source attachment uploaded once and linked by other mirrors."""
+
+    url: str
+    transcoded: bool = False
 
 
 @dataclass(slots=True)
@@ -26,6 +138,9 @@ class AttachmentBundle:
     files: List[discord.File]
     image_filename: Optional[str]
     notes: List[str]
+    image_url: Optional[str] = None
+    #: ``(source attachment id, transcoded)`` for each entry of ``files``.
+    sources: List[Tuple[int, bool]] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -33,6 +148,18 @@ class MirrorPayload:
     embed: Optional[discord.Embed]
     content: Optional[str]
     files: List[discord.File]
+    file_sources: List[Tuple[int, bool]] = field(default_factory=list)
+
+
+def _uploaded_attachments(
+    sources: Sequence[Tuple[int, bool]],
+    message: discord.Message,
+) -> Dict[int, UploadedAttachment]:
+    """Map source attachment ids to the copies Discord stored for ``message``."""
+    return {
+        source_id: UploadedAttachment(url=attachment.url, transcoded=transcoded)
+        for (source_id, transcoded), attachment in zip(sources, getattr(message, "attachments", ()))
+    }
 
 
 class ChannelBridgeManager:
@@ -45,23 +172,193 @@ class ChannelBridgeManager:
         profile_store: BridgeProfileStore,
         message_store: BridgeMessageStore,
         routes: Sequence[ChannelRoute],
+        metrics: Optional[BridgeMetrics] = None,
+        propagate_deletes: bool = False,
+        delete_batch_window: float = 0.0,
+        retry_queue: Optional[OutboundRetryQueue] = None,
+        admission: Optional[AdmissionController] = None,
+        edit_debounce: float = 0.0,
+        shared_links: bool = False,
+        delivery_claims: bool = False,
+        seen_cache_size: int = 65536,
+        transcoder: Optional[MediaTranscoder] = None,
+        attachment_fanout: str = "each",
+        relay_channel_id: Optional[int] = None,
     ) -> None:
+        if attachment_fanout not in ATTACHMENT_FANOUT_MODES:
+            raise ValueError(f"unknown attachment fan-out mode: {attachment_fanout}")
+        if attachment_fanout == "relay" and relay_channel_id is None:
+            raise ValueError("relay fan-out requires relay_channel_id")
         self._client = client
         self._profile_store = profile_store
         self._message_store = message_store
         self._routes_by_source: Dict[Tuple[int, int], List[ChannelRoute]] = {}
-        self._message_links: Dict[int, Set[int]] = {}
+        self._route_channels: Set[int] = set()
+        # 送信元とそのミラーを 1 つのグループとして保持する。
+        self._links = LinkGroupIndex()
         self._message_locations: Dict[int, Tuple[Optional[int], int]] = {}
-        self._mirrored_message_ids: Set[int] = set()
+        self._reference_misses: OrderedDict[int, None] = OrderedDict()
         self._reaction_members: Dict[Tuple[int, str], Set[int]] = {}
+        self._self_deleted_ids: Dict[int, None] = {}
+        self._propagate_deletes = propagate_deletes
+        self._delete_batch_window = delete_batch_window
+        self._pending_mirror_deletes: Dict[int, List[int]] = {}
+        self._mirror_delete_flush: Optional[asyncio.Task[None]] = None
+        self._retry_queue = retry_queue
+        self._transcoder = transcoder
+        self._attachment_fanout = attachment_fanout
+        self._relay_channel_id = relay_channel_id
+        self._admission = admission
+        self._edit_debounce = max(0.0, edit_debounce)
+        self._edit_sequence = 0
+        # source_id -> newest version seen / applied, pending message and its lock.
+        self._edit_versions: Dict[int, EditVersion] = {}
+        self._applied_edit_versions: Dict[int, EditVersion] = {}
+        self._pending_edits: Dict[int, discord.Message] = {}
+        self._edit_locks: Dict[int, asyncio.Lock] = {}
+        self._edit_timers: Dict[int, asyncio.Task[None]] = {}
+        # セットされている間は待機中の編集タスクがデバウンスを待たずに反映する。
+        self._edit_flush = asyncio.Event()
+        self._payload_hashes: Dict[int, str] = {}
+        # 複数プロセス構成では、他プロセスが作ったリンクをストアから読み込む。
+        self._shared_links = shared_links
+        self._hydration_misses: OrderedDict[int, float] = OrderedDict()
+        # 再接続・再起動後に重複配信された MESSAGE_CREATE を弾くための前段キャッシュと、
+        # ストア上の (source, 送信先チャンネル) 単位の送信権。
+        self._delivery_claims = delivery_claims
+        self._seen_cache_size = max(1, seen_cache_size)
+        self._seen_sources: OrderedDict[int, None] = OrderedDict()
+        if retry_queue is not None:
+            retry_queue.bind(self._replay_outbound)
+        self._outbound_inflight = 0
+        self._started_at = time.monotonic()
+        self._mirror_lag = RollingPercentiles()
+        self._metrics = metrics or BridgeMetrics()
+        self._register_metrics()
         self._build_route_index(routes)
 
+    @property
+    def metrics(self) -> BridgeMetrics:
+        return self._metrics
+
+    def stats_snapshot(self, *, guild_id: Optional[int] = None) -> BridgeStatsSnapshot:
+        """Summarize throughput, errors, caches, queues and mirroring lag."""
+        return collect_bridge_stats(
+            self._metrics,
+            self._mirror_lag,
+            started_at=self._started_at,
+            guild_id=guild_id,
+        )
+
+    def _register_metrics(self) -> None:
+        metrics = self._metrics
+        self._stage_latency = metrics.histogram(
+            "bridge_stage_duration_seconds",
+            "Latency of each bridge pipeline stage.",
+            ("stage",),
+        )
+        self._store_latency = metrics.histogram(
+            "bridge_store_duration_seconds",
+            "Round-trip time of message store operations.",
+            ("operation",),
+        )
+        self._route_results = metrics.counter(
+            "bridge_route_messages_total",
+            "Mirrored messages per route and outcome.",
+            ("src", "dst", "result"),
+        )
+        self._shard_events = metrics.counter(
+            "bridge_shard_events_total",
+            "Gateway events received by the bridge per shard.",
+            ("shard", "event"),
+        )
+        self._shard_ready = metrics.gauge(
+            "bridge_shard_ready",
+            "1 while the gateway shard is connected and ready, 0 otherwise.",
+            ("shard",),
+        )
+        self._edit_results = metrics.counter(
+            "bridge_edits_total",
+            "Source edits by outcome; unchanged edits are skipped without touching mirrors.",
+            ("result",),
+        )
+        self._link_hydrations = metrics.counter(
+            "bridge_link_hydrations_total",
+            "Link lookups that fell back to the message store (shared link state).",
+            ("result",),
+        )
+        self._attachment_results = metrics.counter(
+            "bridge_attachments_total",
+            "Source attachments by outcome: uploaded, transcoded, reused from another upload, linked or failed.",
+            ("result",),
+        )
+        self._lag_histogram = metrics.histogram(
+            "bridge_mirror_lag_seconds",
+            "Time from source message creation to mirror creation, from snowflake timestamps.",
+            buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+        )
+        self._reference_remaps = metrics.counter(
+            "bridge_reference_remaps_total",
+            "Reply targets remapped to the mirror in the destination, by where the mirror was found.",
+            ("result",),
+        )
+        self._duplicates = metrics.counter(
+            "bridge_duplicate_deliveries_total",
+            "Duplicate source messages rejected before mirroring, by the layer that caught them.",
+            ("layer",),
+        )
+        self._mirror_deletes = metrics.counter(
+            "bridge_mirror_deletes_total",
+            "Mirrored messages deleted after their source was removed.",
+            ("method", "result"),
+        )
+        queue_depth = metrics.gauge(
+            "bridge_queue_depth",
+            "Items currently waiting in bridge queues.",
+            ("queue",),
+        )
+        queue_depth.labels(queue="outbound").set_function(lambda: self._outbound_inflight)
+        queue_depth.labels(queue="mirror_delete").set_function(
+            lambda: sum(len(ids) for ids in self._pending_mirror_deletes.values())
+        )
+        link_state = metrics.gauge(
+            "bridge_link_state_size",
+            "Entries held in the in-memory bridge link state.",
+            ("structure",),
+        )
+        link_state.labels(structure="message_links").set_function(self._links.member_count)
+        link_state.labels(structure="link_groups").set_function(lambda: len(self._links))
+        link_state.labels(structure="message_locations").set_function(
+            lambda: len(self._message_locations)
+        )
+        link_state.labels(structure="payload_hashes").set_function(
+            lambda: len(self._payload_hashes)
+        )
+        link_state.labels(structure="seen_sources").set_function(lambda: len(self._seen_sources))
+        link_state.labels(structure="reaction_members").set_function(
+            lambda: len(self._reaction_members)
+        )
+
     def _build_route_index(self, routes: Sequence[ChannelRoute]) -> None:
         for route in routes:
             key = route.src.key()
             self._routes_by_source.setdefault(key, []).append(route)
+            self._route_channels.update((route.src.channel, route.dst.channel))
         LOGGER.info("チャンネルブリッジルートを %s 件ロードしました。", len(routes))
 
+    def shard_for_guild(self, guild_id: Optional[int]) -> int:
+        """Return the gateway shard that carries ``guild_id`` (0 without sharding)."""
+        shard_count = getattr(self._client, "shard_count", None)
+        if guild_id is None or not isinstance(shard_count, int) or shard_count < 1:
+            return 0
+        return (guild_id >> 22) % shard_count
+
+    def record_shard_event(self, guild_id: Optional[int], event: str) -> None:
+        self._shard_events.labels(shard=self.shard_for_guild(guild_id), event=event).inc()
+
+    def set_shard_ready(self, shard_id: int, ready: bool) -> None:
+        self._shard_ready.labels(shard=shard_id).set(1 if ready else 0)
+
     def get_routes_from_guild(self, guild_id: int) -> Sequence[ChannelRoute]:
         matches: List[ChannelRoute] = []
         for (src_guild_id, _), routes in self._routes_by_source.items():
@@ -74,7 +371,7 @@ class ChannelBridgeManager:
             return
         if message.guild is None:
             return
-        if message.id in self._mirrored_message_ids:
+        if self._links.is_mirror(message.id):
             return
 
         key = (message.guild.id, message.channel.id)
@@ -82,113 +379,479 @@ class ChannelBridgeManager:
         if not routes:
             return
 
+        if message.id in self._seen_sources:
+            self._duplicates.labels(layer="memory").inc()
+            LOGGER.debug("重複したメッセージイベントを破棄しました: source=%s", message.id)
+            return
+        self._seen_sources[message.id] = None
+        if len(self._seen_sources) > self._seen_cache_size:
+            self._seen_sources.popitem(last=False)
+
+        if self._admission is not None:
+            decision = self._admission.admit(message.guild.id, message.channel.id)
+            if not decision.admitted:
+                return
+            if decision.shed_before:
+                await self._send_shed_summary(message, routes, decision.shed_before)
+
+        if self._delivery_claims:
+            routes = await self._claim_routes(message, routes)
+            if not routes:
+                return
+
         self._store_message_location(message)
         self._log_bridge_received(message=message, route_count=len(routes))
 
-        try:
-            profile = self._profile_store.get_profile(seed=f"{message.author.id}-{date.today().isoformat()}")
-            dicebear_failed = False
-        except Exception as exc:  # pragma: no cover - 外部APIの不調に備える
-            dicebear_failed = True
-            LOGGER.warning("DiceBear プロフィール生成に失敗しました: message_id=%s error=%s", message.id, exc)
-            bot_user = self._client.user
-            fallback_avatar = str(bot_user.display_avatar.url) if bot_user else ""
-            profile = BridgeProfile(seed="fallback", display_name="仮想伝令", avatar_url=fallback_avatar)
+        profile, dicebear_failed = self._generate_profile(message)
 
         new_destination_ids: List[int] = []
+        shared_uploads = await self._shared_uploads_for(message)
 
         for route in routes:
             destination = await self._resolve_channel(route.dst)
             if destination is None:
                 LOGGER.warning(
                     "ブリッジ先のチャンネルが見つかりません: %s",
-                    route.dst.describe(),
+                    _EndpointLabel(route.dst),
                 )
+                self._record_route_result(route, success=False)
+                await self._release_claim(message.id, route.dst.channel)
                 continue
 
             try:
-                payload = await self._build_mirror_payload(
-                    source_message=message,
+                mirrored = await self._send_mirror(
+                    message=message,
+                    route=route,
+                    destination=destination,
                     profile=profile,
                     dicebear_failed=dicebear_failed,
-                    target=route.dst,
+                    shared_uploads=shared_uploads,
                 )
-            except Exception as exc:  # pragma: no cover - 予期しないフォーマット崩れに備える
-                LOGGER.exception(
-                    "ミラーメッセージの生成に失敗しました。フォールバックを適用します: message_id=%s route=%s error=%s",
+            except discord.HTTPException as exc:
+                LOGGER.error(
+                    "メッセージブリッジ送信に失敗しました: source=%s dst=%s destination_channel_id=%s error=%s",
                     message.id,
-                    route,
+                    _EndpointLabel(route.dst),
+                    getattr(destination, "id", "unknown"),
                     exc,
                 )
-                payload = self._build_fallback_payload(
-                    source_message=message,
-                    profile=profile,
-                    target=route.dst,
+                self._record_route_result(route, success=False)
+                retrying = self._schedule_retry(
+                    exc,
+                    kind="send",
+                    key=f"send:{message.id}:{route.dst.channel}",
+                    data={
+                        "source_guild_id": message.guild.id,
+                        "source_channel_id": message.channel.id,
+                        "source_id": message.id,
+                        "dst_guild_id": route.dst.guild,
+                        "dst_channel_id": route.dst.channel,
+                    },
                 )
-            if payload is None:
+                if not retrying:
+                    await self._release_claim(message.id, route.dst.channel)
                 continue
+            if mirrored is not None:
+                new_destination_ids.append(mirrored.id)
 
-            send_kwargs = {"allowed_mentions": discord.AllowedMentions.none()}
-            if payload.files:
-                send_kwargs["files"] = payload.files
-            if payload.embed is not None:
-                send_kwargs["embed"] = payload.embed
-            if payload.content is not None:
-                send_kwargs["content"] = payload.content
+        if new_destination_ids:
+            await self._persist_destinations(
+                message,
+                destination_ids=new_destination_ids,
+                profile=profile,
+                dicebear_failed=dicebear_failed,
+            )
+
+    async def _shared_uploads_for(self, message: discord.Message) -> Optional[Dict[int, UploadedAttachment]]:
+        """Return the upload-once table for ``message``, or ``None`` to upload per destination.
 
-            self._log_bridge_send_start(message=message, route=route, payload=payload)
+        In ``relay`` mode the attachments are uploaded to the relay channel up
+        front. In ``once`` mode (or when the relay upload failed) the table
+        starts empty and is filled by the first send that uploads files.
+        """
+        if self._attachment_fanout == "each" or not message.attachments:
+            return None
+        uploads: Dict[int, UploadedAttachment] = {}
+        if self._attachment_fanout == "relay":
+            uploads.update(await self._upload_to_relay(message))
+        return uploads
+
+    async def _upload_to_relay(self, message: discord.Message) -> Dict[int, UploadedAttachment]:
+        try:
+            relay = await self._fetch_channel_by_id(int(self._relay_channel_id or 0))
+            with self._stage_latency.labels(stage="attachment_fetch").time():
+                bundle = await self._prepare_attachments(
+                    message.attachments,
+                    upload_limit=self._upload_limit(relay),
+                )
+            if not bundle.files:
+                return {}
+            with self._stage_latency.labels(stage="send").time():
+                uploaded = await relay.send(
+                    content=message.jump_url,
+                    files=bundle.files,
+                    allowed_mentions=discord.AllowedMentions.none(),
+                )
+        except discord.HTTPException as exc:
+            LOGGER.warning(
+                "中継チャンネルへのアップロードに失敗したため、送信先ごとに添付します: source=%s error=%s",
+                message.id,
+                exc,
+            )
+            return {}
+        return _uploaded_attachments(bundle.sources, uploaded)
+
+    async def _claim_routes(self, message: discord.Message, routes: Sequence[ChannelRoute]) -> List[ChannelRoute]:
+        """Keep the routes whose delivery this call claimed in the store.
+
+        A route already claimed was mirrored (or is being mirrored) by an earlier
+        delivery of the same event, possibly before a restart or by another
+        process. If the store is unavailable every route is kept.
+        """
+        try:
+            granted = set(
+                await asyncio.to_thread(
+                    self._call_store,
+                    "claim",
+                    self._message_store.claim_deliveries,
+                    message.id,
+                    [route.dst.channel for route in routes],
+                )
+            )
+        except Exception as exc:
+            LOGGER.warning("送信権の記録に失敗したため重複確認を省略します: source=%s error=%s", message.id, exc)
+            return list(routes)
+        claimed = [route for route in routes if route.dst.channel in granted]
+        if len(claimed) < len(routes):
+            self._duplicates.labels(layer="store").inc(len(routes) - len(claimed))
+            LOGGER.info(
+                "送信済みのメッセージを再送しませんでした: source=%s skipped=%s",
+                message.id,
+                len(routes) - len(claimed),
+            )
+        return claimed
+
+    async def _release_claim(self, source_id: int, channel_id: int) -> None:
+        if not self._delivery_claims:
+            return
+        try:
+            await asyncio.to_thread(
+                self._call_store, "release_claim", self._message_store.release_delivery, source_id, channel_id
+            )
+        except Exception as exc:
+            LOGGER.warning("送信権の解放に失敗しました: source=%s channel_id=%s error=%s", source_id, channel_id, exc)
+
+    async def _send_shed_summary(
+        self,
+        message: discord.Message,
+        routes: Sequence[ChannelRoute],
+        shed_count: int,
+    ) -> None:
+        """Post one notice per destination for messages shed by admission control."""
+        channel_name = getattr(message.channel, "name", None) or message.channel.id
+        content = f"⚠️ 流量制限のため #{channel_name} からの {shed_count} 件のメッセージを転送しませんでした。"
+        for route in routes:
+            destination = await self._resolve_channel(route.dst)
+            if destination is None:
+                continue
             try:
-                mirrored = await destination.send(**send_kwargs)
+                await destination.send(
+                    content=content,
+                    allowed_mentions=discord.AllowedMentions.none(),
+                )
             except discord.HTTPException as exc:
-                LOGGER.error(
-                    "メッセージブリッジ送信に失敗しました: source=%s dst=%s destination_channel_id=%s error=%s",
-                    message.id,
-                    route.dst.describe(),
-                    getattr(destination, "id", "unknown"),
+                LOGGER.warning(
+                    "流量制限の通知に失敗しました: dst=%s error=%s",
+                    _EndpointLabel(route.dst),
                     exc,
                 )
-                continue
 
-            self._store_message_location(mirrored)
-            self._link_messages(message.id, mirrored.id)
-            self._mirrored_message_ids.add(mirrored.id)
-            new_destination_ids.append(mirrored.id)
-            self._log_bridge_send_success(
+    def _generate_profile(self, message: discord.Message) -> Tuple[BridgeProfile, bool]:
+        """Return the daily profile for the author and whether DiceBear generation failed."""
+        try:
+            with self._stage_latency.labels(stage="profile").time():
+                profile = self._profile_store.get_profile(
+                    seed=f"{message.author.id}-{date.today().isoformat()}"
+                )
+            return profile, False
+        except Exception as exc:  # pragma: no cover - 外部APIの不調に備える
+            LOGGER.warning("DiceBear プロフィール生成に失敗しました: message_id=%s error=%s", message.id, exc)
+            bot_user = self._client.user
+            fallback_avatar = str(bot_user.display_avatar.url) if bot_user else ""
+            return BridgeProfile(seed="fallback", display_name="仮想伝令", avatar_url=fallback_avatar), True
+
+    async def _persist_destinations(
+        self,
+        message: discord.Message,
+        *,
+        destination_ids: Sequence[int],
+        profile: BridgeProfile,
+        dicebear_failed: bool,
+    ) -> None:
+        image_filename, attachment_notes = self._summarize_attachment_notes(message.attachments)
+        metadata = BridgeMessageAttachmentMetadata(
+            image_filename=image_filename,
+            notes=attachment_notes,
+        )
+        payload_hash = mirror_payload_hash(
+            message,
+            image_filename=image_filename,
+            attachment_notes=attachment_notes,
+        )
+        self._payload_hashes[message.id] = payload_hash
+        locations = {
+            message_id: (location[0], location[1])
+            for message_id in (message.id, *destination_ids)
+            if (location := self._message_locations.get(message_id)) is not None
+            and location[0] is not None
+        }
+        await asyncio.to_thread(
+            self._call_store,
+            "upsert",
+            self._message_store.upsert,
+            source_id=message.id,
+            destination_ids=destination_ids,
+            profile_seed=profile.seed,
+            display_name=profile.display_name,
+            avatar_url=profile.avatar_url,
+            dicebear_failed=dicebear_failed,
+            attachments=metadata,
+            payload_hash=payload_hash,
+            locations=locations,
+        )
+
+    async def _send_mirror(
+        self,
+        *,
+        message: discord.Message,
+        route: ChannelRoute,
+        destination: discord.abc.Messageable,
+        profile: BridgeProfile,
+        dicebear_failed: bool,
+        shared_uploads: Optional[Dict[int, UploadedAttachment]] = None,
+    ) -> Optional[discord.Message]:
+        """Render and send one mirror, then register it in the link state.
+
+        Raises ``discord.HTTPException`` when the send fails. The nonce is
+        derived from the source and destination so a retried send is
+        deduplicated by Discord. A non-empty ``shared_uploads`` table is linked
+        instead of uploading; an empty one is filled from this send's files.
+        """
+        try:
+            payload = await self._build_mirror_payload(
                 source_message=message,
-                mirrored_message=mirrored,
-                route=route,
-                payload=payload,
+                profile=profile,
+                dicebear_failed=dicebear_failed,
+                target=route.dst,
+                upload_limit=self._upload_limit(destination),
+                shared_uploads=shared_uploads,
             )
-
-        if new_destination_ids:
-            image_filename, attachment_notes = self._summarize_attachment_notes(message.attachments)
-            metadata = BridgeMessageAttachmentMetadata(
-                image_filename=image_filename,
-                notes=attachment_notes,
+        except Exception as exc:  # pragma: no cover - 予期しないフォーマット崩れに備える
+            LOGGER.exception(
+                "ミラーメッセージの生成に失敗しました。フォールバックを適用します: message_id=%s route=%s error=%s",
+                message.id,
+                route,
+                exc,
             )
-            self._message_store.upsert(
-                source_id=message.id,
-                destination_ids=new_destination_ids,
-                profile_seed=profile.seed,
-                display_name=profile.display_name,
-                avatar_url=profile.avatar_url,
-                dicebear_failed=dicebear_failed,
-                attachments=metadata,
+            payload = self._build_fallback_payload(
+                source_message=message,
+                profile=profile,
+                target=route.dst,
             )
+        if payload is None:
+            return None
+
+        send_kwargs = {
+            "allowed_mentions": discord.AllowedMentions.none(),
+            "nonce": outbound_nonce(message.id, route.dst.channel),
+        }
+        if payload.files:
+            send_kwargs["files"] = payload.files
+        if payload.embed is not None:
+            send_kwargs["embed"] = payload.embed
+        if payload.content is not None:
+            send_kwargs["content"] = payload.content
+
+        self._log_bridge_send_start(message=message, route=route, payload=payload)
+        self._outbound_inflight += 1
+        try:
+            with self._stage_latency.labels(stage="send").time():
+                mirrored = await destination.send(**send_kwargs)
+        finally:
+            self._outbound_inflight -= 1
+
+        lag = snowflake_lag(message.id, mirrored.id)
+        self._mirror_lag.observe(lag)
+        self._lag_histogram.observe(lag)
+        if shared_uploads is not None and not shared_uploads and payload.file_sources:
+            shared_uploads.update(_uploaded_attachments(payload.file_sources, mirrored))
+        self._store_message_location(mirrored)
+        self._link_messages(message.id, mirrored.id)
+        self._record_route_result(route, success=True)
+        self._log_bridge_send_success(
+            source_message=message,
+            mirrored_message=mirrored,
+            route=route,
+            payload=payload,
+        )
+        return mirrored
 
     async def handle_message_edit(self, before: discord.Message, after: discord.Message) -> None:
         if after.author.bot:
             return
         if after.guild is None:
             return
-        if after.id in self._mirrored_message_ids:
+        await self._hydrate_links(after.id, after.channel.id)
+        if self._links.is_mirror(after.id):
+            return
+
+        if not self._links.mirrors(after.id):
+            return
+
+        version = self._next_edit_version(after)
+        latest = self._edit_versions.get(after.id)
+        if latest is not None and version <= latest:
+            LOGGER.debug("古い編集イベントを破棄しました: source=%s", after.id)
+            return
+        self._edit_versions[after.id] = version
+        self._pending_edits[after.id] = after
+
+        if self._edit_debounce > 0:
+            if after.id not in self._edit_timers:
+                self._edit_timers[after.id] = asyncio.create_task(
+                    self._apply_edit_later(after.id),
+                    name=f"bridge-edit-{after.id}",
+                )
             return
+        await self._apply_pending_edit(after.id)
 
-        linked_ids = self._message_links.get(after.id)
+    async def flush_pending_edits(self) -> None:
+        """Apply every debounced edit immediately and wait for edits already being applied."""
+        self._edit_flush.set()
+        try:
+            while self._edit_timers:
+                await asyncio.gather(*list(self._edit_timers.values()), return_exceptions=True)
+            for source_id in list(self._pending_edits):
+                await self._apply_pending_edit(source_id)
+        finally:
+            self._edit_flush.clear()
+
+    def _next_edit_version(self, after: discord.Message) -> EditVersion:
+        self._edit_sequence += 1
+        edited_at = getattr(after, "edited_at", None)
+        return (edited_at.timestamp() if edited_at is not None else 0.0, self._edit_sequence)
+
+    async def _apply_edit_later(self, source_id: int) -> None:
+        """Apply the pending edit of ``source_id`` once the debounce window passes.
+
+        The task stays in ``_edit_timers`` until the apply finishes. Edits that
+        arrive during an apply are handled by another round of the same task.
+        """
+        try:
+            while source_id in self._pending_edits:
+                try:
+                    await asyncio.wait_for(self._edit_flush.wait(), timeout=self._edit_debounce)
+                except asyncio.TimeoutError:
+                    pass
+                try:
+                    await self._apply_pending_edit(source_id)
+                except Exception:
+                    LOGGER.exception("ブリッジメッセージの編集の反映に失敗しました: source=%s", source_id)
+        finally:
+            if self._edit_timers.get(source_id) is asyncio.current_task():
+                self._edit_timers.pop(source_id, None)
+
+    async def _apply_pending_edit(self, source_id: int) -> None:
+        """Push the newest pending version of ``source_id`` to its mirrors.
+
+        Runs under a per-message lock so concurrent appliers are serialised, and
+        skips any version not newer than the one already applied.
+        """
+        lock = self._edit_locks.setdefault(source_id, asyncio.Lock())
+        async with lock:
+            after = self._pending_edits.pop(source_id, None)
+            version = self._edit_versions.get(source_id)
+            if after is None or version is None:
+                return
+            applied = self._applied_edit_versions.get(source_id)
+            if applied is not None and version <= applied:
+                return
+            await self._push_edit(after)
+            self._applied_edit_versions[source_id] = version
+
+    async def _push_edit(self, after: discord.Message) -> None:
+        linked_ids = self._links.mirrors(after.id)
         if not linked_ids:
             return
 
-        record = self._message_store.get(after.id)
+        source_image_filename, attachment_notes = self._summarize_attachment_notes(after.attachments)
+        payload_hash = mirror_payload_hash(
+            after,
+            image_filename=source_image_filename,
+            attachment_notes=attachment_notes,
+        )
+        if self._payload_hashes.get(after.id) == payload_hash:
+            self._edit_results.labels(result="unchanged").inc()
+            return
+
+        record = await asyncio.to_thread(self._call_store, "get", self._message_store.get, after.id)
+        if record is not None and record.payload_hash == payload_hash:
+            self._payload_hashes[after.id] = payload_hash
+            self._edit_results.labels(result="unchanged").inc()
+            return
+
+        profile, base_annotations = self._prepare_edit(after, record)
+        failed = False
+        for linked_id in list(linked_ids):
+            try:
+                await self._edit_mirror(
+                    after,
+                    linked_id,
+                    profile=profile,
+                    base_annotations=base_annotations,
+                )
+            except discord.HTTPException as exc:
+                LOGGER.warning(
+                    "ブリッジメッセージの編集に失敗しました: source=%s target=%s error=%s",
+                    after.id,
+                    linked_id,
+                    exc,
+                )
+                failed = True
+                self._schedule_retry(
+                    exc,
+                    kind="edit",
+                    key=f"edit:{linked_id}",
+                    data={
+                        "source_channel_id": after.channel.id,
+                        "source_id": after.id,
+                        "target_id": linked_id,
+                    },
+                )
+
+        self._edit_results.labels(result="failed" if failed else "applied").inc()
+        # 失敗したミラーがある場合は古いハッシュも消し、元の本文へ戻す編集も反映させる。
+        if failed:
+            self._payload_hashes.pop(after.id, None)
+        else:
+            self._payload_hashes[after.id] = payload_hash
+        if record is not None:
+            await asyncio.to_thread(
+                self._call_store,
+                "update_metadata",
+                self._message_store.update_metadata,
+                source_id=after.id,
+                attachments=BridgeMessageAttachmentMetadata(
+                    image_filename=source_image_filename,
+                    notes=attachment_notes,
+                ),
+                payload_hash=payload_hash,
+                clear_payload_hash=failed,
+            )
+
+    def _prepare_edit(
+        self, after: discord.Message, record: Optional[BridgeMessageRecord]
+    ) -> Tuple[BridgeProfile, List[str]]:
         if record is not None:
             dicebear_failed = record.dicebear_failed
             profile = BridgeProfile(
@@ -197,23 +860,7 @@ class ChannelBridgeManager:
                 avatar_url=record.avatar_url,
             )
         else:
-            dicebear_failed = False
-            try:
-                profile = self._profile_store.get_profile(
-                    seed=f"{after.author.id}-{date.today().isoformat()}"
-                )
-            except Exception as exc:  # pragma: no cover - 外部APIの不調に備える
-                dicebear_failed = True
-                LOGGER.warning(
-                    "DiceBear プロフィール生成に失敗しました: message_id=%s error=%s",
-                    after.id,
-                    exc,
-                )
-                bot_user = self._client.user
-                fallback_avatar = str(bot_user.display_avatar.url) if bot_user else ""
-                profile = BridgeProfile(seed="fallback", display_name="仮想伝令", avatar_url=fallback_avatar)
-
-        source_image_filename, attachment_notes = self._summarize_attachment_notes(after.attachments)
+            profile, dicebear_failed = self._generate_profile(after)
 
         base_annotations: List[str] = []
         if dicebear_failed:
@@ -221,38 +868,53 @@ class ChannelBridgeManager:
         if after.stickers:
             for sticker in after.stickers:
                 base_annotations.append(f"(ステッカー: {sticker.name})")
-        base_annotations.extend(attachment_notes)
+        return profile, base_annotations
 
-        for linked_id in list(linked_ids):
-            channel = await self._resolve_channel_for_message(linked_id)
-            if channel is None:
-                continue
+    async def _edit_mirror(
+        self,
+        after: discord.Message,
+        linked_id: int,
+        *,
+        profile: BridgeProfile,
+        base_annotations: Sequence[str],
+    ) -> None:
+        """Re-render one mirror of ``after``. Raises ``discord.HTTPException`` if the edit fails."""
+        channel = await self._resolve_channel_for_message(linked_id)
+        if channel is None:
+            return
 
-            try:
-                target_message = await channel.fetch_message(linked_id)
-            except discord.HTTPException as exc:
-                LOGGER.warning(
-                    "編集対象メッセージの取得に失敗しました: source=%s target=%s error=%s",
-                    after.id,
-                    linked_id,
-                    exc,
-                )
-                continue
+        try:
+            target_message = await channel.fetch_message(linked_id)
+        except discord.HTTPException as exc:
+            LOGGER.warning(
+                "編集対象メッセージの取得に失敗しました: source=%s target=%s error=%s",
+                after.id,
+                linked_id,
+                exc,
+            )
+            return
 
-            location = self._message_locations.get(linked_id)
-            if location is None:
-                continue
-            guild_id, channel_id = location
-            if guild_id is None:
-                continue
+        location = self._message_locations.get(linked_id)
+        if location is None:
+            return
+        guild_id, channel_id = location
+        if guild_id is None:
+            return
 
-            target_endpoint = ChannelEndpoint(guild=guild_id, channel=channel_id)
-            annotations = []
-            reference_line = self._format_reference(after, target=target_endpoint)
-            if reference_line:
-                annotations.append(reference_line)
-            annotations.extend(base_annotations)
+        target_endpoint = ChannelEndpoint(guild=guild_id, channel=channel_id)
+        annotations = []
+        reference_line = await self._format_reference(after, target=target_endpoint)
+        if reference_line:
+            annotations.append(reference_line)
+        annotations.extend(base_annotations)
+        # 添付の注記は送信先ごとのアップロード上限で変わるため、ミラー単位で組み立てる。
+        _, attachment_notes = self._summarize_attachment_notes(
+            after.attachments,
+            upload_limit=self._upload_limit(channel),
+        )
+        annotations.extend(attachment_notes)
 
+        with self._stage_latency.labels(stage="render").time():
             embed, content = self._compose_mirror_texts(
                 raw_content=after.content,
                 annotations=annotations,
@@ -260,32 +922,19 @@ class ChannelBridgeManager:
                 guild_id=after.guild.id,
             )
 
-            if embed is not None:
-                target_image_filename = self._select_image_attachment_filename(target_message.attachments)
-                if target_image_filename:
-                    embed.set_image(url=f"attachment://{target_image_filename}")
-
-            try:
-                await target_message.edit(
-                    embed=embed,
-                    content=content,
-                    allowed_mentions=discord.AllowedMentions.none(),
-                )
-            except discord.HTTPException as exc:
-                LOGGER.warning(
-                    "ブリッジメッセージの編集に失敗しました: source=%s target=%s error=%s",
-                    after.id,
-                    linked_id,
-                    exc,
-                )
-
-        if record is not None:
-            self._message_store.update_metadata(
-                source_id=after.id,
-                attachments=BridgeMessageAttachmentMetadata(
-                    image_filename=source_image_filename,
-                    notes=attachment_notes,
-                ),
+        if embed is not None:
+            target_image_filename = self._select_image_attachment_filename(target_message.attachments)
+            if target_image_filename:
+                embed.set_image(url=f"attachment://{target_image_filename}")
+            elif (linked_image := _embed_image_url(target_message)) is not None:
+                # 別のミラー (または中継チャンネル) へのアップロードを参照しているミラー。
+                embed.set_image(url=linked_image)
+
+        with self._stage_latency.labels(stage="edit").time():
+            await target_message.edit(
+                embed=embed,
+                content=content,
+                allowed_mentions=discord.AllowedMentions.none(),
             )
 
     async def handle_reaction(self, reaction: discord.Reaction, user: discord.abc.User, *, add: bool) -> None:
@@ -294,7 +943,9 @@ class ChannelBridgeManager:
 
         message = reaction.message
         self._store_message_location(message)
-        linked_ids = list(self._message_links.get(message.id, ()))
+        await self._hydrate_links(message.id, message.channel.id)
+        # ミラーへのリアクションは送信元と他のミラーにも反映する。
+        linked_ids = self._links.siblings(message.id)
         if not linked_ids:
             return
 
@@ -310,12 +961,12 @@ class ChannelBridgeManager:
         for linked_id in linked_ids:
             channel = await self._resolve_channel_for_message(linked_id)
             if channel is None:
-                self._unlink_messages(message.id, linked_id)
+                self._unlink_message(linked_id)
                 continue
             try:
                 target_message = await channel.fetch_message(linked_id)
             except discord.NotFound:
-                self._unlink_messages(message.id, linked_id)
+                self._unlink_message(linked_id)
                 continue
             except discord.HTTPException as exc:
                 LOGGER.warning("ブリッジ先メッセージの取得に失敗しました: message_id=%s error=%s", linked_id, exc)
@@ -331,46 +982,472 @@ class ChannelBridgeManager:
                     await target_message.remove_reaction(reaction.emoji, bot_user)
             except discord.HTTPException as exc:
                 LOGGER.warning("リアクション同期に失敗しました: message_id=%s error=%s", linked_id, exc)
+                self._schedule_retry(
+                    exc,
+                    kind="reaction",
+                    key=f"reaction:{linked_id}:{emoji_key}",
+                    data={
+                        "channel_id": target_message.channel.id,
+                        "target_id": linked_id,
+                        "emoji": str(reaction.emoji),
+                        "add": add,
+                    },
+                )
+
+    async def start(self) -> None:
+        """Start background work owned by the manager (journaled retries)."""
+        if self._retry_queue is not None:
+            await self._retry_queue.start()
+
+    async def close(self, *, drain_timeout: float = 0.0) -> None:
+        """Flush queued mirror deletes and drain or persist pending retries."""
+        if self._mirror_delete_flush is not None and not self._mirror_delete_flush.done():
+            self._mirror_delete_flush.cancel()
+        await self.flush_pending_edits()
+        await self.flush_mirror_deletes()
+        if self._retry_queue is not None:
+            await self._retry_queue.close(drain_timeout=drain_timeout)
+        if self._transcoder is not None:
+            self._transcoder.close()
+
+    def _schedule_retry(
+        self,
+        exc: BaseException,
+        *,
+        kind: str,
+        key: str,
+        data: Dict[str, Any],
+    ) -> bool:
+        if self._retry_queue is None or not is_retryable_error(exc):
+            return False
+        entry = self._retry_queue.submit(kind, key, data)
+        LOGGER.info("再送キューに登録しました: kind=%s key=%s attempts=%s", kind, key, entry.attempts)
+        return True
+
+    async def _replay_outbound(self, entry: OutboundEntry) -> None:
+        """Retry a journaled operation. Raises to signal failure to the retry queue."""
+        data = entry.data
+        if entry.kind == "send":
+            await self._replay_send(entry)
+        elif entry.kind == "edit":
+            await self._replay_edit(data)
+        elif entry.kind == "reaction":
+            await self._replay_reaction(data)
+
+    async def _replay_send(self, entry: OutboundEntry) -> None:
+        """Retry a failed mirror send unless a mirror already exists in the destination.
+
+        After a restart the link state is empty, so the stored record is checked
+        for a mirror in the destination channel. A send that may already have
+        been posted is dropped once it is older than Discord's nonce window
+        unless that check could rule the mirror out.
+        """
+        data = entry.data
+        routes = self._routes_by_source.get((int(data["source_guild_id"]), int(data["source_channel_id"])), ())
+        route = next((item for item in routes if item.dst.channel == int(data["dst_channel_id"])), None)
+        if route is None:
+            return
+        source_id = int(data["source_id"])
+        if self._links.copy_in(source_id, route.dst.channel) is not None:
+            return
+
+        record: Optional[BridgeMessageRecord] = None
+        try:
+            record = await asyncio.to_thread(self._call_store, "get", self._message_store.get, source_id)
+        except Exception as exc:
+            LOGGER.warning("再送前の送信済み確認に失敗しました: source=%s error=%s", source_id, exc)
+            verified = False
+        else:
+            # 位置の分からないミラーがあると、送信先に送信済みかどうかを判断できない。
+            verified = record is None or all(
+                destination_id in record.locations for destination_id in record.destination_ids
+            )
+        if record is not None:
+            self._index_record(record)
+            if self._links.copy_in(source_id, route.dst.channel) is not None:
+                return
+        if not verified and self._retry_queue is not None and self._retry_queue.age(entry) > OUTBOUND_NONCE_WINDOW:
+            raise OutboundExpiredError(f"nonce window expired for {entry.key}")
+
+        source_channel = await self._fetch_channel_by_id(int(data["source_channel_id"]))
+        message = await source_channel.fetch_message(source_id)
+        destination = await self._fetch_channel_by_id(route.dst.channel)
+
+        if record is not None:
+            profile = BridgeProfile(
+                seed=record.profile_seed,
+                display_name=record.display_name,
+                avatar_url=record.avatar_url,
+            )
+            dicebear_failed = record.dicebear_failed
+        else:
+            profile, dicebear_failed = self._generate_profile(message)
+        self._store_message_location(message)
+
+        mirrored = await self._send_mirror(
+            message=message,
+            route=route,
+            destination=destination,
+            profile=profile,
+            dicebear_failed=dicebear_failed,
+        )
+        if mirrored is None:
+            return
+        existing = record.destination_ids if record is not None else []
+        await self._persist_destinations(
+            message,
+            destination_ids=[*existing, mirrored.id],
+            profile=profile,
+            dicebear_failed=dicebear_failed,
+        )
+
+    async def _replay_edit(self, data: Dict[str, Any]) -> None:
+        target_id = int(data["target_id"])
+        if target_id not in self._links:
+            # 再起動後はメモリ上にリンクがないため、ストアの記録から読み込む。
+            await self._load_links(target_id)
+        if not self._links.is_mirror(target_id):
+            return
+        source_channel = await self._fetch_channel_by_id(int(data["source_channel_id"]))
+        after = await source_channel.fetch_message(int(data["source_id"]))
+        record = await asyncio.to_thread(self._call_store, "get", self._message_store.get, after.id)
+        profile, base_annotations = self._prepare_edit(after, record)
+        await self._edit_mirror(after, target_id, profile=profile, base_annotations=base_annotations)
+
+    async def _replay_reaction(self, data: Dict[str, Any]) -> None:
+        channel = await self._fetch_channel_by_id(int(data["channel_id"]))
+        target = channel.get_partial_message(int(data["target_id"]))
+        if data.get("add"):
+            await target.add_reaction(data["emoji"])
+            return
+        bot_user = self._client.user
+        if bot_user is not None:
+            await target.remove_reaction(data["emoji"], bot_user)
+
+    async def _fetch_channel_by_id(self, channel_id: int) -> Any:
+        channel = self._client.get_channel(channel_id)
+        if channel is not None:
+            return channel
+        return await self._client.fetch_channel(channel_id)
 
     def handle_message_delete(self, message_id: int) -> None:
-        linked_ids = self._message_links.pop(message_id, set())
-        for linked_id in linked_ids:
-            peers = self._message_links.get(linked_id)
-            if peers:
-                peers.discard(message_id)
-                if not peers:
-                    self._message_links.pop(linked_id, None)
+        self._forget_message(message_id)
+
+        if self._call_store("delete", self._message_store.delete, message_id):
+            return
+        self._call_store("remove_destination", self._message_store.remove_destination, message_id)
+
+    async def handle_raw_message_delete(self, message_id: int, *, channel_id: Optional[int] = None) -> None:
+        """Clean up after a deleted message and, if enabled, delete its mirrors.
+
+        Store calls run in a worker thread. Mirrors are queued per destination
+        channel for ``delete_batch_window`` seconds so that a moderation sweep
+        is propagated with Discord's bulk-delete endpoint where possible.
+        """
+        if not await self._forget_deleted_messages([message_id], channel_id=channel_id):
+            return
+        if self._delete_batch_window <= 0:
+            await asyncio.gather(self._delete_message_record(message_id), self.flush_mirror_deletes())
+            return
+        await self._delete_message_record(message_id)
+
+    async def handle_raw_bulk_message_delete(
+        self,
+        message_ids: Iterable[int],
+        *,
+        channel_id: Optional[int] = None,
+    ) -> None:
+        """Handle a moderator purge: one batched store call and immediate bulk mirror deletes."""
+        deleted_ids = await self._forget_deleted_messages(message_ids, channel_id=channel_id)
+        if not deleted_ids:
+            return
+        await asyncio.gather(
+            asyncio.to_thread(
+                self._call_store,
+                "delete_many",
+                self._message_store.delete_many,
+                deleted_ids,
+            ),
+            self.flush_mirror_deletes(),
+        )
+
+    async def _forget_deleted_messages(
+        self,
+        message_ids: Iterable[int],
+        *,
+        channel_id: Optional[int] = None,
+    ) -> List[int]:
+        """Drop local state for deleted messages and queue their mirrors for deletion.
+
+        Returns the ids whose store records still need cleaning up; mirrors the
+        bridge deleted itself are skipped.
+        """
+        if channel_id is not None and channel_id not in self._route_channels:
+            # ルートに関わらないチャンネルの削除はストアに問い合わせない。
+            return []
+        deleted_ids: List[int] = []
+        for message_id in message_ids:
+            if message_id in self._self_deleted_ids:
+                # ブリッジ自身が削除したミラー。状態と記録は削除時に整理済み。
+                del self._self_deleted_ids[message_id]
+                continue
+            deleted_ids.append(message_id)
+        if self._propagate_deletes and self._shared_links:
+            await asyncio.gather(*(self._hydrate_links(message_id, channel_id) for message_id in deleted_ids))
+
+        mirrors_by_channel: Dict[int, List[int]] = {}
+        for message_id in deleted_ids:
+            if self._propagate_deletes and not self._links.is_mirror(message_id):
+                for mirror_channel_id, mirror_ids in self._group_mirrors_by_channel(message_id).items():
+                    mirrors_by_channel.setdefault(mirror_channel_id, []).extend(mirror_ids)
+            self._forget_message(message_id)
+
+        for mirror_ids in mirrors_by_channel.values():
+            for mirror_id in mirror_ids:
+                self._forget_message(mirror_id)
+                self._remember_self_deleted(mirror_id)
+        self._queue_mirror_deletes(mirrors_by_channel)
+        return deleted_ids
+
+    async def flush_mirror_deletes(self) -> None:
+        """Delete every queued mirror now, one bulk request per channel where possible."""
+        pending, self._pending_mirror_deletes = self._pending_mirror_deletes, {}
+        if not pending:
+            return
+        await asyncio.gather(
+            *(self._delete_mirrors(channel_id, mirror_ids) for channel_id, mirror_ids in pending.items())
+        )
+
+    def _queue_mirror_deletes(self, mirrors_by_channel: Dict[int, List[int]]) -> None:
+        for channel_id, mirror_ids in mirrors_by_channel.items():
+            self._pending_mirror_deletes.setdefault(channel_id, []).extend(mirror_ids)
+        if not self._pending_mirror_deletes or self._delete_batch_window <= 0:
+            return
+        if self._mirror_delete_flush is None or self._mirror_delete_flush.done():
+            self._mirror_delete_flush = asyncio.create_task(self._flush_mirror_deletes_later())
+
+    async def _flush_mirror_deletes_later(self) -> None:
+        await asyncio.sleep(self._delete_batch_window)
+        await self.flush_mirror_deletes()
+
+    async def _delete_message_record(self, message_id: int) -> None:
+        deleted = await asyncio.to_thread(
+            self._call_store, "delete", self._message_store.delete, message_id
+        )
+        if deleted:
+            return
+        await asyncio.to_thread(
+            self._call_store,
+            "remove_destination",
+            self._message_store.remove_destination,
+            message_id,
+        )
+
+    def _group_mirrors_by_channel(self, source_id: int) -> Dict[int, List[int]]:
+        grouped: Dict[int, List[int]] = {}
+        for linked_id in self._links.mirrors(source_id):
+            location = self._message_locations.get(linked_id)
+            if location is None:
+                continue
+            grouped.setdefault(location[1], []).append(linked_id)
+        return grouped
+
+    async def _delete_mirrors(self, channel_id: int, mirror_ids: Sequence[int]) -> None:
+        channel = self._client.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self._client.fetch_channel(channel_id)
+            except discord.HTTPException as exc:
+                LOGGER.warning(
+                    "ミラー削除先のチャンネル取得に失敗しました: channel=%s error=%s",
+                    channel_id,
+                    exc,
+                )
+                self._mirror_deletes.labels(method="single", result="failure").inc(len(mirror_ids))
+                return
+
+        cutoff = datetime.now(timezone.utc) - BULK_DELETE_MAX_AGE
+        bulk_ids: List[int] = []
+        single_ids: List[int] = []
+        for mirror_id in mirror_ids:
+            if discord.utils.snowflake_time(mirror_id) > cutoff:
+                bulk_ids.append(mirror_id)
+            else:
+                single_ids.append(mirror_id)
+        if len(bulk_ids) < 2 or not hasattr(channel, "delete_messages"):
+            single_ids.extend(bulk_ids)
+            bulk_ids = []
+
+        for start in range(0, len(bulk_ids), BULK_DELETE_MAX_MESSAGES):
+            chunk = bulk_ids[start : start + BULK_DELETE_MAX_MESSAGES]
+            if len(chunk) < 2:
+                single_ids.extend(chunk)
+                continue
+            try:
+                await channel.delete_messages([discord.Object(id=mirror_id) for mirror_id in chunk])
+            except discord.HTTPException as exc:
+                LOGGER.warning(
+                    "ミラーの一括削除に失敗したため個別削除に切り替えます: channel=%s count=%s error=%s",
+                    channel_id,
+                    len(chunk),
+                    exc,
+                )
+                single_ids.extend(chunk)
+                continue
+            self._mirror_deletes.labels(method="bulk", result="success").inc(len(chunk))
+
+        if single_ids:
+            await asyncio.gather(
+                *(self._delete_single_mirror(channel, mirror_id) for mirror_id in single_ids)
+            )
+
+    async def _delete_single_mirror(self, channel: Any, mirror_id: int) -> None:
+        try:
+            await channel.get_partial_message(mirror_id).delete()
+        except discord.NotFound:
+            self._mirror_deletes.labels(method="single", result="success").inc()
+        except discord.HTTPException as exc:
+            LOGGER.warning("ミラーの削除に失敗しました: message_id=%s error=%s", mirror_id, exc)
+            self._mirror_deletes.labels(method="single", result="failure").inc()
+        else:
+            self._mirror_deletes.labels(method="single", result="success").inc()
+
+    def _remember_self_deleted(self, message_id: int) -> None:
+        self._self_deleted_ids[message_id] = None
+        if len(self._self_deleted_ids) > SELF_DELETED_CACHE_SIZE:
+            self._self_deleted_ids.pop(next(iter(self._self_deleted_ids)))
+
+    def evict_links_before(self, threshold_id: int) -> int:
+        """Drop in-memory state for messages whose snowflake is below ``threshold_id``.
+
+        Mirrors left without any linked message are dropped as well. Returns the
+        number of message ids removed.
+        """
+        expired = {message_id for message_id in self._links.message_ids() if message_id < threshold_id}
+        expired.update(message_id for message_id in self._message_locations if message_id < threshold_id)
+        expired.update(key[0] for key in self._reaction_members if key[0] < threshold_id)
+
+        evicted = 0
+        pending = list(expired)
+        while pending:
+            message_id = pending.pop()
+            orphans = self._forget_message(message_id)
+            evicted += 1
+            pending.extend(orphan for orphan in orphans if orphan not in expired)
+            expired.update(orphans)
+        return evicted
+
+    def _forget_message(self, message_id: int) -> List[int]:
+        orphans = self._links.discard(message_id)
         self._message_locations.pop(message_id, None)
-        self._mirrored_message_ids.discard(message_id)
         self._clear_reaction_state(message_id)
-
-        if self._message_store.delete(message_id):
+        self._forget_edit_state(message_id)
+        return orphans
+
+    def _forget_edit_state(self, message_id: int) -> None:
+        self._edit_versions.pop(message_id, None)
+        self._applied_edit_versions.pop(message_id, None)
+        self._pending_edits.pop(message_id, None)
+        self._edit_locks.pop(message_id, None)
+        self._payload_hashes.pop(message_id, None)
+        timer = self._edit_timers.pop(message_id, None)
+        if timer is not None:
+            timer.cancel()
+
+    def _call_store(
+        self,
+        operation: str,
+        func: Callable[..., _T],
+        /,
+        *args: object,
+        **kwargs: object,
+    ) -> _T:
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._store_latency.labels(operation=operation).observe(elapsed)
+            self._stage_latency.labels(stage="store").observe(elapsed)
+
+    def _record_route_result(self, route: ChannelRoute, *, success: bool) -> None:
+        self._route_results.labels(
+            src=f"{route.src.guild}/{route.src.channel}",
+            dst=f"{route.dst.guild}/{route.dst.channel}",
+            result="success" if success else "failure",
+        ).inc()
+
+    async def _hydrate_links(self, message_id: int, channel_id: Optional[int]) -> None:
+        """Load the links of ``message_id`` from the store when this process lacks them.
+
+        Only used with ``shared_links``: another bot process may have mirrored
+        the message, so its record (keyed by the source or by one of its mirrors)
+        is the shared source of truth for the source/mirror relationship. Misses
+        are remembered for ``HYDRATION_MISS_TTL`` seconds so that repeated events
+        on messages the bridge never mirrored do not query the store each time.
+        """
+        if not self._shared_links or message_id in self._links:
+            return
+        if channel_id is not None and channel_id not in self._route_channels:
             return
-        self._message_store.remove_destination(message_id)
+        missed_at = self._hydration_misses.get(message_id)
+        if missed_at is not None and time.monotonic() - missed_at < HYDRATION_MISS_TTL:
+            return
+        try:
+            loaded = await self._load_links(message_id)
+        except Exception as exc:
+            LOGGER.warning("ストアからのリンクの読み込みに失敗しました: message_id=%s error=%s", message_id, exc)
+            return
+        self._link_hydrations.labels(result="hit" if loaded else "miss").inc()
+        if loaded:
+            self._hydration_misses.pop(message_id, None)
+            return
+        self._hydration_misses[message_id] = time.monotonic()
+        self._hydration_misses.move_to_end(message_id)
+        if len(self._hydration_misses) > HYDRATION_MISS_CACHE_SIZE:
+            self._hydration_misses.popitem(last=False)
+
+    async def _load_links(self, message_id: int) -> bool:
+        """Load the record of ``message_id`` (as source or mirror) into the link state.
+
+        The store is queried in a worker thread.
+        """
+        record = await asyncio.to_thread(
+            self._call_store, "find_linked", self._message_store.find_linked, message_id
+        )
+        if record is None or not record.destination_ids:
+            return False
+        self._index_record(record)
+        return True
+
+    def _index_record(self, record: BridgeMessageRecord) -> None:
+        """Add the stored links and locations of ``record`` to the in-memory state."""
+        for linked_id in (record.source_id, *record.destination_ids):
+            location = record.locations.get(linked_id)
+            if location is not None:
+                self._message_locations.setdefault(linked_id, location)
+        for destination_id in record.destination_ids:
+            self._link_messages(record.source_id, destination_id)
+        if record.payload_hash:
+            self._payload_hashes.setdefault(record.source_id, record.payload_hash)
 
     def _link_messages(self, source_id: int, target_id: int) -> None:
-        self._message_links.setdefault(source_id, set()).add(target_id)
-        self._message_links.setdefault(target_id, set()).add(source_id)
-
-    def _unlink_messages(self, message_a: int, message_b: int) -> None:
-        peers = self._message_links.get(message_a)
-        if peers:
-            peers.discard(message_b)
-            if not peers:
-                self._message_links.pop(message_a, None)
-        peers = self._message_links.get(message_b)
-        if peers:
-            peers.discard(message_a)
-            if not peers:
-                self._message_links.pop(message_b, None)
-        if message_a not in self._message_links:
-            self._message_locations.pop(message_a, None)
-            self._mirrored_message_ids.discard(message_a)
-            self._clear_reaction_state(message_a)
-        if message_b not in self._message_links:
-            self._message_locations.pop(message_b, None)
-            self._mirrored_message_ids.discard(message_b)
-            self._clear_reaction_state(message_b)
+        """Record ``target_id`` as a mirror of ``source_id``; call after both locations are stored."""
+        source_location = self._message_locations.get(source_id)
+        target_location = self._message_locations.get(target_id)
+        self._links.link(
+            source_id,
+            source_location[1] if source_location is not None else None,
+            target_id,
+            target_location[1] if target_location is not None else None,
+        )
+        self._reference_misses.pop(source_id, None)
+
+    def _unlink_message(self, message_id: int) -> None:
+        """Drop a copy that no longer exists, and any copy left without links."""
+        for unlinked_id in (message_id, *self._links.discard(message_id)):
+            self._message_locations.pop(unlinked_id, None)
+            self._clear_reaction_state(unlinked_id)
 
     def _store_message_location(self, message: discord.Message) -> None:
         guild_id = message.guild.id if message.guild else None
@@ -413,9 +1490,18 @@ class ChannelBridgeManager:
         profile: BridgeProfile,
         dicebear_failed: bool,
         target: ChannelEndpoint,
+        upload_limit: Optional[int] = None,
+        shared_uploads: Optional[Dict[int, UploadedAttachment]] = None,
     ) -> Optional[MirrorPayload]:
         try:
-            attachments = await self._prepare_attachments(source_message.attachments)
+            if shared_uploads:
+                attachments = self._reuse_attachments(source_message.attachments, shared_uploads)
+            else:
+                with self._stage_latency.labels(stage="attachment_fetch").time():
+                    attachments = await self._prepare_attachments(
+                        source_message.attachments,
+                        upload_limit=upload_limit,
+                    )
         except Exception as exc:  # pragma: no cover - Discord 仕様変更等での例外に備える
             LOGGER.exception(
                 "添付ファイル処理で予期しないエラーが発生しました。フォールバックに切り替えます: message_id=%s error=%s",
@@ -430,7 +1516,7 @@ class ChannelBridgeManager:
             )
         annotations: List[str] = []
         if source_message.reference:
-            reference_line = self._format_reference(source_message, target=target)
+            reference_line = await self._format_reference(source_message, target=target)
             if reference_line:
                 annotations.append(reference_line)
         if dicebear_failed:
@@ -440,17 +1526,25 @@ class ChannelBridgeManager:
                 annotations.append(f"(ステッカー: {sticker.name})")
         annotations.extend(attachments.notes)
 
-        embed, content = self._compose_mirror_texts(
-            raw_content=source_message.content,
-            annotations=annotations,
-            profile=profile,
-            guild_id=source_message.guild.id,
-        )
+        with self._stage_latency.labels(stage="render").time():
+            embed, content = self._compose_mirror_texts(
+                raw_content=source_message.content,
+                annotations=annotations,
+                profile=profile,
+                guild_id=source_message.guild.id,
+            )
 
         if embed is not None and attachments.image_filename:
             embed.set_image(url=f"attachment://{attachments.image_filename}")
-
-        return MirrorPayload(embed=embed, content=content, files=attachments.files)
+        elif embed is not None and attachments.image_url:
+            embed.set_image(url=attachments.image_url)
+
+        return MirrorPayload(
+            embed=embed,
+            content=content,
+            files=attachments.files,
+            file_sources=attachments.sources,
+        )
 
     def _build_fallback_payload(
         self,
@@ -523,15 +1617,29 @@ class ChannelBridgeManager:
         await asyncio.to_thread(self._profile_store.ensure_guild_colors, guild_ids)
 
     def _log_bridge_received(self, *, message: discord.Message, route_count: int) -> None:
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return
+        guild_id = getattr(message.guild, "id", None)
+        author_id = getattr(message.author, "id", None)
         attachment_count = len(message.attachments)
         LOGGER.info(
             "ブリッジ受信: guild=%s channel=%s author=%s message_id=%s routes=%s attachments=%s",
-            getattr(message.guild, "id", "unknown"),
+            guild_id if guild_id is not None else "unknown",
             message.channel.id,
-            getattr(message.author, "id", "unknown"),
+            author_id if author_id is not None else "unknown",
             message.id,
             route_count,
             attachment_count,
+            extra={
+                "event": "bridge.received",
+                "context": {
+                    "guild_id": guild_id,
+                    "channel_id": message.channel.id,
+                    "message_id": message.id,
+                    "routes": route_count,
+                    "attachments": attachment_count,
+                },
+            },
         )
 
     def _log_bridge_send_start(
@@ -541,14 +1649,23 @@ class ChannelBridgeManager:
         route: ChannelRoute,
         payload: MirrorPayload,
     ) -> None:
-        dst_label = route.dst.describe()
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return
         LOGGER.info(
             "ブリッジ送信開始: source_message=%s -> dst=%s payload=(embed=%s, files=%s, content_len=%s)",
             message.id,
-            dst_label,
+            _EndpointLabel(route.dst),
             bool(payload.embed),
             len(payload.files),
             len(payload.content or ""),
+            extra={
+                "event": "bridge.send_start",
+                "context": {
+                    "message_id": message.id,
+                    "dst_guild_id": route.dst.guild,
+                    "dst_channel_id": route.dst.channel,
+                },
+            },
         )
 
     def _log_bridge_send_success(
@@ -559,53 +1676,154 @@ class ChannelBridgeManager:
         route: ChannelRoute,
         payload: MirrorPayload,
     ) -> None:
-        dst_label = route.dst.describe()
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return
         LOGGER.info(
             "ブリッジ送信完了: source=%s dst=%s mirrored=%s payload=(embed=%s, files=%s)",
             source_message.id,
-            dst_label,
+            _EndpointLabel(route.dst),
             mirrored_message.id,
             bool(payload.embed),
             len(payload.files),
+            extra={
+                "event": "bridge.send_success",
+                "context": {
+                    "message_id": source_message.id,
+                    "mirrored_id": mirrored_message.id,
+                    "dst_guild_id": route.dst.guild,
+                    "dst_channel_id": route.dst.channel,
+                },
+            },
         )
 
-    async def _prepare_attachments(self, attachments: Iterable[discord.Attachment]) -> AttachmentBundle:
+    async def _prepare_attachments(
+        self,
+        attachments: Sequence[discord.Attachment],
+        *,
+        upload_limit: Optional[int] = None,
+    ) -> AttachmentBundle:
+        """Download the attachments that fit ``upload_limit`` and link the rest.
+
+        Files that would push the upload past the destination guild's limit are
+        never downloaded; they are mirrored as link notes instead so the send
+        itself cannot fail with "Request entity too large". With a transcoder,
+        oversized images (and videos, as thumbnails) are additionally uploaded
+        as smaller renditions within the remaining budget.
+        """
         files: List[discord.File] = []
+        sources: List[Tuple[int, bool]] = []
         notes: List[str] = []
         image_filename: Optional[str] = None
+        fits = _fit_uploads(attachments, upload_limit)
+        budget = None
+        if upload_limit is not None:
+            budget = upload_limit - sum(
+                int(getattr(attachment, "size", 0) or 0) for attachment, fit in zip(attachments, fits) if fit
+            )
 
-        for attachment in attachments:
+        for attachment, uploadable in zip(attachments, fits):
             label = self._attachment_label(attachment)
+            if not uploadable:
+                notes.append(f"{label} {attachment.url}")
+                rendition = await self._transcode_attachment(attachment, label, budget)
+                if rendition is None:
+                    self._attachment_results.labels(result="linked").inc()
+                    continue
+                # 縮小版を表示しつつ、注記のリンクから元のファイルも開けるようにする。
+                self._attachment_results.labels(result="transcoded").inc()
+                budget = int(budget or 0) - len(rendition.data)
+                file = rendition.to_file()
+                files.append(file)
+                sources.append((attachment.id, True))
+                if image_filename is None:
+                    image_filename = file.filename
+                continue
             try:
                 file = await attachment.to_file()
             except discord.HTTPException as exc:
                 LOGGER.warning("添付ファイルの取得に失敗しました: filename=%s error=%s", attachment.filename, exc)
+                self._attachment_results.labels(result="failed").inc()
                 notes.append(f"(添付取得失敗: {attachment.filename})")
                 continue
 
+            self._attachment_results.labels(result="uploaded").inc()
             files.append(file)
+            sources.append((attachment.id, False))
             if image_filename is None and label == ATTACHMENT_LABELS["image"]:
                 image_filename = file.filename
             else:
                 notes.append(f"{label} {attachment.url}")
 
-        return AttachmentBundle(files=files, image_filename=image_filename, notes=notes)
+        return AttachmentBundle(files=files, image_filename=image_filename, notes=notes, sources=sources)
+
+    def _reuse_attachments(
+        self,
+        attachments: Sequence[discord.Attachment],
+        uploads: Dict[int, UploadedAttachment],
+    ) -> AttachmentBundle:
+        """Link the copies uploaded for another destination instead of re-uploading.
+
+        Mirrors the layout of `_prepare_attachments`: the first uploaded image
+        (or transcoded rendition) becomes the embed image, the rest are notes.
+        """
+        notes: List[str] = []
+        image_url: Optional[str] = None
+        for attachment in attachments:
+            label = self._attachment_label(attachment)
+            uploaded = uploads.get(attachment.id)
+            if uploaded is None:
+                self._attachment_results.labels(result="linked").inc()
+                notes.append(f"{label} {attachment.url}")
+                continue
+            self._attachment_results.labels(result="reused").inc()
+            if uploaded.transcoded:
+                notes.append(f"{label} {attachment.url}")
+                if image_url is None:
+                    image_url = uploaded.url
+            elif image_url is None and label == ATTACHMENT_LABELS["image"]:
+                image_url = uploaded.url
+            else:
+                notes.append(f"{label} {uploaded.url}")
+        return AttachmentBundle(files=[], image_filename=None, notes=notes, image_url=image_url)
+
+    async def _transcode_attachment(
+        self,
+        attachment: discord.Attachment,
+        label: str,
+        budget: Optional[int],
+    ) -> Optional[TranscodedMedia]:
+        if self._transcoder is None or budget is None or budget <= 0:
+            return None
+        if label == ATTACHMENT_LABELS["image"]:
+            return await self._transcoder.shrink_image(attachment, limit=budget)
+        if label == ATTACHMENT_LABELS["video"]:
+            return await self._transcoder.video_thumbnail(attachment, limit=budget)
+        return None
 
     def _summarize_attachment_notes(
-        self, attachments: Sequence[discord.Attachment]
+        self,
+        attachments: Sequence[discord.Attachment],
+        *,
+        upload_limit: Optional[int] = None,
     ) -> Tuple[Optional[str], List[str]]:
         image_filename: Optional[str] = None
         notes: List[str] = []
 
-        for attachment in attachments:
+        for attachment, uploadable in zip(attachments, _fit_uploads(attachments, upload_limit)):
             label = self._attachment_label(attachment)
-            if image_filename is None and label == ATTACHMENT_LABELS["image"]:
+            if uploadable and image_filename is None and label == ATTACHMENT_LABELS["image"]:
                 image_filename = attachment.filename
                 continue
             notes.append(f"{label} {attachment.url}")
 
         return image_filename, notes
 
+    @staticmethod
+    def _upload_limit(destination: Any) -> Optional[int]:
+        """Return the upload limit (bytes) of the destination's guild, if known."""
+        limit = getattr(getattr(destination, "guild", None), "filesize_limit", None)
+        return limit if isinstance(limit, int) and limit > 0 else None
+
     def _select_image_attachment_filename(
         self, attachments: Sequence[discord.Attachment]
     ) -> Optional[str]:
@@ -632,35 +1850,70 @@ class ChannelBridgeManager:
         guessed, _ = mimetypes.guess_type(getattr(attachment, "filename", ""))
         return (guessed or "").lower()
 
-    def _format_reference(self, message: discord.Message, *, target: ChannelEndpoint) -> Optional[str]:
+    async def _format_reference(self, message: discord.Message, *, target: ChannelEndpoint) -> Optional[str]:
         ref = message.reference
         if ref is None:
             return None
         if ref.resolved and isinstance(ref.resolved, discord.Message):
             referenced_id = ref.resolved.id
+            referenced_channel_id = ref.resolved.channel.id
             jump_url = ref.resolved.jump_url
         else:
             if ref.guild_id is None or ref.channel_id is None or ref.message_id is None:
                 return None
             referenced_id = ref.message_id
+            referenced_channel_id = ref.channel_id
             jump_url = f"https://discord.com/channels/{ref.guild_id}/{ref.channel_id}/{ref.message_id}"
-        remapped = self._remap_reference_jump_url(referenced_id=referenced_id, target=target)
+        remapped = await self._remap_reference_jump_url(
+            referenced_id=referenced_id,
+            target=target,
+            channel_id=referenced_channel_id,
+        )
         effective_url = remapped or jump_url
         return f"▶ Reply to {effective_url}"
 
-    def _remap_reference_jump_url(self, *, referenced_id: int, target: ChannelEndpoint) -> Optional[str]:
-        target_key = (target.guild, target.channel)
-        location = self._message_locations.get(referenced_id)
-        if location == target_key:
+    async def _remap_reference_jump_url(
+        self,
+        *,
+        referenced_id: int,
+        target: ChannelEndpoint,
+        channel_id: Optional[int] = None,
+    ) -> Optional[str]:
+        """Return the jump URL of the copy of ``referenced_id`` that lives in ``target``.
+
+        Looks up the ``(message, channel)`` index; when the referenced message is
+        not in memory (restart, eviction) its record is loaded from the store
+        once, in a worker thread and with a single query by source or mirror
+        id, which indexes every mirror for all remaining destinations.
+        """
+        if self._message_locations.get(referenced_id) == (target.guild, target.channel):
             return f"https://discord.com/channels/{target.guild}/{target.channel}/{referenced_id}"
-        linked_ids = self._message_links.get(referenced_id)
-        if not linked_ids:
+        result = "memory"
+        linked_id = self._links.copy_in(referenced_id, target.channel)
+        if linked_id is None and await self._load_reference_links(referenced_id, channel_id):
+            result = "store"
+            linked_id = self._links.copy_in(referenced_id, target.channel)
+        if linked_id is None:
+            self._reference_remaps.labels(result="miss").inc()
             return None
-        for linked_id in linked_ids:
-            location = self._message_locations.get(linked_id)
-            if location == target_key:
-                return f"https://discord.com/channels/{target.guild}/{target.channel}/{linked_id}"
-        return None
+        self._reference_remaps.labels(result=result).inc()
+        return f"https://discord.com/channels/{target.guild}/{target.channel}/{linked_id}"
+
+    async def _load_reference_links(self, referenced_id: int, channel_id: Optional[int]) -> bool:
+        if referenced_id in self._links or referenced_id in self._reference_misses:
+            return False
+        if channel_id is not None and channel_id not in self._route_channels:
+            return False
+        try:
+            loaded = await self._load_links(referenced_id)
+        except Exception as exc:
+            LOGGER.warning("返信先のミラーの読み込みに失敗しました: message_id=%s error=%s", referenced_id, exc)
+            return False
+        if not loaded:
+            self._reference_misses[referenced_id] = None
+            if len(self._reference_misses) > REFERENCE_MISS_CACHE_SIZE:
+                self._reference_misses.popitem(last=False)
+        return loaded
 
     def _register_reaction_add(self, message_id: int, emoji_key: str, user_id: int) -> bool:
         key = (message_id, emoji_key)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
-from supabase import Client
+from .storage import BridgeStorageBackend
+
+#: ``message_id -> (guild_id, channel_id)`` of a source message and its mirrors.
+MessageLocations = Dict[int, Tuple[int, int]]
 
 
 @dataclass(slots=True)
@@ -42,9 +45,11 @@ class BridgeMessageRecord:
     dicebear_failed: bool
     attachments: BridgeMessageAttachmentMetadata
     updated_at: datetime
+    payload_hash: Optional[str] = None
+    locations: MessageLocations = field(default_factory=dict)
 
     def to_record(self) -> dict[str, object]:
-        return {
+        record: dict[str, object] = {
             "source_id": self.source_id,
             "destination_ids": list(self.destination_ids),
             "profile_seed": self.profile_seed,
@@ -55,6 +60,8 @@ class BridgeMessageRecord:
             "attachment_notes": list(self.attachments.notes),
             "updated_at": self.updated_at.isoformat(),
         }
+        _add_optional_columns(record, payload_hash=self.payload_hash, locations=self.locations)
+        return record
 
     @classmethod
     def from_record(cls, record: dict) -> "BridgeMessageRecord":
@@ -73,15 +80,22 @@ class BridgeMessageRecord:
             dicebear_failed=bool(record.get("dicebear_failed", False)),
             attachments=attachments,
             updated_at=_parse_datetime(record.get("updated_at")),
+            payload_hash=record.get("payload_hash"),
+            locations=_decode_locations(record.get("message_locations")),
         )
 
 
 class BridgeMessageStore:
     """Persist bridge message metadata for later synchronisation."""
 
-    def __init__(self, supabase: Client, table_name: str = "bridge_messages") -> None:
-        self._supabase = supabase
-        self._table_name = table_name
+    def __init__(self, backend: BridgeStorageBackend, *, omitted_columns: Iterable[str] = ()) -> None:
+        self._backend = backend
+        # 未移行のテーブルに無い ``MESSAGE_COLUMN_MIGRATIONS`` の列。書き込み時に省く。
+        self._omitted_columns = frozenset(omitted_columns)
+
+    @property
+    def backend(self) -> BridgeStorageBackend:
+        return self._backend
 
     def upsert(
         self,
@@ -93,6 +107,8 @@ class BridgeMessageStore:
         avatar_url: str,
         dicebear_failed: bool,
         attachments: BridgeMessageAttachmentMetadata,
+        payload_hash: Optional[str] = None,
+        locations: Optional[Mapping[int, Tuple[int, int]]] = None,
     ) -> None:
         normalized_destination_ids = _normalize_destination_ids(destination_ids)
         attachment_payload = attachments.to_record()
@@ -107,98 +123,104 @@ class BridgeMessageStore:
             "attachment_notes": list(attachment_payload["notes"]),
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
-        self._supabase.table(self._table_name).upsert(
-            payload,
-            on_conflict="source_id",
-        ).execute()
+        _add_optional_columns(payload, payload_hash=payload_hash, locations=locations)
+        self._backend.upsert_message(self._without_omitted(payload))
 
     def get(self, source_id: int) -> Optional[BridgeMessageRecord]:
-        response = (
-            self._supabase.table(self._table_name)
-            .select("*")
-            .eq("source_id", source_id)
-            .execute()
-        )
-        if isinstance(response.data, list) and response.data:
-            return BridgeMessageRecord.from_record(response.data[0])
-        if isinstance(response.data, dict):
-            return BridgeMessageRecord.from_record(response.data)
-        return None
+        row = self._backend.get_message(source_id)
+        if row is None:
+            return None
+        return BridgeMessageRecord.from_record(row)
+
+    def find_by_destination(self, destination_id: int) -> Optional[BridgeMessageRecord]:
+        row = self._backend.find_message_by_destination(destination_id)
+        if row is None:
+            return None
+        return BridgeMessageRecord.from_record(row)
+
+    def find_linked(self, message_id: int) -> Optional[BridgeMessageRecord]:
+        """Return the record that has ``message_id`` as its source or as one of its mirrors."""
+        row = self._backend.find_linked_message(message_id)
+        if row is None:
+            return None
+        return BridgeMessageRecord.from_record(row)
 
     def update_metadata(
         self,
         *,
         source_id: int,
         attachments: Optional[BridgeMessageAttachmentMetadata] = None,
+        payload_hash: Optional[str] = None,
+        clear_payload_hash: bool = False,
     ) -> None:
-        record = self.get(source_id)
-        if record is None:
-            return
+        """Update the given fields; ``None`` leaves a field as stored.
 
-        image_filename = record.attachments.image_filename
-        notes = list(record.attachments.notes)
+        ``clear_payload_hash`` writes an explicit ``NULL`` so that the next
+        edit is never skipped as unchanged.
+        """
+        fields: dict[str, object] = {"updated_at": datetime.now(timezone.utc).isoformat()}
         if attachments is not None:
-            image_filename = attachments.image_filename
-            notes = list(attachments.notes)
-
-        self._supabase.table(self._table_name).update(
-            {
-                "image_filename": image_filename,
-                "attachment_notes": notes,
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-            }
-        ).eq("source_id", source_id).execute()
+            fields["image_filename"] = attachments.image_filename
+            fields["attachment_notes"] = list(attachments.notes)
+        if clear_payload_hash:
+            fields["payload_hash"] = None
+        elif payload_hash is not None:
+            fields["payload_hash"] = payload_hash
+        self._backend.update_message(source_id, self._without_omitted(fields))
+
+    def _without_omitted(self, row: dict[str, object]) -> dict[str, object]:
+        for column in self._omitted_columns:
+            row.pop(column, None)
+        return row
+
+    def claim_deliveries(self, source_id: int, channel_ids: Iterable[int]) -> List[int]:
+        """Claim ``source_id`` -> channel deliveries; returns the channels not claimed before."""
+        return self._backend.claim_deliveries(int(source_id), [int(value) for value in channel_ids])
+
+    def release_delivery(self, source_id: int, channel_id: int) -> None:
+        self._backend.release_delivery(int(source_id), int(channel_id))
 
     def delete(self, source_id: int) -> bool:
-        response = (
-            self._supabase.table(self._table_name)
-            .delete()
-            .eq("source_id", source_id)
-            .execute()
-        )
-        if isinstance(response.data, list):
-            return len(response.data) > 0
-        return bool(response.data)
+        return self._backend.delete_message(source_id)
 
-    def remove_destination(self, destination_id: int) -> None:
-        response = (
-            self._supabase.table(self._table_name)
-            .select("source_id, destination_ids")
-            .contains("destination_ids", [str(destination_id)])
-            .limit(1)
-            .execute()
-        )
-        record = None
-        if isinstance(response.data, list) and response.data:
-            record = response.data[0]
-        elif isinstance(response.data, dict):
-            record = response.data
+    def delete_many(self, message_ids: Iterable[int]) -> int:
+        """Forget deleted messages in one batched backend call.
+
+        Each id may be a source (its record is deleted) or a mirror (it is
+        removed from ``destination_ids``). Returns the number of deleted records.
+        """
+        normalized = sorted(dict.fromkeys(int(value) for value in message_ids))
+        if not normalized:
+            return 0
+        return self._backend.delete_messages_by_ids(normalized)
 
+    def remove_destination(self, destination_id: int) -> None:
+        record = self._backend.find_message_by_destination(destination_id)
         if record is None:
             return
 
         remaining = [int(value) for value in record.get("destination_ids", []) if int(value) != destination_id]
         if remaining:
             normalized = sorted(dict.fromkeys(remaining))
-            self._supabase.table(self._table_name).update(
+            self._backend.update_message(
+                int(record["source_id"]),
                 {
                     "destination_ids": normalized,
                     "updated_at": datetime.now(timezone.utc).isoformat(),
-                }
-            ).eq("source_id", record["source_id"]).execute()
+                },
+            )
         else:
             self.delete(int(record["source_id"]))
 
     def purge_older_than(self, *, threshold: datetime) -> int:
-        response = (
-            self._supabase.table(self._table_name)
-            .delete()
-            .lt("updated_at", threshold.isoformat())
-            .execute()
-        )
-        if isinstance(response.data, list):
-            return len(response.data)
-        return 0
+        return self._backend.delete_messages_updated_before(threshold)
+
+    def purge_before_source(self, *, threshold_id: int, batch_size: int) -> int:
+        """Delete one batch of records whose ``source_id`` predates ``threshold_id``."""
+        return self._backend.delete_messages_before_source(threshold_id, limit=batch_size)
+
+    def purge_claims_before_source(self, *, threshold_id: int) -> int:
+        return self._backend.delete_claims_before_source(threshold_id)
 
 
 def _normalize_destination_ids(values: Iterable[int]) -> List[int]:
@@ -206,6 +228,42 @@ def _normalize_destination_ids(values: Iterable[int]) -> List[int]:
     return normalized
 
 
+def _add_optional_columns(
+    row: dict[str, object],
+    *,
+    payload_hash: Optional[str],
+    locations: Optional[Mapping[int, Tuple[int, int]]],
+) -> None:
+    """Add the columns from ``MESSAGE_COLUMN_MIGRATIONS`` only when there is a value.
+
+    Rows without them can still be written to a table that predates those columns.
+    """
+    if payload_hash is not None:
+        row["payload_hash"] = payload_hash
+    if locations:
+        row["message_locations"] = _encode_locations(locations)
+
+
+def _encode_locations(locations: Mapping[int, Tuple[int, int]]) -> Dict[str, List[int]]:
+    return {
+        str(message_id): [int(guild_id), int(channel_id)]
+        for message_id, (guild_id, channel_id) in locations.items()
+    }
+
+
+def _decode_locations(value: object) -> MessageLocations:
+    if not isinstance(value, Mapping):
+        return {}
+    decoded: MessageLocations = {}
+    for message_id, location in value.items():
+        try:
+            guild_id, channel_id = location
+            decoded[int(message_id)] = (int(guild_id), int(channel_id))
+        except (TypeError, ValueError):
+            continue
+    return decoded
+
+
 def _parse_datetime(value: Optional[datetime | str]) -> datetime:
     if isinstance(value, datetime):
         parsed = value
@@ -226,4 +284,5 @@ __all__ = [
     "BridgeMessageAttachmentMetadata",
     "BridgeMessageRecord",
     "BridgeMessageStore",
+    "MessageLocations",
 ]
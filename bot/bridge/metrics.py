@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+class _MetricFamily:
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+
+    def _label_key(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, values: LabelValues, extra: Sequence[Tuple[str, str]] = ()) -> str:
+        pairs = [*zip(self.labelnames, values), *extra]
+        if not pairs:
+            return ""
+        rendered = ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in pairs)
+        return "{" + rendered + "}"
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:  # pragma: no cover - サブクラスで実装
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("counter can only be incremented")
+        self.value += amount
+
+
+class Counter(_MetricFamily):
+    """Monotonic counter with optional labels."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._children: Dict[LabelValues, _CounterChild] = {}
+
+    def labels(self, **labels: object) -> _CounterChild:
+        key = self._label_key(labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = _CounterChild()
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def value(self, **labels: object) -> float:
+        child = self._children.get(self._label_key(labels))
+        return child.value if child is not None else 0.0
+
+    def items(self) -> List[Tuple[LabelValues, float]]:
+        return [(key, child.value) for key, child in self._children.items()]
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{self._format_labels(key)} {_format_value(child.value)}"
+            for key, child in self._children.items()
+        ]
+
+
+class _GaugeChild:
+    __slots__ = ("_value", "_function")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    def get(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._value
+
+
+class Gauge(_MetricFamily):
+    """Gauge whose children may be backed by a callback evaluated at scrape time."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._children: Dict[LabelValues, _GaugeChild] = {}
+
+    def labels(self, **labels: object) -> _GaugeChild:
+        key = self._label_key(labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = _GaugeChild()
+        return child
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def value(self, **labels: object) -> float:
+        child = self._children.get(self._label_key(labels))
+        return child.get() if child is not None else 0.0
+
+    def items(self) -> List[Tuple[LabelValues, float]]:
+        return [(key, child.get()) for key, child in self._children.items()]
+
+    def _render_samples(self) -> List[str]:
+        lines: List[str] = []
+        for key, child in self._children.items():
+            try:
+                value = child.get()
+            except Exception as exc:  # pragma: no cover - コールバック側の不具合に備える
+                LOGGER.warning("メトリクス値の取得に失敗しました: metric=%s error=%s", self.name, exc)
+                continue
+            lines.append(f"{self.name}{self._format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class _HistogramChild:
+    __slots__ = ("_upper_bounds", "bucket_counts", "count", "sum")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]) -> None:
+        self._upper_bounds = upper_bounds
+        self.bucket_counts: List[int] = [0] * (len(upper_bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = len(self._upper_bounds)
+        for position, bound in enumerate(self._upper_bounds):
+            if value <= bound:
+                index = position
+                break
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class Histogram(_MetricFamily):
+    """Cumulative bucket histogram rendered in the Prometheus text format."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(float(bound) for bound in buckets))
+        self._children: Dict[LabelValues, _HistogramChild] = {}
+
+    def labels(self, **labels: object) -> _HistogramChild:
+        key = self._label_key(labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = _HistogramChild(self.buckets)
+        return child
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def items(self) -> List[Tuple[LabelValues, _HistogramChild]]:
+        return list(self._children.items())
+
+    def _render_samples(self) -> List[str]:
+        lines: List[str] = []
+        for key, child in self._children.items():
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), child.bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if math.isinf(bound) else _format_value(bound)
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(key, (('le', le),))} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {child.count}")
+        return lines
+
+
+class BridgeMetrics:
+    """Process-local metrics registry for the bridge hot paths."""
+
+    def __init__(self) -> None:
+        self._families: Dict[str, _MetricFamily] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(name, lambda: Counter(name, documentation, labelnames), Counter)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(name, lambda: Gauge(name, documentation, labelnames), Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            name,
+            lambda: Histogram(name, documentation, labelnames, buckets=buckets),
+            Histogram,
+        )
+
+    def get(self, name: str) -> Optional[_MetricFamily]:
+        return self._families.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in self._families.values():
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, name: str, factory: Callable[[], _MetricFamily], kind: type) -> _MetricFamily:
+        existing = self._families.get(name)
+        if existing is not None:
+            if not isinstance(existing, kind):
+                raise ValueError(f"metric {name} is already registered as {existing.metric_type}")
+            return existing
+        family = factory()
+        self._families[name] = family
+        return family
+
+
+class MetricsServer:
+    """Serve the registry over HTTP in the Prometheus text exposition format."""
+
+    def __init__(self, metrics: BridgeMetrics, *, host: str, port: int) -> None:
+        self._metrics = metrics
+        self._host = host
+        self._port = port
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @property
+    def port(self) -> int:
+        if self._server is not None and self._server.sockets:
+            return int(self._server.sockets[0].getsockname()[1])
+        return self._port
+
+    async def start(self) -> None:
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        LOGGER.info("メトリクスエンドポイントを公開しました: http://%s:%s/metrics", self._host, self.port)
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            while True:
+                header = await asyncio.wait_for(reader.readline(), timeout=5)
+                if header in (b"\r\n", b"\n", b""):
+                    break
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?", 1)[0] if len(parts) >= 2 else ""
+            if len(parts) >= 2 and parts[0] == "GET" and path in ("/", "/metrics"):
+                status = "200 OK"
+                body = self._metrics.render().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                status = "404 Not Found"
+                body = b"not found\n"
+                content_type = "text/plain; charset=utf-8"
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("latin-1")
+                + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError) as exc:
+            LOGGER.debug("メトリクスリクエストの処理を中断しました: error=%s", exc)
+        finally:
+            writer.close()
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+__all__ = [
+    "BridgeMetrics",
+    "Counter",
+    "DEFAULT_LATENCY_BUCKETS",
+    "Gauge",
+    "Histogram",
+    "MetricsServer",
+]
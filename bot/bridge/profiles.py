@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Dict, Iterable, List
 from urllib.parse import quote_plus
 
-from supabase import Client
+from .storage import BridgeStorageBackend
 
 LOGGER = logging.getLogger(__name__)
 
@@ -78,25 +78,14 @@ class BridgeProfile:
 
 
 class BridgeProfileStore:
-    """Manage adjective/noun dictionaries stored in Supabase."""
+    """Manage adjective/noun dictionaries stored in the bridge storage backend."""
 
-    def __init__(self, supabase: Client, table_name: str = "bridge_profiles") -> None:
-        self._supabase = supabase
-        self._table_name = table_name
+    def __init__(self, backend: BridgeStorageBackend) -> None:
+        self._backend = backend
         self._dictionary, self._guild_colors = self._load_or_seed_dictionary()
 
     def _load_or_seed_dictionary(self) -> tuple[Dict[str, List[str]], Dict[int, int]]:
-        response = (
-            self._supabase.table(self._table_name)
-            .select("adjectives, nouns, guild_colors")
-            .eq("id", DICTIONARY_ID)
-            .execute()
-        )
-        record = None
-        if isinstance(response.data, list) and response.data:
-            record = response.data[0]
-        elif isinstance(response.data, dict):
-            record = response.data
+        record = self._backend.get_profile_record(DICTIONARY_ID)
 
         if record:
             adjectives = list(record.get("adjectives") or [])
@@ -106,20 +95,20 @@ class BridgeProfileStore:
             guild_colors_raw = record.get("guild_colors") or {}
             guild_colors, needs_update = self._normalize_guild_colors(guild_colors_raw)
             if needs_update:
-                self._supabase.table(self._table_name).update(
-                    {"guild_colors": self._serialize_guild_colors(guild_colors)}
-                ).eq("id", DICTIONARY_ID).execute()
+                self._backend.update_profile_record(
+                    DICTIONARY_ID,
+                    {"guild_colors": self._serialize_guild_colors(guild_colors)},
+                )
             return {"adjectives": adjectives, "nouns": nouns}, guild_colors
 
-        self._supabase.table(self._table_name).upsert(
+        self._backend.upsert_profile_record(
             {
                 "id": DICTIONARY_ID,
                 "adjectives": list(DEFAULT_ADJECTIVES),
                 "nouns": list(DEFAULT_NOUNS),
                 "guild_colors": {},
-            },
-            on_conflict="id",
-        ).execute()
+            }
+        )
         LOGGER.info("Bridge profile dictionary seeded with default adjectives and nouns.")
         return (
             {
@@ -146,9 +135,10 @@ class BridgeProfileStore:
             existing_colors.add(color)
             existing_lab.append(_rgb_to_lab(_color_to_rgb(color)))
 
-        self._supabase.table(self._table_name).update(
-            {"guild_colors": self._serialize_guild_colors(self._guild_colors)}
-        ).eq("id", DICTIONARY_ID).execute()
+        self._backend.update_profile_record(
+            DICTIONARY_ID,
+            {"guild_colors": self._serialize_guild_colors(self._guild_colors)},
+        )
         return dict(self._guild_colors)
 
     def get_guild_color(self, guild_id: int) -> int | None:
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+import discord
+
+from .messages import BridgeMessageStore
+from .metrics import BridgeMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionRunResult:
+    """Outcome of a single retention pass."""
+
+    threshold_id: int
+    purged_rows: int
+    evicted_links: int
+    batches: int
+    duration: float
+
+
+class BridgeRetentionTask:
+    """Periodically purge bridge records older than the retention window.
+
+    Records are deleted in bounded batches keyed by the ``source_id`` snowflake,
+    so each round trip is a primary-key range delete and never returns the
+    removed rows. In-memory link state older than the same threshold is evicted
+    through ``evict_links`` at the end of every run.
+    """
+
+    def __init__(
+        self,
+        message_store: BridgeMessageStore,
+        *,
+        retention: timedelta,
+        interval: float,
+        batch_size: int,
+        evict_links: Optional[Callable[[int], int]] = None,
+        metrics: Optional[BridgeMetrics] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self._message_store = message_store
+        self._retention = retention
+        self._interval = interval
+        self._batch_size = batch_size
+        self._evict_links = evict_links
+        self._clock = clock
+        self._task: Optional[asyncio.Task[None]] = None
+        metrics = metrics or BridgeMetrics()
+        self._runs = metrics.counter(
+            "bridge_retention_runs_total",
+            "Completed retention passes.",
+            ("result",),
+        )
+        self._purged = metrics.counter(
+            "bridge_retention_purged_rows_total",
+            "Message records deleted by the retention task.",
+        )
+        self._evicted = metrics.counter(
+            "bridge_retention_evicted_links_total",
+            "In-memory message ids evicted by the retention task.",
+        )
+        self._duration = metrics.histogram(
+            "bridge_retention_run_duration_seconds",
+            "Wall-clock time of a retention pass.",
+        )
+
+    def threshold_id(self) -> int:
+        """Return the smallest snowflake that is still inside the retention window."""
+        return discord.utils.time_snowflake(self._clock() - self._retention)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run_forever(), name="bridge-retention")
+        LOGGER.info(
+            "保持期間タスクを開始しました: retention=%s interval=%ss batch_size=%s",
+            self._retention,
+            self._interval,
+            self._batch_size,
+        )
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> RetentionRunResult:
+        started = time.perf_counter()
+        threshold_id = self.threshold_id()
+        purged = 0
+        batches = 0
+        while True:
+            deleted = await asyncio.to_thread(
+                self._message_store.purge_before_source,
+                threshold_id=threshold_id,
+                batch_size=self._batch_size,
+            )
+            batches += 1
+            purged += deleted
+            if deleted < self._batch_size:
+                break
+        await asyncio.to_thread(self._message_store.purge_claims_before_source, threshold_id=threshold_id)
+
+        evicted = self._evict_links(threshold_id) if self._evict_links is not None else 0
+        duration = time.perf_counter() - started
+
+        self._purged.inc(purged)
+        self._evicted.inc(evicted)
+        self._duration.observe(duration)
+        self._runs.labels(result="success").inc()
+        LOGGER.info(
+            "保持期間を過ぎたブリッジ記録を削除しました: rows=%s links=%s batches=%s elapsed=%.3fs",
+            purged,
+            evicted,
+            batches,
+            duration,
+        )
+        return RetentionRunResult(
+            threshold_id=threshold_id,
+            purged_rows=purged,
+            evicted_links=evicted,
+            batches=batches,
+            duration=duration,
+        )
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 - 次回の実行で再試行する
+                self._runs.labels(result="failure").inc()
+                LOGGER.exception("保持期間タスクの実行に失敗しました。次回の周期で再試行します。")
+            await asyncio.sleep(self._interval)
+
+
+__all__ = ["BridgeRetentionTask", "RetentionRunResult"]
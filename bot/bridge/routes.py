@@ -3,10 +3,16 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Set, Tuple
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
+#: ``group`` values accepted in a route payload besides explicit ``src``/``dst`` entries.
+ROUTE_GROUP_KINDS = ("mesh", "hub", "broadcast")
+#: Invalid or duplicate entries logged one by one before only their count is reported.
+_MAX_LOGGED_ISSUES = 10
+
 
 @dataclass(frozen=True, slots=True)
 class ChannelEndpoint:
@@ -16,7 +22,13 @@ class ChannelEndpoint:
     channel_name: str | None = None
 
     @classmethod
-    def from_payload(cls, payload: dict) -> "ChannelEndpoint":
+    def from_payload(cls, payload: dict | str) -> "ChannelEndpoint":
+        if isinstance(payload, str):
+            # "guild/channel" の短縮表記。
+            guild_text, separator, channel_text = payload.partition("/")
+            if not separator:
+                raise ValueError("エンドポイントは \"guild/channel\" 形式で指定してください。")
+            payload = {"guild": guild_text, "channel": channel_text}
         guild = int(payload["guild"])
         channel = int(payload["channel"])
         if guild <= 0 or channel <= 0:
@@ -60,10 +72,11 @@ def load_channel_routes(
     *,
     env_enabled: bool = False,
     env_payload: str | None = None,
+    routes_file: str | Path | None = None,
     require_reciprocal: bool = False,
     strict: bool = False,
 ) -> Sequence[ChannelRoute]:
-    """Load channel routing configuration from environment variables only."""
+    """Load channel routing configuration from ``BRIDGE_ROUTES`` or ``BRIDGE_ROUTES_FILE``."""
 
     if not env_enabled:
         LOGGER.info(
@@ -71,29 +84,50 @@ def load_channel_routes(
         )
         return ()
 
-    if env_payload is None:
+    if env_payload is not None and routes_file is not None:
         raise ValueError(
-            "BRIDGE_ROUTES_ENABLED=true ですが BRIDGE_ROUTES が未設定です。"
+            "BRIDGE_ROUTES と BRIDGE_ROUTES_FILE はどちらか一方のみ設定してください。"
+        )
+
+    if routes_file is not None:
+        source = "file"
+        LOGGER.info(
+            "ファイル %s を使用してチャンネルブリッジ設定をロードします。", routes_file
+        )
+        try:
+            text = Path(routes_file).read_text(encoding="utf-8")
+        except OSError as exc:
+            raise ValueError(
+                f"BRIDGE_ROUTES_FILE を読み込めませんでした: {routes_file} ({exc})"
+            ) from exc
+    elif env_payload is not None:
+        source = "environment"
+        LOGGER.info(
+            "環境変数 BRIDGE_ROUTES を使用してチャンネルブリッジ設定をロードします。"
+        )
+        text = env_payload
+    else:
+        raise ValueError(
+            "BRIDGE_ROUTES_ENABLED=true ですが BRIDGE_ROUTES と BRIDGE_ROUTES_FILE が未設定です。"
         )
 
-    LOGGER.info(
-        "環境変数 BRIDGE_ROUTES を使用してチャンネルブリッジ設定をロードします。"
-    )
     try:
-        payload: Iterable[dict] = json.loads(env_payload)
+        payload: Iterable[dict] = json.loads(text)
     except json.JSONDecodeError as exc:
-        raise ValueError("BRIDGE_ROUTES の JSON 解析に失敗しました。") from exc
+        name = "BRIDGE_ROUTES_FILE" if source == "file" else "BRIDGE_ROUTES"
+        raise ValueError(f"{name} の JSON 解析に失敗しました。") from exc
 
     routes = _parse_routes_payload(
         payload,
-        source="environment",
+        source=source,
         require_reciprocal=require_reciprocal,
         strict=strict,
     )
     if routes:
         LOGGER.info(
-            "チャンネルブリッジ設定を %s 件ロードしました。(source=environment)",
+            "チャンネルブリッジ設定を %s 件ロードしました。(source=%s)",
             len(routes),
+            source,
         )
     return routes
 
@@ -105,43 +139,93 @@ def _parse_routes_payload(
     require_reciprocal: bool,
     strict: bool,
 ) -> Sequence[ChannelRoute]:
+    """Validate explicit routes and expand route groups into directed routes.
+
+    Entries with a ``group`` key are expanded in place (see `_expand_group`).
+    Pairs covered by more than one group (or by a group and an explicit route)
+    are merged silently; only repeated explicit routes count as duplicates.
+    Issues past the first few are only counted, so a large payload logs a
+    bounded number of lines.
+    """
     routes: List[ChannelRoute] = []
     seen_pairs: Set[Tuple[Tuple[int, int], Tuple[int, int]]] = set()
+    explicit_pairs: Set[Tuple[Tuple[int, int], Tuple[int, int]]] = set()
+    parse_endpoint = _endpoint_parser()
+    issues = 0
+    groups = 0
+    merged = 0
+    log_routes = LOGGER.isEnabledFor(logging.DEBUG)
+
+    def report(message: str, exc: Exception | None = None) -> None:
+        nonlocal issues
+        if strict:
+            raise ValueError(message) from exc
+        issues += 1
+        if issues <= _MAX_LOGGED_ISSUES:
+            LOGGER.warning(message)
 
     for entry in payload:
         try:
-            src = ChannelEndpoint.from_payload(entry["src"])
-            dst = ChannelEndpoint.from_payload(entry["dst"])
+            if isinstance(entry, dict) and "group" in entry:
+                pairs = _expand_group(entry, parse_endpoint)
+                from_group = True
+            else:
+                pairs = [
+                    (
+                        parse_endpoint(entry["src"]),
+                        parse_endpoint(entry["dst"]),
+                    )
+                ]
+                from_group = False
         except (KeyError, TypeError, ValueError) as exc:
-            message = f"不正なルート定義をスキップしました: entry={entry}, error={exc}"
-            if strict:
-                raise ValueError(message) from exc
-            LOGGER.warning(message)
+            report(f"不正なルート定義をスキップしました: entry={entry}, error={exc}", exc)
             continue
+        if from_group:
+            groups += 1
 
-        pair_key = (src.key(), dst.key())
-        if pair_key in seen_pairs:
-            message = f"重複するルート定義をスキップしました: src={src}, dst={dst}"
-            if strict:
-                raise ValueError(message)
-            LOGGER.warning(message)
-            continue
-        seen_pairs.add(pair_key)
+        for src, dst in pairs:
+            pair_key = (src.key(), dst.key())
+            if not from_group:
+                if pair_key in explicit_pairs:
+                    report(f"重複するルート定義をスキップしました: src={src}, dst={dst}")
+                    continue
+                explicit_pairs.add(pair_key)
+            if pair_key in seen_pairs:
+                merged += 1
+                continue
+            seen_pairs.add(pair_key)
 
-        LOGGER.info("チャンネルブリッジを読み込み: %s -> %s", src, dst)
-        routes.append(ChannelRoute(src=src, dst=dst))
+            if log_routes:
+                LOGGER.debug("チャンネルブリッジを読み込み: %s -> %s", src, dst)
+            routes.append(ChannelRoute(src=src, dst=dst))
+
+    if issues > _MAX_LOGGED_ISSUES:
+        LOGGER.warning(
+            "ほかに %s 件の不正・重複したルート定義をスキップしました。(source=%s)",
+            issues - _MAX_LOGGED_ISSUES,
+            source,
+        )
+    if groups:
+        LOGGER.info(
+            "ルートグループ %s 件を展開しました: routes=%s, merged=%s (source=%s)",
+            groups,
+            len(routes),
+            merged,
+            source,
+        )
 
     if require_reciprocal:
-        pair_lookup = {(route.src.key(), route.dst.key()) for route in routes}
         missing = [
             route
             for route in routes
-            if (route.dst.key(), route.src.key()) not in pair_lookup
+            if (route.dst.key(), route.src.key()) not in seen_pairs
         ]
         if missing:
             problematic = ", ".join(
-                f"{route.src.key()}->{route.dst.key()}" for route in missing
+                f"{route.src.key()}->{route.dst.key()}" for route in missing[:_MAX_LOGGED_ISSUES]
             )
+            if len(missing) > _MAX_LOGGED_ISSUES:
+                problematic += f" ほか {len(missing) - _MAX_LOGGED_ISSUES} 件"
             raise ValueError(
                 "BRIDGE_ROUTES_REQUIRE_RECIPROCAL=true が設定されていますが、逆方向ルートが不足しています: "
                 + problematic
@@ -150,4 +234,85 @@ def _parse_routes_payload(
     return routes
 
 
-__all__ = ["ChannelEndpoint", "ChannelRoute", "load_channel_routes"]
+def _endpoint_parser() -> Callable[[dict | str], ChannelEndpoint]:
+    """Return a memoized `ChannelEndpoint.from_payload`.
+
+    Large payloads repeat the same few hundred channels across thousands of
+    routes, so each distinct endpoint is validated once and shared.
+    """
+    cache: Dict[object, ChannelEndpoint] = {}
+
+    def parse(payload: dict | str) -> ChannelEndpoint:
+        if isinstance(payload, dict):
+            key: object = (
+                payload.get("guild"),
+                payload.get("channel"),
+                payload.get("guild_name"),
+                payload.get("channel_name"),
+            )
+        else:
+            key = payload
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return ChannelEndpoint.from_payload(payload)
+        endpoint = cache[key] = ChannelEndpoint.from_payload(payload)
+        return endpoint
+
+    return parse
+
+
+def _expand_group(
+    entry: dict,
+    parse_endpoint: Callable[[dict | str], ChannelEndpoint],
+) -> List[Tuple[ChannelEndpoint, ChannelEndpoint]]:
+    """Expand a route group into directed ``(src, dst)`` pairs.
+
+    - ``{"group": "mesh", "channels": [...]}``: every channel to every other.
+    - ``{"group": "hub", "hub": ..., "spokes": [...]}``: hub and each spoke
+      both ways; spokes do not reach each other.
+    - ``{"group": "broadcast", "src": ..., "dst": [...]}``: one-way fan-out.
+    """
+    kind = entry["group"]
+    if kind == "mesh":
+        members = _group_members(entry["channels"], parse_endpoint)
+        if len(members) < 2:
+            raise ValueError("mesh には 2 つ以上のチャンネルを指定してください。")
+        return [(src, dst) for src in members for dst in members if src is not dst]
+    if kind == "hub":
+        hub = parse_endpoint(entry["hub"])
+        spokes = [spoke for spoke in _group_members(entry["spokes"], parse_endpoint) if spoke.key() != hub.key()]
+        if not spokes:
+            raise ValueError("hub には 1 つ以上の spokes を指定してください。")
+        pairs: List[Tuple[ChannelEndpoint, ChannelEndpoint]] = []
+        for spoke in spokes:
+            pairs.append((hub, spoke))
+            pairs.append((spoke, hub))
+        return pairs
+    if kind == "broadcast":
+        src = parse_endpoint(entry["src"])
+        destinations = [dst for dst in _group_members(entry["dst"], parse_endpoint) if dst.key() != src.key()]
+        if not destinations:
+            raise ValueError("broadcast には 1 つ以上の dst を指定してください。")
+        return [(src, dst) for dst in destinations]
+    raise ValueError(
+        f"未対応のルートグループです: {kind} (指定可能: {', '.join(ROUTE_GROUP_KINDS)})"
+    )
+
+
+def _group_members(
+    payload: Sequence[dict | str],
+    parse_endpoint: Callable[[dict | str], ChannelEndpoint],
+) -> List[ChannelEndpoint]:
+    if isinstance(payload, (str, dict)):
+        raise TypeError("チャンネルは配列で指定してください。")
+    members: Dict[Tuple[int, int], ChannelEndpoint] = {}
+    for item in payload:
+        endpoint = parse_endpoint(item)
+        members.setdefault(endpoint.key(), endpoint)
+    return list(members.values())
+
+
+__all__ = ["ROUTE_GROUP_KINDS", "ChannelEndpoint", "ChannelRoute", "load_channel_routes"]
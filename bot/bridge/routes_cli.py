@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List, Sequence
 
+from .capacity import DiscordLimits, TrafficProfile, analyze_routes, format_capacity_report
 from .routes import load_channel_routes
 
 
@@ -185,6 +186,88 @@ def _interactive_build() -> list[dict[str, Any]]:
     return routes
 
 
+def _analyze(args: argparse.Namespace) -> int:
+    """ルートファイルを読み込み、想定トラフィックでの REST 呼び出し数と余裕を表示する。"""
+
+    try:
+        routes = load_channel_routes(env_enabled=True, routes_file=args.routes_file)
+    except ValueError as exc:
+        print(f"[ERROR] ルート定義の読み込みに失敗しました: {exc}")
+        return 1
+
+    traffic = TrafficProfile(
+        messages_per_minute=args.message_rate,
+        edit_ratio=args.edit_ratio,
+        reactions_per_message=args.reactions_per_message,
+    )
+    limits = DiscordLimits(
+        global_rate=args.global_limit,
+        channel_message_rate=args.channel_message_limit,
+    )
+    report = analyze_routes(routes, traffic=traffic, limits=limits)
+    for line in format_capacity_report(report, top=args.top, warn_at=args.warn_at):
+        print(line)
+
+    if report.saturated:
+        print()
+        print("[ERROR] Discord のレート制限を超える見込みです。ルート構成か想定トラフィックを見直してください。")
+        return 1
+    return 0
+
+
+def _add_analyze_parser(subparsers: argparse._SubParsersAction) -> None:
+    defaults = TrafficProfile()
+    limits = DiscordLimits()
+    parser = subparsers.add_parser(
+        "analyze",
+        help="ルートファイルの実行時コスト (ファンアウト・REST 呼び出し数・レート制限の余裕) を表示します。",
+        description=(
+            "channel_routes.json を読み込み、送信元ごとのファンアウトと、"
+            "想定メッセージレートでの送信先チャンネルごとのレート制限の余裕を表示します。"
+            "上限を超える見込みのチャンネルがあると終了コード 1 を返します。"
+        ),
+    )
+    parser.add_argument("routes_file", type=Path, help="解析するルート定義 JSON ファイル")
+    parser.add_argument(
+        "--message-rate",
+        type=float,
+        default=defaults.messages_per_minute,
+        help=f"送信元チャンネルごとの想定メッセージ数 (件/分、既定: {defaults.messages_per_minute:g})",
+    )
+    parser.add_argument(
+        "--edit-ratio",
+        type=float,
+        default=defaults.edit_ratio,
+        help=f"編集されるメッセージの割合 (既定: {defaults.edit_ratio:g})",
+    )
+    parser.add_argument(
+        "--reactions-per-message",
+        type=float,
+        default=defaults.reactions_per_message,
+        help=f"メッセージ 1 件あたりのリアクション数 (既定: {defaults.reactions_per_message:g})",
+    )
+    parser.add_argument(
+        "--global-limit",
+        type=float,
+        default=limits.global_rate,
+        help=f"Bot 全体のリクエスト上限 (req/s、既定: {limits.global_rate:g})",
+    )
+    parser.add_argument(
+        "--channel-message-limit",
+        type=float,
+        default=limits.channel_message_rate,
+        help=f"チャンネルごとのメッセージ送信上限 (req/s、既定: {limits.channel_message_rate:g})",
+    )
+    parser.add_argument("--top", type=int, default=10, help="表示する送信元・送信先の件数 (既定: 10)")
+    parser.add_argument(
+        "--warn-at",
+        type=float,
+        default=0.8,
+        help="注意として表示する使用率 (既定: 0.8)",
+    )
+    parser.set_defaults(handler=_analyze)
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         prog="bridge-routes-cli",
@@ -193,6 +276,8 @@ def main(argv: Sequence[str] | None = None) -> int:
             "channel_routes.json に書き出す CLI です。"
         ),
     )
+    subparsers = parser.add_subparsers(dest="command", metavar="{analyze}")
+    _add_analyze_parser(subparsers)
     parser.add_argument(
         "-o",
         "--output",
@@ -207,6 +292,8 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
 
     args = parser.parse_args(list(argv) if argv is not None else None)
+    if args.command is not None:
+        return args.handler(args)
 
     routes = _interactive_build()
 
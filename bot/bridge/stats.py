@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .metrics import BridgeMetrics, Counter, Gauge
+
+#: Discord snowflakes carry a millisecond timestamp in their upper 42 bits.
+_SNOWFLAKE_TIMESTAMP_SHIFT = 22
+LAG_QUANTILES = (0.5, 0.95, 0.99)
+#: ``name -> (counter, hit labels, miss labels)`` of the ratios shown by /bridge_stats.
+_CACHE_RATIOS: Tuple[Tuple[str, str, Tuple[str, ...], Tuple[str, ...]], ...] = (
+    ("reply_remap", "bridge_reference_remaps_total", ("memory",), ("store", "miss")),
+    ("link_hydration", "bridge_link_hydrations_total", ("hit",), ("miss",)),
+    ("attachment_reuse", "bridge_attachments_total", ("reused",), ("uploaded", "transcoded")),
+    ("transcode_cache", "bridge_transcodes_total", ("cached",), ("success", "too_large", "skipped", "failed")),
+)
+
+
+def snowflake_lag(source_id: int, mirror_id: int) -> float:
+    """Seconds between the creation of a source message and its mirror."""
+    delta = (int(mirror_id) >> _SNOWFLAKE_TIMESTAMP_SHIFT) - (int(source_id) >> _SNOWFLAKE_TIMESTAMP_SHIFT)
+    return max(0.0, delta / 1000)
+
+
+class RollingPercentiles:
+    """Keep the samples of the last ``window`` seconds and report their percentiles."""
+
+    def __init__(
+        self,
+        *,
+        window: float = 300.0,
+        max_samples: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._window = window
+        self._clock = clock
+        self._created_at = clock()
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max(1, max_samples))
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    def observe(self, value: float) -> None:
+        self._samples.append((self._clock(), float(value)))
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._samples)
+
+    def rate(self) -> float:
+        """Samples per second over the window (or since creation, if shorter)."""
+        self._expire()
+        span = min(self._window, self._clock() - self._created_at)
+        return len(self._samples) / span if span > 0 else 0.0
+
+    def percentiles(self, quantiles: Sequence[float] = LAG_QUANTILES) -> Dict[float, Optional[float]]:
+        self._expire()
+        values = sorted(value for _, value in self._samples)
+        if not values:
+            return {quantile: None for quantile in quantiles}
+        # nearest-rank 法: 少ないサンプルでも実在する値を返す。
+        return {
+            quantile: values[min(len(values) - 1, max(0, math.ceil(quantile * len(values)) - 1))]
+            for quantile in quantiles
+        }
+
+    def _expire(self) -> None:
+        threshold = self._clock() - self._window
+        while self._samples and self._samples[0][0] < threshold:
+            self._samples.popleft()
+
+
+@dataclass(frozen=True, slots=True)
+class RouteErrorRate:
+    src: str
+    dst: str
+    success: int
+    failure: int
+
+    @property
+    def error_rate(self) -> float:
+        total = self.success + self.failure
+        return self.failure / total if total else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class BridgeStatsSnapshot:
+    uptime_seconds: float
+    window_seconds: float
+    mirrored_total: int
+    failed_total: int
+    mirrors_per_minute: float
+    lag_samples: int
+    lag_percentiles: Dict[float, Optional[float]]
+    routes: List[RouteErrorRate] = field(default_factory=list)
+    route_count: int = 0
+    cache_ratios: Dict[str, Optional[float]] = field(default_factory=dict)
+    queue_depths: Dict[str, float] = field(default_factory=dict)
+
+
+def collect_bridge_stats(
+    metrics: BridgeMetrics,
+    lag: RollingPercentiles,
+    *,
+    started_at: float,
+    clock: Callable[[], float] = time.monotonic,
+    max_routes: int = 10,
+    guild_id: Optional[int] = None,
+) -> BridgeStatsSnapshot:
+    """Summarize the metrics registry and the lag window for /bridge_stats.
+
+    Routes are ordered by error rate (then failures), worst first. With
+    ``guild_id`` only routes touching that guild are listed; the totals still
+    cover every route.
+    """
+    routes: Dict[Tuple[str, str], List[int]] = {}
+    route_family = metrics.get("bridge_route_messages_total")
+    guild_prefix = f"{guild_id}/" if guild_id is not None else None
+    if isinstance(route_family, Counter):
+        for (src, dst, result), value in route_family.items():
+            counts = routes.setdefault((src, dst), [0, 0])
+            counts[0 if result == "success" else 1] += int(value)
+    route_rates = [
+        RouteErrorRate(src=src, dst=dst, success=success, failure=failure)
+        for (src, dst), (success, failure) in routes.items()
+    ]
+    route_rates.sort(key=lambda route: (route.error_rate, route.failure), reverse=True)
+    listed = [
+        route
+        for route in route_rates
+        if guild_prefix is None or route.src.startswith(guild_prefix) or route.dst.startswith(guild_prefix)
+    ]
+
+    cache_ratios: Dict[str, Optional[float]] = {}
+    for name, family_name, hit_labels, miss_labels in _CACHE_RATIOS:
+        family = metrics.get(family_name)
+        if not isinstance(family, Counter):
+            continue
+        values: Dict[str, float] = {}
+        for key, value in family.items():
+            values[key[-1]] = values.get(key[-1], 0.0) + value
+        hits = sum(values.get(label, 0.0) for label in hit_labels)
+        total = hits + sum(values.get(label, 0.0) for label in miss_labels)
+        cache_ratios[name] = hits / total if total else None
+
+    queue_depths: Dict[str, float] = {}
+    queue_family = metrics.get("bridge_queue_depth")
+    if isinstance(queue_family, Gauge):
+        queue_depths = {key[0]: value for key, value in queue_family.items()}
+
+    return BridgeStatsSnapshot(
+        uptime_seconds=clock() - started_at,
+        window_seconds=lag.window,
+        mirrored_total=sum(route.success for route in route_rates),
+        failed_total=sum(route.failure for route in route_rates),
+        mirrors_per_minute=lag.rate() * 60,
+        lag_samples=len(lag),
+        lag_percentiles=lag.percentiles(),
+        routes=listed[:max_routes],
+        route_count=len(listed),
+        cache_ratios=cache_ratios,
+        queue_depths=queue_depths,
+    )
+
+
+def format_bridge_stats(snapshot: BridgeStatsSnapshot) -> List[str]:
+    """Render a snapshot as the lines of the /bridge_stats reply."""
+    window_minutes = snapshot.window_seconds / 60
+    lines = [
+        f"稼働時間: {_format_duration(snapshot.uptime_seconds)}",
+        f"転送: 成功 {snapshot.mirrored_total} 件 / 失敗 {snapshot.failed_total} 件"
+        f" (直近 {window_minutes:g} 分: {snapshot.mirrors_per_minute:.1f} 件/分)",
+    ]
+    if snapshot.lag_samples:
+        rendered = " / ".join(
+            f"p{quantile * 100:g} {_format_seconds(value)}"
+            for quantile, value in snapshot.lag_percentiles.items()
+        )
+        lines.append(f"遅延 (直近 {window_minutes:g} 分, {snapshot.lag_samples} 件): {rendered}")
+    else:
+        lines.append(f"遅延: 直近 {window_minutes:g} 分のミラーはありません")
+
+    if snapshot.queue_depths:
+        lines.append(
+            "キュー: " + ", ".join(f"{name}={value:g}" for name, value in sorted(snapshot.queue_depths.items()))
+        )
+    ratios = [
+        f"{name}={value:.0%}" for name, value in snapshot.cache_ratios.items() if value is not None
+    ]
+    if ratios:
+        lines.append("キャッシュヒット率: " + ", ".join(ratios))
+
+    if snapshot.routes:
+        shown = len(snapshot.routes)
+        lines.append(f"ルート別エラー率 (上位 {shown} / {snapshot.route_count} 件):")
+        for route in snapshot.routes:
+            lines.append(
+                f"- {route.src} → {route.dst}: {route.error_rate:.1%}"
+                f" (成功 {route.success} / 失敗 {route.failure})"
+            )
+    return lines
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value < 1:
+        return f"{value * 1000:.0f}ms"
+    return f"{value:.2f}s"
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}日 {hours}時間 {minutes}分"
+    if hours:
+        return f"{hours}時間 {minutes}分"
+    return f"{minutes}分 {secs}秒"
+
+
+__all__ = [
+    "BridgeStatsSnapshot",
+    "LAG_QUANTILES",
+    "RollingPercentiles",
+    "RouteErrorRate",
+    "collect_bridge_stats",
+    "format_bridge_stats",
+    "snowflake_lag",
+]
@@ -0,0 +1,13 @@
+from .base import BridgeStorageBackend
+from .memory import InMemoryStorageBackend
+from .postgres import PostgresStorageBackend
+from .sqlite import SqliteStorageBackend
+from .supabase import SupabaseStorageBackend
+
+__all__ = [
+    "BridgeStorageBackend",
+    "InMemoryStorageBackend",
+    "PostgresStorageBackend",
+    "SqliteStorageBackend",
+    "SupabaseStorageBackend",
+]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+Row = Dict[str, Any]
+
+MESSAGES_TABLE = "bridge_messages"
+PROFILES_TABLE = "bridge_profiles"
+LEASES_TABLE = "bridge_leases"
+CLAIMS_TABLE = "bridge_claims"
+
+#: Columns added to ``bridge_messages`` after the initial schema, with the
+#: statement that adds each one (see ``supabase/bridge_schema.sql``).
+MESSAGE_COLUMN_MIGRATIONS: Dict[str, str] = {
+    "payload_hash": f"ALTER TABLE {MESSAGES_TABLE} ADD COLUMN IF NOT EXISTS payload_hash TEXT;",
+    "message_locations": (
+        f"ALTER TABLE {MESSAGES_TABLE} ADD COLUMN IF NOT EXISTS message_locations "
+        "JSONB NOT NULL DEFAULT '{}'::jsonb;"
+    ),
+}
+
+
+class BridgeStorageBackend(ABC):
+    """Row-level persistence used by `BridgeMessageStore` and `BridgeProfileStore`.
+
+    Rows use the same shape as the Supabase tables: ``destination_ids`` and
+    ``attachment_notes`` are lists, ``guild_colors`` and ``message_locations``
+    are mappings and ``updated_at`` is an ISO 8601 string.
+    """
+
+    #: Human readable backend name used in diagnostics and logs.
+    label: str = "storage"
+
+    # bridge_messages -----------------------------------------------------
+
+    @abstractmethod
+    def upsert_message(self, row: Row) -> None:
+        """Insert or replace the row keyed by ``source_id``."""
+
+    @abstractmethod
+    def get_message(self, source_id: int) -> Optional[Row]:
+        """Return the row for ``source_id`` or ``None``."""
+
+    @abstractmethod
+    def update_message(self, source_id: int, fields: Row) -> None:
+        """Update the given columns of an existing row."""
+
+    @abstractmethod
+    def delete_message(self, source_id: int) -> bool:
+        """Delete the row for ``source_id`` and report whether it existed."""
+
+    @abstractmethod
+    def find_message_by_destination(self, destination_id: int) -> Optional[Row]:
+        """Return the row whose ``destination_ids`` contains ``destination_id``."""
+
+    def find_linked_message(self, message_id: int) -> Optional[Row]:
+        """Return the row keyed by ``message_id`` or whose ``destination_ids`` contains it.
+
+        Backends override this to answer with a single query.
+        """
+        return self.get_message(message_id) or self.find_message_by_destination(message_id)
+
+    @abstractmethod
+    def delete_messages_by_ids(self, message_ids: Sequence[int]) -> int:
+        """Forget ``message_ids`` whether they are sources or destinations.
+
+        Rows keyed by one of the ids are deleted, the ids are removed from the
+        ``destination_ids`` of the remaining rows and rows left without any
+        destination are deleted too. Returns the number of rows deleted.
+        """
+
+    @abstractmethod
+    def delete_messages_updated_before(self, threshold: datetime) -> int:
+        """Delete rows whose ``updated_at`` is older than ``threshold``."""
+
+    @abstractmethod
+    def delete_messages_before_source(self, threshold_id: int, *, limit: int) -> int:
+        """Delete at most ``limit`` rows whose ``source_id`` is below ``threshold_id``.
+
+        Discord snowflakes embed their creation time, so the primary key doubles
+        as a time index. Returns the number of rows removed.
+        """
+
+    # bridge_profiles -----------------------------------------------------
+
+    @abstractmethod
+    def get_profile_record(self, record_id: str) -> Optional[Row]:
+        """Return the profile dictionary row identified by ``record_id``."""
+
+    @abstractmethod
+    def upsert_profile_record(self, row: Row) -> None:
+        """Insert or replace the profile dictionary row keyed by ``id``."""
+
+    @abstractmethod
+    def update_profile_record(self, record_id: str, fields: Row) -> None:
+        """Update the given columns of the profile dictionary row."""
+
+    # bridge_claims -------------------------------------------------------
+
+    @abstractmethod
+    def claim_deliveries(self, source_id: int, channel_ids: Sequence[int]) -> List[int]:
+        """Claim the delivery of ``source_id`` to each of ``channel_ids``.
+
+        Returns the channel ids that had not been claimed before; the insert
+        must be atomic so that only one caller wins each ``(source, channel)``.
+        """
+
+    @abstractmethod
+    def release_delivery(self, source_id: int, channel_id: int) -> None:
+        """Drop a claim so that the delivery may be attempted again."""
+
+    @abstractmethod
+    def delete_claims_before_source(self, threshold_id: int) -> int:
+        """Delete claims whose ``source_id`` is below ``threshold_id``."""
+
+    # bridge_leases -------------------------------------------------------
+
+    @abstractmethod
+    def acquire_lease(self, resource: str, owner: str, *, ttl: float) -> bool:
+        """Take or renew the lease on ``resource`` for ``ttl`` seconds.
+
+        Succeeds when the lease is free, expired or already held by ``owner``;
+        the check and the write must be a single atomic statement so that two
+        processes can never both hold the same lease.
+        """
+
+    @abstractmethod
+    def release_lease(self, resource: str, owner: str) -> None:
+        """Drop the lease on ``resource`` if ``owner`` still holds it."""
+
+    @abstractmethod
+    def list_active_leases(self) -> List[Row]:
+        """Return ``resource``/``owner``/``expires_at`` rows of unexpired leases."""
+
+    # lifecycle -----------------------------------------------------------
+
+    def probe(self) -> None:
+        """Raise if the backend cannot serve requests."""
+        self.get_profile_record("__probe__")
+
+    def missing_message_columns(self) -> List[str]:
+        """Return the ``MESSAGE_COLUMN_MIGRATIONS`` columns the messages table lacks.
+
+        Backends that create their own schema never lack any.
+        """
+        return []
+
+    def close(self) -> None:
+        """Release connections held by the backend."""
+
+
+__all__ = [
+    "BridgeStorageBackend",
+    "CLAIMS_TABLE",
+    "LEASES_TABLE",
+    "MESSAGES_TABLE",
+    "MESSAGE_COLUMN_MIGRATIONS",
+    "PROFILES_TABLE",
+    "Row",
+]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import copy
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence
+
+from .base import BridgeStorageBackend, Row
+
+
+class InMemoryStorageBackend(BridgeStorageBackend):
+    """Keep bridge rows in process memory. Data is lost when the bot stops."""
+
+    label = "インメモリストア"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._messages: Dict[int, Row] = {}
+        self._destinations: Dict[int, int] = {}
+        self._profiles: Dict[str, Row] = {}
+        self._leases: Dict[str, Row] = {}
+        self._claims: set[tuple[int, int]] = set()
+
+    def upsert_message(self, row: Row) -> None:
+        source_id = int(row["source_id"])
+        with self._lock:
+            merged = dict(self._messages.get(source_id, {}))
+            merged.update(copy.deepcopy(row))
+            self._replace_message(source_id, merged)
+
+    def get_message(self, source_id: int) -> Optional[Row]:
+        with self._lock:
+            row = self._messages.get(int(source_id))
+            return copy.deepcopy(row) if row is not None else None
+
+    def update_message(self, source_id: int, fields: Row) -> None:
+        with self._lock:
+            row = self._messages.get(int(source_id))
+            if row is None:
+                return
+            merged = dict(row)
+            merged.update(copy.deepcopy(fields))
+            self._replace_message(int(source_id), merged)
+
+    def delete_message(self, source_id: int) -> bool:
+        with self._lock:
+            return self._pop_message(int(source_id))
+
+    def find_message_by_destination(self, destination_id: int) -> Optional[Row]:
+        with self._lock:
+            source_id = self._destinations.get(int(destination_id))
+            if source_id is None:
+                return None
+            return copy.deepcopy(self._messages[source_id])
+
+    def find_linked_message(self, message_id: int) -> Optional[Row]:
+        with self._lock:
+            source_id = int(message_id)
+            if source_id not in self._messages:
+                source_id = self._destinations.get(source_id, source_id)
+            row = self._messages.get(source_id)
+            return copy.deepcopy(row) if row is not None else None
+
+    def delete_messages_by_ids(self, message_ids: Sequence[int]) -> int:
+        with self._lock:
+            deleted = 0
+            removed_by_source: Dict[int, set[int]] = {}
+            for message_id in message_ids:
+                if self._pop_message(int(message_id)):
+                    deleted += 1
+                    continue
+                source_id = self._destinations.get(int(message_id))
+                if source_id is not None:
+                    removed_by_source.setdefault(source_id, set()).add(int(message_id))
+            now = datetime.now(timezone.utc).isoformat()
+            for source_id, removed in removed_by_source.items():
+                row = self._messages.get(source_id)
+                if row is None:
+                    continue
+                remaining = [
+                    value for value in row.get("destination_ids") or [] if int(value) not in removed
+                ]
+                if remaining:
+                    self._replace_message(
+                        source_id,
+                        {**row, "destination_ids": remaining, "updated_at": now},
+                    )
+                elif self._pop_message(source_id):
+                    deleted += 1
+            return deleted
+
+    def delete_messages_updated_before(self, threshold: datetime) -> int:
+        with self._lock:
+            expired = [
+                source_id
+                for source_id, row in self._messages.items()
+                if _as_datetime(row.get("updated_at")) < threshold
+            ]
+            for source_id in expired:
+                self._pop_message(source_id)
+            return len(expired)
+
+    def delete_messages_before_source(self, threshold_id: int, *, limit: int) -> int:
+        with self._lock:
+            expired = sorted(source_id for source_id in self._messages if source_id < threshold_id)
+            for source_id in expired[:limit]:
+                self._pop_message(source_id)
+            return min(len(expired), limit)
+
+    def get_profile_record(self, record_id: str) -> Optional[Row]:
+        with self._lock:
+            row = self._profiles.get(record_id)
+            return copy.deepcopy(row) if row is not None else None
+
+    def upsert_profile_record(self, row: Row) -> None:
+        with self._lock:
+            merged = dict(self._profiles.get(str(row["id"]), {}))
+            merged.update(copy.deepcopy(row))
+            self._profiles[str(row["id"])] = merged
+
+    def update_profile_record(self, record_id: str, fields: Row) -> None:
+        with self._lock:
+            row = self._profiles.get(record_id)
+            if row is not None:
+                row.update(copy.deepcopy(fields))
+
+    def claim_deliveries(self, source_id: int, channel_ids: Sequence[int]) -> List[int]:
+        with self._lock:
+            granted = []
+            for channel_id in channel_ids:
+                key = (int(source_id), int(channel_id))
+                if key not in self._claims:
+                    self._claims.add(key)
+                    granted.append(int(channel_id))
+            return granted
+
+    def release_delivery(self, source_id: int, channel_id: int) -> None:
+        with self._lock:
+            self._claims.discard((int(source_id), int(channel_id)))
+
+    def delete_claims_before_source(self, threshold_id: int) -> int:
+        with self._lock:
+            expired = {key for key in self._claims if key[0] < threshold_id}
+            self._claims -= expired
+            return len(expired)
+
+    def acquire_lease(self, resource: str, owner: str, *, ttl: float) -> bool:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            current = self._leases.get(resource)
+            if current is not None and current["owner"] != owner and current["expires_at"] > now:
+                return False
+            self._leases[resource] = {
+                "resource": resource,
+                "owner": owner,
+                "expires_at": now + timedelta(seconds=ttl),
+            }
+            return True
+
+    def release_lease(self, resource: str, owner: str) -> None:
+        with self._lock:
+            current = self._leases.get(resource)
+            if current is not None and current["owner"] == owner:
+                del self._leases[resource]
+
+    def list_active_leases(self) -> List[Row]:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            return [
+                {**row, "expires_at": row["expires_at"].isoformat()}
+                for row in self._leases.values()
+                if row["expires_at"] > now
+            ]
+
+    def probe(self) -> None:
+        return None
+
+    def _replace_message(self, source_id: int, row: Row) -> None:
+        previous = self._messages.get(source_id)
+        if previous is not None:
+            for destination_id in previous.get("destination_ids") or []:
+                if self._destinations.get(int(destination_id)) == source_id:
+                    self._destinations.pop(int(destination_id), None)
+        self._messages[source_id] = row
+        for destination_id in row.get("destination_ids") or []:
+            self._destinations[int(destination_id)] = source_id
+
+    def _pop_message(self, source_id: int) -> bool:
+        row = self._messages.pop(source_id, None)
+        if row is None:
+            return False
+        for destination_id in row.get("destination_ids") or []:
+            if self._destinations.get(int(destination_id)) == source_id:
+                self._destinations.pop(int(destination_id), None)
+        return True
+
+
+def _as_datetime(value: object) -> datetime:
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        parsed = datetime.fromisoformat(value)
+    else:
+        return datetime.now(timezone.utc)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+__all__ = ["InMemoryStorageBackend"]
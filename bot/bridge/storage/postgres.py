@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .base import (
+    CLAIMS_TABLE,
+    LEASES_TABLE,
+    MESSAGE_COLUMN_MIGRATIONS,
+    MESSAGES_TABLE,
+    PROFILES_TABLE,
+    BridgeStorageBackend,
+    Row,
+)
+
+_MESSAGE_COLUMNS = (
+    "source_id",
+    "destination_ids",
+    "profile_seed",
+    "display_name",
+    "avatar_url",
+    "dicebear_failed",
+    "image_filename",
+    "attachment_notes",
+    "payload_hash",
+    "message_locations",
+    "updated_at",
+)
+_PROFILE_COLUMNS = ("id", "adjectives", "nouns", "guild_colors", "updated_at")
+_JSON_COLUMNS = frozenset(
+    {"destination_ids", "attachment_notes", "adjectives", "nouns", "guild_colors", "message_locations"}
+)
+_JSON_OBJECT_COLUMNS = frozenset({"guild_colors", "message_locations"})
+
+_SQL_GET_MESSAGE = f"SELECT * FROM {MESSAGES_TABLE} WHERE source_id = %s"
+_SQL_DELETE_MESSAGE = f"DELETE FROM {MESSAGES_TABLE} WHERE source_id = %s"
+_SQL_FIND_BY_DESTINATION = (
+    f"SELECT * FROM {MESSAGES_TABLE} WHERE destination_ids @> %s LIMIT 1"
+)
+_SQL_FIND_LINKED = (
+    f"SELECT * FROM {MESSAGES_TABLE} WHERE source_id = %s OR destination_ids @> %s "
+    "ORDER BY source_id = %s DESC LIMIT 1"
+)
+_SQL_DELETE_SOURCES = f"DELETE FROM {MESSAGES_TABLE} WHERE source_id = ANY(%s)"
+_SQL_REMOVE_DESTINATIONS = (
+    f"UPDATE {MESSAGES_TABLE} AS m SET "
+    "destination_ids = COALESCE(("
+    "SELECT jsonb_agg(e.value ORDER BY e.value::bigint) "
+    "FROM jsonb_array_elements(m.destination_ids) AS e "
+    "WHERE NOT (e.value::bigint = ANY(%s))), '[]'::jsonb), "
+    "updated_at = clock_timestamp() "
+    "WHERE m.destination_ids @> ANY(%s::jsonb[]) "
+    "RETURNING m.source_id, m.destination_ids = '[]'::jsonb AS emptied"
+)
+_SQL_DELETE_UPDATED_BEFORE = f"DELETE FROM {MESSAGES_TABLE} WHERE updated_at < %s"
+_SQL_DELETE_BEFORE_SOURCE = (
+    f"DELETE FROM {MESSAGES_TABLE} WHERE source_id IN ("
+    f"SELECT source_id FROM {MESSAGES_TABLE} WHERE source_id < %s "
+    "ORDER BY source_id LIMIT %s)"
+)
+_SQL_GET_PROFILE = f"SELECT * FROM {PROFILES_TABLE} WHERE id = %s"
+_SQL_EXISTING_COLUMNS = (
+    "SELECT column_name FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND table_name = %s AND column_name = ANY(%s)"
+)
+_SQL_CLAIM_DELIVERIES = (
+    f"INSERT INTO {CLAIMS_TABLE} (source_id, channel_id) "
+    "SELECT %s, unnest(%s::bigint[]) "
+    "ON CONFLICT (source_id, channel_id) DO NOTHING RETURNING channel_id"
+)
+_SQL_RELEASE_DELIVERY = f"DELETE FROM {CLAIMS_TABLE} WHERE source_id = %s AND channel_id = %s"
+_SQL_DELETE_CLAIMS_BEFORE_SOURCE = f"DELETE FROM {CLAIMS_TABLE} WHERE source_id < %s"
+_SQL_ACQUIRE_LEASE = (
+    f"INSERT INTO {LEASES_TABLE} (resource, owner, expires_at) "
+    "VALUES (%s, %s, clock_timestamp() + make_interval(secs => %s)) "
+    "ON CONFLICT (resource) DO UPDATE SET "
+    "owner = EXCLUDED.owner, expires_at = EXCLUDED.expires_at "
+    f"WHERE {LEASES_TABLE}.owner = EXCLUDED.owner "
+    f"OR {LEASES_TABLE}.expires_at < clock_timestamp()"
+)
+_SQL_RELEASE_LEASE = f"DELETE FROM {LEASES_TABLE} WHERE resource = %s AND owner = %s"
+_SQL_ACTIVE_LEASES = (
+    f"SELECT resource, owner, expires_at FROM {LEASES_TABLE} "
+    "WHERE expires_at >= clock_timestamp()"
+)
+
+
+class PostgresStorageBackend(BridgeStorageBackend):
+    """Talk to PostgreSQL directly through a psycopg connection pool.
+
+    Every statement is sent with ``prepare=True`` so the server keeps a
+    prepared plan per pooled connection. Calls are blocking; the bridge runs
+    them in worker threads so the pool can serve them concurrently.
+    """
+
+    label = "PostgreSQL"
+
+    def __init__(self, dsn: str, *, min_size: int = 1, max_size: int = 5) -> None:
+        psycopg, pool_module, jsonb = _import_psycopg()
+        self._jsonb = jsonb
+        self._rows = psycopg.rows.dict_row
+        self._pool = pool_module.ConnectionPool(
+            dsn,
+            min_size=min_size,
+            max_size=max_size,
+            kwargs={"autocommit": True},
+            open=True,
+            name="bridge-postgres",
+        )
+
+    # bridge_messages -----------------------------------------------------
+
+    def upsert_message(self, row: Row) -> None:
+        _reject_unknown(row, _MESSAGE_COLUMNS)
+        names = _row_columns(row)
+        self._execute(_upsert_message_sql(names), self._message_values(row, names))
+
+    def get_message(self, source_id: int) -> Optional[Row]:
+        return self._fetch_one(_SQL_GET_MESSAGE, (int(source_id),))
+
+    def update_message(self, source_id: int, fields: Row) -> None:
+        _reject_unknown(fields, _MESSAGE_COLUMNS)
+        names = [name for name in fields if name != "source_id"]
+        if not names:
+            return
+        assignments = ", ".join(f"{name} = %s" for name in names)
+        self._execute(
+            f"UPDATE {MESSAGES_TABLE} SET {assignments} WHERE source_id = %s",
+            [*(self._encode(name, fields[name]) for name in names), int(source_id)],
+        )
+
+    def delete_message(self, source_id: int) -> bool:
+        return self._execute(_SQL_DELETE_MESSAGE, (int(source_id),)) > 0
+
+    def find_message_by_destination(self, destination_id: int) -> Optional[Row]:
+        return self._fetch_one(_SQL_FIND_BY_DESTINATION, (self._jsonb([int(destination_id)]),))
+
+    def find_linked_message(self, message_id: int) -> Optional[Row]:
+        message_id = int(message_id)
+        return self._fetch_one(_SQL_FIND_LINKED, (message_id, self._jsonb([message_id]), message_id))
+
+    def delete_messages_by_ids(self, message_ids: Sequence[int]) -> int:
+        ids = [int(message_id) for message_id in message_ids]
+        if not ids:
+            return 0
+        probes = [f"[{message_id}]" for message_id in ids]
+        with self._pool.connection() as connection:
+            with connection.transaction():
+                deleted = connection.execute(_SQL_DELETE_SOURCES, (ids,), prepare=True).rowcount
+                updated = connection.execute(
+                    _SQL_REMOVE_DESTINATIONS, (ids, probes), prepare=True
+                ).fetchall()
+                emptied = [source_id for source_id, is_empty in updated if is_empty]
+                if emptied:
+                    deleted += connection.execute(
+                        _SQL_DELETE_SOURCES, (emptied,), prepare=True
+                    ).rowcount
+        return deleted
+
+    def delete_messages_updated_before(self, threshold: datetime) -> int:
+        return self._execute(_SQL_DELETE_UPDATED_BEFORE, (threshold,))
+
+    def delete_messages_before_source(self, threshold_id: int, *, limit: int) -> int:
+        return self._execute(_SQL_DELETE_BEFORE_SOURCE, (int(threshold_id), int(limit)))
+
+    # bridge_profiles -----------------------------------------------------
+
+    def get_profile_record(self, record_id: str) -> Optional[Row]:
+        return self._fetch_one(_SQL_GET_PROFILE, (record_id,))
+
+    def upsert_profile_record(self, row: Row) -> None:
+        _reject_unknown(row, _PROFILE_COLUMNS)
+        names = [name for name in _PROFILE_COLUMNS if name in row]
+        updates = ", ".join(f"{name} = EXCLUDED.{name}" for name in names if name != "id")
+        conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        self._execute(
+            f"INSERT INTO {PROFILES_TABLE} ({', '.join(names)}) "
+            f"VALUES ({', '.join(['%s'] * len(names))}) "
+            f"ON CONFLICT (id) {conflict}",
+            [self._encode(name, row[name]) for name in names],
+        )
+
+    def update_profile_record(self, record_id: str, fields: Row) -> None:
+        _reject_unknown(fields, _PROFILE_COLUMNS)
+        names = [name for name in fields if name != "id"]
+        if not names:
+            return
+        assignments = ", ".join(f"{name} = %s" for name in names)
+        self._execute(
+            f"UPDATE {PROFILES_TABLE} SET {assignments} WHERE id = %s",
+            [*(self._encode(name, fields[name]) for name in names), record_id],
+        )
+
+    # bridge_claims -------------------------------------------------------
+
+    def claim_deliveries(self, source_id: int, channel_ids: Sequence[int]) -> List[int]:
+        with self._pool.connection() as connection:
+            cursor = connection.execute(
+                _SQL_CLAIM_DELIVERIES,
+                (int(source_id), [int(channel_id) for channel_id in channel_ids]),
+                prepare=True,
+            )
+            return [int(row[0]) for row in cursor.fetchall()]
+
+    def release_delivery(self, source_id: int, channel_id: int) -> None:
+        self._execute(_SQL_RELEASE_DELIVERY, (int(source_id), int(channel_id)))
+
+    def delete_claims_before_source(self, threshold_id: int) -> int:
+        return self._execute(_SQL_DELETE_CLAIMS_BEFORE_SOURCE, (int(threshold_id),))
+
+    # bridge_leases -------------------------------------------------------
+
+    def acquire_lease(self, resource: str, owner: str, *, ttl: float) -> bool:
+        return self._execute(_SQL_ACQUIRE_LEASE, (resource, owner, float(ttl))) > 0
+
+    def release_lease(self, resource: str, owner: str) -> None:
+        self._execute(_SQL_RELEASE_LEASE, (resource, owner))
+
+    def list_active_leases(self) -> List[Row]:
+        with self._pool.connection() as connection:
+            with connection.cursor(row_factory=self._rows) as cursor:
+                cursor.execute(_SQL_ACTIVE_LEASES, (), prepare=True)
+                rows = cursor.fetchall()
+        return [
+            {**row, "expires_at": row["expires_at"].astimezone(timezone.utc).isoformat()}
+            for row in rows
+        ]
+
+    # lifecycle -----------------------------------------------------------
+
+    def probe(self) -> None:
+        self._fetch_one("SELECT 1 AS ok", ())
+
+    def missing_message_columns(self) -> List[str]:
+        with self._pool.connection() as connection:
+            cursor = connection.execute(_SQL_EXISTING_COLUMNS, (MESSAGES_TABLE, list(MESSAGE_COLUMN_MIGRATIONS)))
+            existing = {row[0] for row in cursor.fetchall()}
+        return [column for column in MESSAGE_COLUMN_MIGRATIONS if column not in existing]
+
+    def close(self) -> None:
+        self._pool.close()
+
+    # helpers -------------------------------------------------------------
+
+    def _execute(self, query: str, params: Sequence[Any]) -> int:
+        with self._pool.connection() as connection:
+            cursor = connection.execute(query, params, prepare=True)
+            return cursor.rowcount
+
+    def _fetch_one(self, query: str, params: Sequence[Any]) -> Optional[Row]:
+        with self._pool.connection() as connection:
+            with connection.cursor(row_factory=self._rows) as cursor:
+                cursor.execute(query, params, prepare=True)
+                row = cursor.fetchone()
+        return _decode_row(row) if row is not None else None
+
+    def _message_values(self, row: Row, names: Sequence[str]) -> List[Any]:
+        return [self._encode(name, row.get(name)) for name in names]
+
+    def _encode(self, name: str, value: Any) -> Any:
+        if name in _JSON_COLUMNS:
+            return self._jsonb(
+                value if value is not None else ({} if name in _JSON_OBJECT_COLUMNS else [])
+            )
+        if name == "updated_at":
+            return _as_datetime(value)
+        return value
+
+
+def _row_columns(row: Row) -> Tuple[str, ...]:
+    """Columns ``row`` provides, in table order; ``source_id`` always comes first."""
+    return tuple(name for name in _MESSAGE_COLUMNS if name == "source_id" or name in row)
+
+
+@lru_cache(maxsize=None)
+def _upsert_message_sql(names: Tuple[str, ...]) -> str:
+    return (
+        f"INSERT INTO {MESSAGES_TABLE} ({', '.join(names)}) "
+        f"VALUES ({', '.join(['%s'] * len(names))}) "
+        "ON CONFLICT (source_id) DO UPDATE SET "
+        + ", ".join(f"{name} = EXCLUDED.{name}" for name in names[1:])
+    )
+
+
+def _reject_unknown(row: Row, columns: Iterable[str]) -> None:
+    unknown = set(row) - set(columns)
+    if unknown:
+        raise ValueError(f"unknown column for PostgreSQL backend: {sorted(unknown)}")
+
+
+def _decode_row(row: Dict[str, Any]) -> Row:
+    decoded = dict(row)
+    updated_at = decoded.get("updated_at")
+    if isinstance(updated_at, datetime):
+        decoded["updated_at"] = updated_at.astimezone(timezone.utc).isoformat()
+    return decoded
+
+
+def _as_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        parsed = datetime.fromisoformat(value)
+    else:
+        return datetime.now(timezone.utc)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _import_psycopg():  # noqa: ANN202 - 遅延 import のため戻り値型は省略
+    try:
+        import psycopg
+        import psycopg.rows
+        import psycopg_pool
+        from psycopg.types.json import Jsonb
+    except ImportError as exc:  # pragma: no cover - 依存関係の欠如を明示する
+        raise RuntimeError(
+            "PostgreSQL バックエンドには psycopg が必要です。"
+            "`poetry install --extras postgres` を実行してください。"
+        ) from exc
+    return psycopg, psycopg_pool, Jsonb
+
+
+__all__ = ["PostgresStorageBackend"]
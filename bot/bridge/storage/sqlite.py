@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .base import CLAIMS_TABLE, LEASES_TABLE, MESSAGES_TABLE, PROFILES_TABLE, BridgeStorageBackend, Row
+
+_MESSAGE_COLUMNS: Dict[str, str] = {
+    "source_id": "INTEGER PRIMARY KEY",
+    "destination_ids": "TEXT NOT NULL DEFAULT '[]'",
+    "profile_seed": "TEXT NOT NULL DEFAULT ''",
+    "display_name": "TEXT NOT NULL DEFAULT ''",
+    "avatar_url": "TEXT NOT NULL DEFAULT ''",
+    "dicebear_failed": "INTEGER NOT NULL DEFAULT 0",
+    "image_filename": "TEXT",
+    "attachment_notes": "TEXT NOT NULL DEFAULT '[]'",
+    "payload_hash": "TEXT",
+    "message_locations": "TEXT NOT NULL DEFAULT '{}'",
+    "updated_at": "TEXT NOT NULL",
+}
+
+_PROFILE_COLUMNS: Dict[str, str] = {
+    "id": "TEXT PRIMARY KEY",
+    "adjectives": "TEXT NOT NULL DEFAULT '[]'",
+    "nouns": "TEXT NOT NULL DEFAULT '[]'",
+    "guild_colors": "TEXT NOT NULL DEFAULT '{}'",
+    "updated_at": "TEXT",
+}
+
+_JSON_DEFAULTS: Dict[str, object] = {
+    "destination_ids": [],
+    "attachment_notes": [],
+    "adjectives": [],
+    "nouns": [],
+    "guild_colors": {},
+    "message_locations": {},
+}
+_JSON_COLUMNS = frozenset(_JSON_DEFAULTS)
+_BOOL_COLUMNS = frozenset({"dicebear_failed"})
+_DESTINATIONS_TABLE = "bridge_message_destinations"
+#: Milliseconds a writer waits for another process holding the database lock.
+_BUSY_TIMEOUT_MS = 5000
+
+
+class SqliteStorageBackend(BridgeStorageBackend):
+    """Persist bridge rows in a local SQLite database running in WAL mode."""
+
+    label = "SQLite"
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        if str(path) != ":memory:":
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(path),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
+        self._create_schema()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _create_schema(self) -> None:
+        with self._lock:
+            self._create_table(MESSAGES_TABLE, _MESSAGE_COLUMNS)
+            self._create_table(PROFILES_TABLE, _PROFILE_COLUMNS)
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {CLAIMS_TABLE} ("
+                "source_id INTEGER NOT NULL, "
+                "channel_id INTEGER NOT NULL, "
+                "PRIMARY KEY (source_id, channel_id))"
+            )
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {LEASES_TABLE} ("
+                "resource TEXT PRIMARY KEY, "
+                "owner TEXT NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {_DESTINATIONS_TABLE} ("
+                "destination_id INTEGER PRIMARY KEY, "
+                "source_id INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {_DESTINATIONS_TABLE}_source_idx "
+                f"ON {_DESTINATIONS_TABLE} (source_id)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {MESSAGES_TABLE}_updated_at_idx "
+                f"ON {MESSAGES_TABLE} (updated_at)"
+            )
+
+    def _create_table(self, table: str, columns: Dict[str, str]) -> None:
+        definition = ", ".join(f"{name} {spec}" for name, spec in columns.items())
+        self._connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definition})")
+        existing = {row["name"] for row in self._connection.execute(f"PRAGMA table_info({table})")}
+        for name, spec in columns.items():
+            if name not in existing:
+                self._connection.execute(f"ALTER TABLE {table} ADD COLUMN {name} {spec}")
+
+    # bridge_messages -----------------------------------------------------
+
+    def upsert_message(self, row: Row) -> None:
+        with self._lock, self._transaction():
+            self._upsert_message(row)
+
+    def get_message(self, source_id: int) -> Optional[Row]:
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT * FROM {MESSAGES_TABLE} WHERE source_id = ?",
+                (int(source_id),),
+            )
+            return _decode_row(cursor.fetchone())
+
+    def update_message(self, source_id: int, fields: Row) -> None:
+        values = _encode_row(fields, _MESSAGE_COLUMNS)
+        values.pop("source_id", None)
+        if not values:
+            return
+        assignments = ", ".join(f"{name} = ?" for name in values)
+        with self._lock, self._transaction():
+            cursor = self._connection.execute(
+                f"UPDATE {MESSAGES_TABLE} SET {assignments} WHERE source_id = ?",
+                (*values.values(), int(source_id)),
+            )
+            if cursor.rowcount and "destination_ids" in fields:
+                self._replace_destinations(int(source_id), fields["destination_ids"])
+
+    def delete_message(self, source_id: int) -> bool:
+        with self._lock, self._transaction():
+            cursor = self._connection.execute(
+                f"DELETE FROM {MESSAGES_TABLE} WHERE source_id = ?",
+                (int(source_id),),
+            )
+            self._connection.execute(
+                f"DELETE FROM {_DESTINATIONS_TABLE} WHERE source_id = ?",
+                (int(source_id),),
+            )
+            return cursor.rowcount > 0
+
+    def find_message_by_destination(self, destination_id: int) -> Optional[Row]:
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT m.* FROM {_DESTINATIONS_TABLE} d "
+                f"JOIN {MESSAGES_TABLE} m ON m.source_id = d.source_id "
+                "WHERE d.destination_id = ?",
+                (int(destination_id),),
+            )
+            return _decode_row(cursor.fetchone())
+
+    def find_linked_message(self, message_id: int) -> Optional[Row]:
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT * FROM {MESSAGES_TABLE} WHERE source_id = ? OR source_id IN "
+                f"(SELECT source_id FROM {_DESTINATIONS_TABLE} WHERE destination_id = ?) "
+                "ORDER BY source_id = ? DESC LIMIT 1",
+                (int(message_id), int(message_id), int(message_id)),
+            )
+            return _decode_row(cursor.fetchone())
+
+    def delete_messages_by_ids(self, message_ids: Sequence[int]) -> int:
+        ids = [int(message_id) for message_id in message_ids]
+        if not ids:
+            return 0
+        placeholders = ", ".join("?" for _ in ids)
+        with self._lock, self._transaction():
+            deleted = self._connection.execute(
+                f"DELETE FROM {MESSAGES_TABLE} WHERE source_id IN ({placeholders})",
+                ids,
+            ).rowcount
+            self._connection.execute(
+                f"DELETE FROM {_DESTINATIONS_TABLE} WHERE source_id IN ({placeholders})",
+                ids,
+            )
+            affected = [
+                row["source_id"]
+                for row in self._connection.execute(
+                    f"SELECT DISTINCT source_id FROM {_DESTINATIONS_TABLE} "
+                    f"WHERE destination_id IN ({placeholders})",
+                    ids,
+                )
+            ]
+            if not affected:
+                return deleted
+            self._connection.execute(
+                f"DELETE FROM {_DESTINATIONS_TABLE} WHERE destination_id IN ({placeholders})",
+                ids,
+            )
+            now = datetime.now(timezone.utc).isoformat()
+            for source_id in affected:
+                remaining = [
+                    row["destination_id"]
+                    for row in self._connection.execute(
+                        f"SELECT destination_id FROM {_DESTINATIONS_TABLE} "
+                        "WHERE source_id = ? ORDER BY destination_id",
+                        (source_id,),
+                    )
+                ]
+                if remaining:
+                    self._connection.execute(
+                        f"UPDATE {MESSAGES_TABLE} SET destination_ids = ?, updated_at = ? "
+                        "WHERE source_id = ?",
+                        (json.dumps(remaining), now, source_id),
+                    )
+                else:
+                    deleted += self._connection.execute(
+                        f"DELETE FROM {MESSAGES_TABLE} WHERE source_id = ?",
+                        (source_id,),
+                    ).rowcount
+            return deleted
+
+    def delete_messages_updated_before(self, threshold: datetime) -> int:
+        with self._lock, self._transaction():
+            self._connection.execute(
+                f"DELETE FROM {_DESTINATIONS_TABLE} WHERE source_id IN ("
+                f"SELECT source_id FROM {MESSAGES_TABLE} WHERE updated_at < ?)",
+                (threshold.isoformat(),),
+            )
+            cursor = self._connection.execute(
+                f"DELETE FROM {MESSAGES_TABLE} WHERE updated_at < ?",
+                (threshold.isoformat(),),
+            )
+            return cursor.rowcount
+
+    def delete_messages_before_source(self, threshold_id: int, *, limit: int) -> int:
+        with self._lock, self._transaction():
+            source_ids = [
+                row["source_id"]
+                for row in self._connection.execute(
+                    f"SELECT source_id FROM {MESSAGES_TABLE} WHERE source_id < ? "
+                    "ORDER BY source_id LIMIT ?",
+                    (int(threshold_id), int(limit)),
+                )
+            ]
+            if not source_ids:
+                return 0
+            placeholders = ", ".join("?" for _ in source_ids)
+            self._connection.execute(
+                f"DELETE FROM {_DESTINATIONS_TABLE} WHERE source_id IN ({placeholders})",
+                source_ids,
+            )
+            cursor = self._connection.execute(
+                f"DELETE FROM {MESSAGES_TABLE} WHERE source_id IN ({placeholders})",
+                source_ids,
+            )
+            return cursor.rowcount
+
+    # bridge_profiles -----------------------------------------------------
+
+    def get_profile_record(self, record_id: str) -> Optional[Row]:
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT * FROM {PROFILES_TABLE} WHERE id = ?",
+                (record_id,),
+            )
+            return _decode_row(cursor.fetchone())
+
+    def upsert_profile_record(self, row: Row) -> None:
+        values = _encode_row(row, _PROFILE_COLUMNS)
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        updates = ", ".join(f"{name} = excluded.{name}" for name in values if name != "id")
+        with self._lock:
+            self._connection.execute(
+                f"INSERT INTO {PROFILES_TABLE} ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT(id) DO UPDATE SET {updates}",
+                tuple(values.values()),
+            )
+
+    def update_profile_record(self, record_id: str, fields: Row) -> None:
+        values = _encode_row(fields, _PROFILE_COLUMNS)
+        values.pop("id", None)
+        if not values:
+            return
+        assignments = ", ".join(f"{name} = ?" for name in values)
+        with self._lock:
+            self._connection.execute(
+                f"UPDATE {PROFILES_TABLE} SET {assignments} WHERE id = ?",
+                (*values.values(), record_id),
+            )
+
+    # bridge_claims -------------------------------------------------------
+
+    def claim_deliveries(self, source_id: int, channel_ids: Sequence[int]) -> List[int]:
+        granted = []
+        with self._lock, self._transaction():
+            for channel_id in channel_ids:
+                cursor = self._connection.execute(
+                    f"INSERT OR IGNORE INTO {CLAIMS_TABLE} (source_id, channel_id) VALUES (?, ?)",
+                    (int(source_id), int(channel_id)),
+                )
+                if cursor.rowcount > 0:
+                    granted.append(int(channel_id))
+        return granted
+
+    def release_delivery(self, source_id: int, channel_id: int) -> None:
+        with self._lock:
+            self._connection.execute(
+                f"DELETE FROM {CLAIMS_TABLE} WHERE source_id = ? AND channel_id = ?",
+                (int(source_id), int(channel_id)),
+            )
+
+    def delete_claims_before_source(self, threshold_id: int) -> int:
+        with self._lock:
+            cursor = self._connection.execute(
+                f"DELETE FROM {CLAIMS_TABLE} WHERE source_id < ?",
+                (int(threshold_id),),
+            )
+            return cursor.rowcount
+
+    # bridge_leases -------------------------------------------------------
+
+    def acquire_lease(self, resource: str, owner: str, *, ttl: float) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                f"INSERT INTO {LEASES_TABLE} (resource, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(resource) DO UPDATE SET "
+                "owner = excluded.owner, expires_at = excluded.expires_at "
+                f"WHERE {LEASES_TABLE}.owner = excluded.owner OR {LEASES_TABLE}.expires_at < ?",
+                (resource, owner, now + ttl, now),
+            )
+            return cursor.rowcount > 0
+
+    def release_lease(self, resource: str, owner: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                f"DELETE FROM {LEASES_TABLE} WHERE resource = ? AND owner = ?",
+                (resource, owner),
+            )
+
+    def list_active_leases(self) -> List[Row]:
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT resource, owner, expires_at FROM {LEASES_TABLE} WHERE expires_at >= ?",
+                (time.time(),),
+            )
+            rows = cursor.fetchall()
+        return [
+            {
+                "resource": row["resource"],
+                "owner": row["owner"],
+                "expires_at": datetime.fromtimestamp(row["expires_at"], timezone.utc).isoformat(),
+            }
+            for row in rows
+        ]
+
+    def probe(self) -> None:
+        with self._lock:
+            self._connection.execute("SELECT 1").fetchone()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    # helpers -------------------------------------------------------------
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connection)
+
+    def _upsert_message(self, row: Row) -> None:
+        values = _encode_row(row, _MESSAGE_COLUMNS)
+        source_id = int(row["source_id"])
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        updates = ", ".join(f"{name} = excluded.{name}" for name in values if name != "source_id")
+        self._connection.execute(
+            f"INSERT INTO {MESSAGES_TABLE} ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT(source_id) DO UPDATE SET {updates}",
+            tuple(values.values()),
+        )
+        if "destination_ids" in row:
+            self._replace_destinations(source_id, row["destination_ids"])
+
+    def _replace_destinations(self, source_id: int, destination_ids: Iterable[object]) -> None:
+        self._connection.execute(
+            f"DELETE FROM {_DESTINATIONS_TABLE} WHERE source_id = ?",
+            (source_id,),
+        )
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO {_DESTINATIONS_TABLE} (destination_id, source_id) VALUES (?, ?)",
+            [(int(destination_id), source_id) for destination_id in destination_ids],
+        )
+
+
+class _Transaction:
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def __enter__(self) -> None:
+        self._connection.execute("BEGIN")
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        if exc_type is None:
+            self._connection.execute("COMMIT")
+        else:
+            self._connection.execute("ROLLBACK")
+
+
+def _encode_row(row: Row, columns: Dict[str, str]) -> Row:
+    encoded: Row = {}
+    for name, value in row.items():
+        if name not in columns:
+            raise ValueError(f"unknown column for SQLite backend: {name}")
+        if name in _JSON_COLUMNS:
+            encoded[name] = json.dumps(
+                value if value is not None else _JSON_DEFAULTS[name],
+                ensure_ascii=False,
+            )
+        elif name in _BOOL_COLUMNS:
+            encoded[name] = int(bool(value))
+        elif isinstance(value, datetime):
+            encoded[name] = value.isoformat()
+        else:
+            encoded[name] = value
+    return encoded
+
+
+def _decode_row(row: Optional[sqlite3.Row]) -> Optional[Row]:
+    if row is None:
+        return None
+    decoded: Row = {}
+    for name in row.keys():
+        value = row[name]
+        if name in _JSON_COLUMNS and isinstance(value, str):
+            value = json.loads(value)
+        elif name in _BOOL_COLUMNS:
+            value = bool(value)
+        decoded[name] = value
+    return decoded
+
+
+__all__ = ["SqliteStorageBackend"]
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence
+
+from postgrest.exceptions import APIError
+from postgrest.types import CountMethod, ReturnMethod
+from supabase import Client
+
+from .base import (
+    CLAIMS_TABLE,
+    LEASES_TABLE,
+    MESSAGE_COLUMN_MIGRATIONS,
+    MESSAGES_TABLE,
+    PROFILES_TABLE,
+    BridgeStorageBackend,
+    Row,
+)
+
+#: PostgreSQL error code PostgREST reports for a column that does not exist.
+_UNDEFINED_COLUMN = "42703"
+
+
+class SupabaseStorageBackend(BridgeStorageBackend):
+    """Persist bridge rows through the Supabase (PostgREST) API."""
+
+    label = "Supabase"
+
+    def __init__(
+        self,
+        supabase: Client,
+        *,
+        messages_table: str = MESSAGES_TABLE,
+        profiles_table: str = PROFILES_TABLE,
+        leases_table: str = LEASES_TABLE,
+        claims_table: str = CLAIMS_TABLE,
+    ) -> None:
+        self._supabase = supabase
+        self._messages_table = messages_table
+        self._profiles_table = profiles_table
+        self._leases_table = leases_table
+        self._claims_table = claims_table
+
+    @property
+    def client(self) -> Client:
+        return self._supabase
+
+    def upsert_message(self, row: Row) -> None:
+        self._supabase.table(self._messages_table).upsert(
+            row,
+            on_conflict="source_id",
+        ).execute()
+
+    def get_message(self, source_id: int) -> Optional[Row]:
+        response = (
+            self._supabase.table(self._messages_table)
+            .select("*")
+            .eq("source_id", source_id)
+            .execute()
+        )
+        return _first_row(response.data)
+
+    def update_message(self, source_id: int, fields: Row) -> None:
+        self._supabase.table(self._messages_table).update(fields).eq(
+            "source_id", source_id
+        ).execute()
+
+    def delete_message(self, source_id: int) -> bool:
+        response = (
+            self._supabase.table(self._messages_table)
+            .delete()
+            .eq("source_id", source_id)
+            .execute()
+        )
+        if isinstance(response.data, list):
+            return len(response.data) > 0
+        return bool(response.data)
+
+    def find_message_by_destination(self, destination_id: int) -> Optional[Row]:
+        response = (
+            self._supabase.table(self._messages_table)
+            .select("*")
+            .contains("destination_ids", [str(destination_id)])
+            .limit(1)
+            .execute()
+        )
+        return _first_row(response.data)
+
+    def find_linked_message(self, message_id: int) -> Optional[Row]:
+        response = (
+            self._supabase.table(self._messages_table)
+            .select("*")
+            .or_(f"source_id.eq.{int(message_id)},destination_ids.cs.[{int(message_id)}]")
+            .limit(2)
+            .execute()
+        )
+        rows = list(response.data or [])
+        # 送信元として一致した行を優先する。
+        rows.sort(key=lambda row: int(row["source_id"]) != int(message_id))
+        return _first_row(rows)
+
+    def delete_messages_by_ids(self, message_ids: Sequence[int]) -> int:
+        ids = [int(message_id) for message_id in message_ids]
+        if not ids:
+            return 0
+        deleted = self._delete_sources(ids)
+
+        affected = (
+            self._supabase.table(self._messages_table)
+            .select("*")
+            .or_(",".join(f"destination_ids.cs.[{message_id}]" for message_id in ids))
+            .execute()
+        )
+        removed = set(ids)
+        now = datetime.now(timezone.utc).isoformat()
+        updated_rows = []
+        emptied = []
+        for row in affected.data or []:
+            remaining = [
+                value for value in row.get("destination_ids") or [] if int(value) not in removed
+            ]
+            if remaining:
+                updated_rows.append({**row, "destination_ids": remaining, "updated_at": now})
+            else:
+                emptied.append(row["source_id"])
+        if updated_rows:
+            self._supabase.table(self._messages_table).upsert(
+                updated_rows,
+                on_conflict="source_id",
+                returning=ReturnMethod.minimal,
+            ).execute()
+        if emptied:
+            deleted += self._delete_sources(emptied)
+        return deleted
+
+    def delete_messages_updated_before(self, threshold: datetime) -> int:
+        response = (
+            self._supabase.table(self._messages_table)
+            .delete()
+            .lt("updated_at", threshold.isoformat())
+            .execute()
+        )
+        if isinstance(response.data, list):
+            return len(response.data)
+        return 0
+
+    def delete_messages_before_source(self, threshold_id: int, *, limit: int) -> int:
+        selected = (
+            self._supabase.table(self._messages_table)
+            .select("source_id")
+            .lt("source_id", threshold_id)
+            .order("source_id")
+            .limit(limit)
+            .execute()
+        )
+        source_ids = [row["source_id"] for row in selected.data or []]
+        if not source_ids:
+            return 0
+        return self._delete_sources(source_ids)
+
+    def get_profile_record(self, record_id: str) -> Optional[Row]:
+        response = (
+            self._supabase.table(self._profiles_table)
+            .select("adjectives, nouns, guild_colors")
+            .eq("id", record_id)
+            .execute()
+        )
+        return _first_row(response.data)
+
+    def upsert_profile_record(self, row: Row) -> None:
+        self._supabase.table(self._profiles_table).upsert(
+            row,
+            on_conflict="id",
+        ).execute()
+
+    def update_profile_record(self, record_id: str, fields: Row) -> None:
+        self._supabase.table(self._profiles_table).update(fields).eq("id", record_id).execute()
+
+    def claim_deliveries(self, source_id: int, channel_ids: Sequence[int]) -> List[int]:
+        if not channel_ids:
+            return []
+        response = (
+            self._supabase.table(self._claims_table)
+            .upsert(
+                [{"source_id": source_id, "channel_id": channel_id} for channel_id in channel_ids],
+                on_conflict="source_id,channel_id",
+                ignore_duplicates=True,
+            )
+            .execute()
+        )
+        return [int(row["channel_id"]) for row in response.data or []]
+
+    def release_delivery(self, source_id: int, channel_id: int) -> None:
+        self._supabase.table(self._claims_table).delete().eq("source_id", source_id).eq(
+            "channel_id", channel_id
+        ).execute()
+
+    def delete_claims_before_source(self, threshold_id: int) -> int:
+        response = (
+            self._supabase.table(self._claims_table)
+            .delete(count=CountMethod.exact, returning=ReturnMethod.minimal)
+            .lt("source_id", threshold_id)
+            .execute()
+        )
+        return response.count if isinstance(response.count, int) else 0
+
+    def acquire_lease(self, resource: str, owner: str, *, ttl: float) -> bool:
+        # PostgREST には条件付き upsert が無いため、期限切れか自分のリースの
+        # 更新を試み、行が無ければ重複を無視する INSERT で取得する。
+        now = datetime.now(timezone.utc)
+        fields = {
+            "resource": resource,
+            "owner": owner,
+            "expires_at": (now + timedelta(seconds=ttl)).isoformat(),
+        }
+        renewed = (
+            self._supabase.table(self._leases_table)
+            .update(fields)
+            .eq("resource", resource)
+            .or_(f"owner.eq.{owner},expires_at.lt.{now.isoformat()}")
+            .execute()
+        )
+        if renewed.data:
+            return True
+        inserted = (
+            self._supabase.table(self._leases_table)
+            .upsert(fields, on_conflict="resource", ignore_duplicates=True)
+            .execute()
+        )
+        return bool(inserted.data)
+
+    def release_lease(self, resource: str, owner: str) -> None:
+        self._supabase.table(self._leases_table).delete().eq("resource", resource).eq(
+            "owner", owner
+        ).execute()
+
+    def list_active_leases(self) -> List[Row]:
+        response = (
+            self._supabase.table(self._leases_table)
+            .select("resource,owner,expires_at")
+            .gte("expires_at", datetime.now(timezone.utc).isoformat())
+            .execute()
+        )
+        return list(response.data or [])
+
+    def probe(self) -> None:
+        self._supabase.table(self._profiles_table).select("id").limit(1).execute()
+
+    def missing_message_columns(self) -> List[str]:
+        missing = []
+        for column in MESSAGE_COLUMN_MIGRATIONS:
+            try:
+                self._supabase.table(self._messages_table).select(column).limit(1).execute()
+            except APIError as exc:
+                if exc.code != _UNDEFINED_COLUMN:
+                    raise
+                missing.append(column)
+        return missing
+
+    def _delete_sources(self, source_ids: Sequence[int]) -> int:
+        response = (
+            self._supabase.table(self._messages_table)
+            .delete(count=CountMethod.exact, returning=ReturnMethod.minimal)
+            .in_("source_id", list(source_ids))
+            .execute()
+        )
+        if isinstance(response.count, int):
+            return response.count
+        return len(source_ids)
+
+
+def _first_row(data: object) -> Optional[Row]:
+    if isinstance(data, list) and data:
+        return data[0]
+    if isinstance(data, dict):
+        return data
+    return None
+
+
+__all__ = ["SupabaseStorageBackend"]
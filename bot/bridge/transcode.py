@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import importlib.util
+import io
+import logging
+import multiprocessing
+import shutil
+import subprocess
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import PurePath
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+import discord
+
+from .metrics import BridgeMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+#: Images are scaled down by this factor once every quality step is too large.
+_SCALE_STEP = 0.75
+_MIN_DIMENSION = 160
+_MIN_QUALITY = 40
+_QUALITY_STEP = 15
+_THUMBNAIL_TIMEOUT = 20.0
+
+
+@dataclass(frozen=True, slots=True)
+class TranscodedMedia:
+    """A re-encoded rendition of a source attachment."""
+
+    filename: str
+    data: bytes
+
+    def to_file(self) -> discord.File:
+        return discord.File(io.BytesIO(self.data), filename=self.filename)
+
+
+def shrink_image(data: bytes, limit: int, max_dimension: int, quality: int) -> Optional[Tuple[bytes, str]]:
+    """Re-encode an image so that it fits ``limit`` bytes (runs in a worker process).
+
+    Returns ``(encoded, extension)``, or ``None`` when the image is animated or
+    cannot be made small enough.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as source:
+        if getattr(source, "is_animated", False):
+            # 先頭フレームだけの静止画になってしまうため、アニメーションは変換しない。
+            return None
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    image_format, extension = ("WEBP", "webp") if has_alpha else ("JPEG", "jpg")
+    qualities = list(range(quality, _MIN_QUALITY - 1, -_QUALITY_STEP)) or [_MIN_QUALITY]
+    dimension = min(max_dimension, max(image.size))
+    while dimension >= _MIN_DIMENSION:
+        candidate = image.copy()
+        candidate.thumbnail((dimension, dimension))
+        for step in qualities:
+            buffer = io.BytesIO()
+            options: dict[str, Any] = {"quality": step}
+            if image_format == "JPEG":
+                options["optimize"] = True
+            candidate.save(buffer, format=image_format, **options)
+            if buffer.tell() <= limit:
+                return buffer.getvalue(), extension
+        dimension = int(dimension * _SCALE_STEP)
+    return None
+
+
+def video_thumbnail(ffmpeg: str, url: str, limit: int, max_dimension: int) -> Optional[bytes]:
+    """Grab the first frame of a video as JPEG with ffmpeg (runs in a worker process).
+
+    ffmpeg reads the CDN URL directly, so only the head of the video is fetched.
+    """
+    command = [
+        ffmpeg,
+        "-v",
+        "error",
+        "-i",
+        url,
+        "-frames:v",
+        "1",
+        "-vf",
+        f"scale='min(iw,{max_dimension})':-2",
+        "-f",
+        "image2",
+        "-c:v",
+        "mjpeg",
+        "pipe:1",
+    ]
+    try:
+        completed = subprocess.run(command, capture_output=True, timeout=_THUMBNAIL_TIMEOUT, check=False)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if completed.returncode != 0 or not completed.stdout or len(completed.stdout) > limit:
+        return None
+    return completed.stdout
+
+
+class MediaTranscoder:
+    """Shrink oversized images (and thumbnail videos) in a process pool.
+
+    Decoding and encoding never run on the event loop. Results are cached by
+    attachment id and upload budget, so every destination that needs the same
+    rendition of a source message awaits one shared job.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 2,
+        max_dimension: int = 2048,
+        quality: int = 85,
+        max_source_bytes: int = 50 * 1024 * 1024,
+        cache_size: int = 32,
+        executor: Optional[concurrent.futures.Executor] = None,
+        metrics: Optional[BridgeMetrics] = None,
+    ) -> None:
+        if importlib.util.find_spec("PIL") is None:
+            raise RuntimeError(
+                "添付画像の縮小には Pillow が必要です。"
+                "`poetry install --extras media` を実行してください。"
+            )
+        self._workers = max(1, workers)
+        self._max_dimension = max(_MIN_DIMENSION, max_dimension)
+        self._quality = min(95, max(_MIN_QUALITY, quality))
+        self._max_source_bytes = max_source_bytes
+        self._cache_size = max(1, cache_size)
+        self._cache: "OrderedDict[Tuple[str, int, int], asyncio.Future[Optional[TranscodedMedia]]]" = OrderedDict()
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._ffmpeg = shutil.which("ffmpeg")
+        metrics = metrics or BridgeMetrics()
+        self._results = metrics.counter(
+            "bridge_transcodes_total",
+            "Attachment transcodes by kind (image / thumbnail) and result.",
+            ("kind", "result"),
+        )
+        self._duration = metrics.histogram(
+            "bridge_transcode_duration_seconds",
+            "Time spent in the transcode worker pool per attachment.",
+            ("kind",),
+        )
+
+    @property
+    def can_thumbnail(self) -> bool:
+        return self._ffmpeg is not None
+
+    async def shrink_image(self, attachment: discord.Attachment, *, limit: int) -> Optional[TranscodedMedia]:
+        """Return a downscaled copy of ``attachment`` that fits ``limit`` bytes."""
+        return await self._cached("image", attachment, limit, self._shrink_image)
+
+    async def video_thumbnail(self, attachment: discord.Attachment, *, limit: int) -> Optional[TranscodedMedia]:
+        """Return a JPEG thumbnail of a video attachment, if ffmpeg is available."""
+        if self._ffmpeg is None:
+            return None
+        return await self._cached("thumbnail", attachment, limit, self._thumbnail)
+
+    def close(self) -> None:
+        for job in self._cache.values():
+            job.cancel()
+        self._cache.clear()
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _cached(
+        self,
+        kind: str,
+        attachment: discord.Attachment,
+        limit: int,
+        factory: Callable[[discord.Attachment, int], Awaitable[Optional[TranscodedMedia]]],
+    ) -> Optional[TranscodedMedia]:
+        key = (kind, int(attachment.id), int(limit))
+        job = self._cache.get(key)
+        if job is None:
+            job = asyncio.ensure_future(factory(attachment, limit))
+            self._cache[key] = job
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+            self._results.labels(kind=kind, result="cached").inc()
+        # 共有ジョブなので、待機側のキャンセルで他の送信先の変換を止めない。
+        return await asyncio.shield(job)
+
+    async def _shrink_image(self, attachment: discord.Attachment, limit: int) -> Optional[TranscodedMedia]:
+        if int(getattr(attachment, "size", 0) or 0) > self._max_source_bytes:
+            self._results.labels(kind="image", result="skipped").inc()
+            return None
+        try:
+            data = await attachment.read()
+            with self._duration.labels(kind="image").time():
+                encoded = await self._run(shrink_image, data, limit, self._max_dimension, self._quality)
+        except Exception as exc:
+            LOGGER.warning("添付画像の縮小に失敗しました: filename=%s error=%s", attachment.filename, exc)
+            self._results.labels(kind="image", result="failed").inc()
+            return None
+        if encoded is None:
+            self._results.labels(kind="image", result="too_large").inc()
+            return None
+        payload, extension = encoded
+        self._results.labels(kind="image", result="success").inc()
+        return TranscodedMedia(filename=f"{PurePath(attachment.filename).stem}.{extension}", data=payload)
+
+    async def _thumbnail(self, attachment: discord.Attachment, limit: int) -> Optional[TranscodedMedia]:
+        try:
+            with self._duration.labels(kind="thumbnail").time():
+                payload = await self._run(video_thumbnail, self._ffmpeg, attachment.url, limit, self._max_dimension)
+        except Exception as exc:
+            LOGGER.warning("動画サムネイルの生成に失敗しました: filename=%s error=%s", attachment.filename, exc)
+            self._results.labels(kind="thumbnail", result="failed").inc()
+            return None
+        if payload is None:
+            self._results.labels(kind="thumbnail", result="failed").inc()
+            return None
+        self._results.labels(kind="thumbnail", result="success").inc()
+        return TranscodedMedia(filename=f"{PurePath(attachment.filename).stem}_thumbnail.jpg", data=payload)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._executor is None:
+            # fork だと親の asyncio ループやスレッドの状態を引き継ぐため spawn で起動する。
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+
+__all__ = [
+    "MediaTranscoder",
+    "TranscodedMedia",
+    "shrink_image",
+    "video_thumbnail",
+]
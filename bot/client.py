@@ -1,38 +1,77 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 
 import discord
 
 
 if TYPE_CHECKING:
-    from bot.bridge import ChannelBridgeManager
+    from bot.bridge import BridgeEventDispatcher, ChannelBridgeManager, LeaseCoordinator
 
 
 LOGGER = logging.getLogger(__name__)
 
 
-class BridgeBotClient(discord.Client):
-    """チャンネルブリッジ専用の Discord クライアント。"""
+class BridgeClientMixin:
+    """ブリッジ用のイベントハンドラを `discord.Client` 系のクラスへ提供する。"""
+
+    bridge_manager: "ChannelBridgeManager" | None
+    dispatcher: "BridgeEventDispatcher" | None
+    ownership: "LeaseCoordinator" | None
 
     def __init__(
         self,
         *,
         intents: discord.Intents | None = None,
         bridge_manager: "ChannelBridgeManager" | None = None,
+        dispatcher: "BridgeEventDispatcher" | None = None,
+        ownership: "LeaseCoordinator" | None = None,
+        shutdown_timeout: float = 0.0,
+        **options: Any,
     ) -> None:
-        super().__init__(intents=intents or discord.Intents.all())
+        super().__init__(intents=intents or discord.Intents.all(), **options)  # type: ignore[call-arg]
         self.tree = discord.app_commands.CommandTree(self)
         self.bridge_manager = bridge_manager
+        self.dispatcher = dispatcher
+        self.ownership = ownership
+        self._shutdown_timeout = shutdown_timeout
+
+    async def setup_hook(self) -> None:
+        if self.ownership is not None:
+            await self.ownership.start()
+        if self.dispatcher is not None:
+            await self.dispatcher.start()
+        if self.bridge_manager is not None:
+            await self.bridge_manager.start()
+
+    async def close(self) -> None:
+        if self.dispatcher is not None and not self.is_closed():
+            await self.dispatcher.close(drain_timeout=self._shutdown_timeout)
+        if self.bridge_manager is not None and not self.is_closed():
+            try:
+                await self.bridge_manager.close(drain_timeout=self._shutdown_timeout)
+            except Exception as exc:
+                LOGGER.warning("ブリッジの終了処理に失敗しました: error=%s", exc)
+        if self.ownership is not None and not self.is_closed():
+            await self.ownership.close()
+        await super().close()
 
     async def on_ready(self) -> None:
         if self.user is None:
             LOGGER.warning("クライアントユーザー情報を取得できませんでした。")
             return
 
-        LOGGER.info("BridgeBotClient ログイン完了: %s (ID: %s)", self.user, self.user.id)
+        LOGGER.info(
+            "%s ログイン完了: %s (ID: %s) shards=%s",
+            type(self).__name__,
+            self.user,
+            self.user.id,
+            self.shard_count or 1,
+        )
         if self.bridge_manager is not None:
+            if self.shard_count is None:
+                self.bridge_manager.set_shard_ready(0, True)
             try:
                 await self.bridge_manager.ensure_guild_colors(self.guilds)
             except Exception as exc:
@@ -41,42 +80,132 @@ class BridgeBotClient(discord.Client):
         LOGGER.info("アプリケーションコマンドの同期が完了しました。")
         LOGGER.info("チャンネルブリッジの待機を開始します。")
 
+    async def on_shard_ready(self, shard_id: int) -> None:
+        LOGGER.info("シャード %s の準備が完了しました。", shard_id)
+        if self.bridge_manager is not None:
+            self.bridge_manager.set_shard_ready(shard_id, True)
+
+    async def on_shard_resumed(self, shard_id: int) -> None:
+        LOGGER.info("シャード %s のセッションを再開しました。", shard_id)
+        if self.bridge_manager is not None:
+            self.bridge_manager.set_shard_ready(shard_id, True)
+
+    async def on_shard_disconnect(self, shard_id: int) -> None:
+        LOGGER.warning("シャード %s が切断されました。", shard_id)
+        if self.bridge_manager is not None:
+            self.bridge_manager.set_shard_ready(shard_id, False)
+
+    async def _dispatch(
+        self,
+        guild_id: Optional[int],
+        channel_id: int,
+        kind: str,
+        handler: Callable[[], Awaitable[None]],
+    ) -> None:
+        if self.ownership is not None and not self.ownership.owns_event(guild_id, channel_id):
+            # 複数プロセス構成で、このチャンネル (シャード) は別プロセスの担当。
+            return
+        if self.bridge_manager is not None:
+            self.bridge_manager.record_shard_event(guild_id, kind)
+        if self.dispatcher is None:
+            await handler()
+            return
+        await self.dispatcher.submit(channel_id, kind, handler)
+
     async def on_message(self, message: discord.Message) -> None:
-        if self.bridge_manager is None:
+        manager = self.bridge_manager
+        if manager is None:
             return
-        await self.bridge_manager.handle_message(message)
+        await self._dispatch(
+            _guild_id(message),
+            message.channel.id,
+            "message",
+            lambda: manager.handle_message(message),
+        )
 
     async def on_message_edit(
         self,
         before: discord.Message,
         after: discord.Message,
     ) -> None:
-        if self.bridge_manager is None:
+        manager = self.bridge_manager
+        if manager is None:
             return
-        await self.bridge_manager.handle_message_edit(before, after)
+        await self._dispatch(
+            _guild_id(after),
+            after.channel.id,
+            "edit",
+            lambda: manager.handle_message_edit(before, after),
+        )
 
     async def on_reaction_add(
         self,
         reaction: discord.Reaction,
         user: discord.abc.User,
     ) -> None:
-        if self.bridge_manager is None:
+        manager = self.bridge_manager
+        if manager is None:
             return
-        await self.bridge_manager.handle_reaction(reaction, user, add=True)
+        await self._dispatch(
+            _guild_id(reaction.message),
+            reaction.message.channel.id,
+            "reaction",
+            lambda: manager.handle_reaction(reaction, user, add=True),
+        )
 
     async def on_reaction_remove(
         self,
         reaction: discord.Reaction,
         user: discord.abc.User,
     ) -> None:
-        if self.bridge_manager is None:
+        manager = self.bridge_manager
+        if manager is None:
             return
-        await self.bridge_manager.handle_reaction(reaction, user, add=False)
-
-    async def on_message_delete(self, message: discord.Message) -> None:
-        if self.bridge_manager is None:
+        await self._dispatch(
+            _guild_id(reaction.message),
+            reaction.message.channel.id,
+            "reaction",
+            lambda: manager.handle_reaction(reaction, user, add=False),
+        )
+
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        manager = self.bridge_manager
+        if manager is None:
+            return
+        await self._dispatch(
+            payload.guild_id,
+            payload.channel_id,
+            "delete",
+            lambda: manager.handle_raw_message_delete(payload.message_id, channel_id=payload.channel_id),
+        )
+
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        manager = self.bridge_manager
+        if manager is None:
             return
-        self.bridge_manager.handle_message_delete(message.id)
+        await self._dispatch(
+            payload.guild_id,
+            payload.channel_id,
+            "delete",
+            lambda: manager.handle_raw_bulk_message_delete(
+                payload.message_ids,
+                channel_id=payload.channel_id,
+            ),
+        )
+
+class BridgeBotClient(BridgeClientMixin, discord.Client):
+    """チャンネルブリッジ専用の Discord クライアント (単一ゲートウェイ接続)。"""
+
+
+class ShardedBridgeBotClient(BridgeClientMixin, discord.AutoShardedClient):
+    """ゲートウェイをシャード分割して接続するチャンネルブリッジ用クライアント。
+
+    `shard_count` を省略すると Discord の推奨シャード数を使用します。
+    """
+
+
+def _guild_id(message: discord.Message) -> Optional[int]:
+    return message.guild.id if message.guild is not None else None
 
 
-__all__ = ["BridgeBotClient"]
+__all__ = ["BridgeBotClient", "BridgeClientMixin", "ShardedBridgeBotClient"]
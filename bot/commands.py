@@ -1,21 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Tuple
+from typing import Awaitable, Callable, Dict, Iterable, Sequence, Tuple, TypeVar
 
 import discord
 
 from bot.bridge.routes import ChannelEndpoint, ChannelRoute
+from bot.bridge.stats import format_bridge_stats
 
 
 LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+#: Discord のメッセージ本文の上限文字数。
+MESSAGE_CHAR_LIMIT = 2000
+#: ギルド・チャンネル名のラベルを再利用する秒数 (取得失敗は短めに保持する)。
+ENDPOINT_LABEL_TTL = 300.0
+ENDPOINT_FAILURE_TTL = 30.0
+#: キャッシュにないエンドポイントを同時に解決する上限。
+RESOLVE_CONCURRENCY = 8
+
 
 async def register_bridge_commands(client: "BridgeBotClient") -> None:
     """BridgeBotClient にブリッジ関連のコマンドを登録する。"""
 
     tree = client.tree
+    label_cache = EndpointLabelCache()
 
     @tree.command(
         name="bridge_links",
@@ -47,36 +61,131 @@ async def register_bridge_commands(client: "BridgeBotClient") -> None:
 
         await interaction.response.defer(ephemeral=True)
 
-        formatter = _BridgeRouteFormatter(client=client, guild=interaction.guild)
+        formatter = _BridgeRouteFormatter(client=client, guild=interaction.guild, cache=label_cache)
         lines = await formatter.describe_routes(routes)
-        message = "🔗 設定されているチャンネルブリッジ\n" + "\n".join(lines)
-        await interaction.followup.send(message, ephemeral=True)
+        for chunk in chunk_message("🔗 設定されているチャンネルブリッジ", lines):
+            await interaction.followup.send(chunk, ephemeral=True)
+
+    @tree.command(
+        name="bridge_stats",
+        description="ブリッジの転送状況 (スループット・エラー率・遅延など) を表示します。",
+    )
+    @discord.app_commands.default_permissions(administrator=True)
+    async def bridge_stats(interaction: discord.Interaction) -> None:  # noqa: ANN001
+        if interaction.guild is None:
+            await _send_ephemeral(
+                interaction,
+                "このコマンドはサーバー内でのみ使用できます。",
+            )
+            return
+
+        manager = client.bridge_manager
+        if manager is None:
+            await _send_ephemeral(
+                interaction,
+                "チャンネルブリッジ機能が有効になっていません。",
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+
+        # ルート別の内訳は、他ギルドのチャンネルを見せないよう実行したギルドのものに絞る。
+        snapshot = manager.stats_snapshot(guild_id=interaction.guild.id)
+        for chunk in chunk_message("📊 ブリッジの転送状況", format_bridge_stats(snapshot)):
+            await interaction.followup.send(chunk, ephemeral=True)
+
+
+class EndpointLabelCache:
+    """ギルド・チャンネルの表示ラベルを TTL 付きで保持し、コマンド呼び出し間で共有する。
+
+    取得に失敗したエンドポイントは短い TTL で保持し、権限不足などで失敗し続ける
+    エンドポイントへの API 呼び出しを繰り返さない。
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = ENDPOINT_LABEL_TTL,
+        failure_ttl: float = ENDPOINT_FAILURE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._failure_ttl = failure_ttl
+        self._clock = clock
+        self._entries: Dict[Tuple[int, int], Tuple[float, Tuple[str, str]]] = {}
+
+    def get(self, key: Tuple[int, int]) -> Tuple[str, str] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, labels = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        return labels
+
+    def put(self, key: Tuple[int, int], labels: Tuple[str, str], *, resolved: bool = True) -> None:
+        ttl = self._ttl if resolved else self._failure_ttl
+        self._entries[key] = (self._clock() + ttl, labels)
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 @dataclass(slots=True)
 class _BridgeRouteFormatter:
     client: "BridgeBotClient"
     guild: discord.Guild
-    _cache: Dict[Tuple[int, int], Tuple[str, str]] = field(default_factory=dict)
+    cache: EndpointLabelCache = field(default_factory=EndpointLabelCache)
+    _guilds: Dict[int, discord.Guild | None] = field(default_factory=dict)
 
     async def describe_routes(self, routes: Iterable[ChannelRoute]) -> list[str]:
+        routes = list(routes)
+        labels: Dict[Tuple[int, int], Tuple[str, str]] = {}
+        missing: Dict[Tuple[int, int], ChannelEndpoint] = {}
+        for endpoint in (endpoint for route in routes for endpoint in (route.src, route.dst)):
+            key = endpoint.key()
+            if key in labels or key in missing:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                labels[key] = cached
+            else:
+                missing[key] = endpoint
+
+        if missing:
+            semaphore = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+            # 同じギルドへの fetch を重複させないよう、ギルドを先にまとめて解決する。
+            guild_ids = sorted({endpoint.guild for endpoint in missing.values()})
+            guilds = await asyncio.gather(
+                *(self._bounded(semaphore, self._resolve_guild(guild_id)) for guild_id in guild_ids)
+            )
+            self._guilds.update(zip(guild_ids, guilds))
+            resolved = await asyncio.gather(
+                *(self._bounded(semaphore, self._describe_endpoint(endpoint)) for endpoint in missing.values())
+            )
+            labels.update(zip(missing, resolved))
+
         lines: list[str] = []
         for index, route in enumerate(routes, start=1):
-            src_guild_label, src_channel_label = await self._describe_endpoint(route.src)
-            dst_guild_label, dst_channel_label = await self._describe_endpoint(route.dst)
+            src_guild_label, src_channel_label = labels[route.src.key()]
+            dst_guild_label, dst_channel_label = labels[route.dst.key()]
             lines.append(
                 f"{index}. 実行元: {src_guild_label} / {src_channel_label}\n"
                 f"   連携先: {dst_guild_label} / {dst_channel_label}"
             )
         return lines
 
-    async def _describe_endpoint(self, endpoint: ChannelEndpoint) -> Tuple[str, str]:
-        cache_key = (endpoint.guild, endpoint.channel)
-        cached = self._cache.get(cache_key)
-        if cached is not None:
-            return cached
+    @staticmethod
+    async def _bounded(semaphore: asyncio.Semaphore, awaitable: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await awaitable
 
-        endpoint_guild = await self._resolve_guild(endpoint.guild)
+    async def _describe_endpoint(self, endpoint: ChannelEndpoint) -> Tuple[str, str]:
+        if endpoint.guild in self._guilds:
+            endpoint_guild = self._guilds[endpoint.guild]
+        else:
+            endpoint_guild = await self._resolve_guild(endpoint.guild)
         if endpoint_guild is not None:
             guild_label = f"{endpoint_guild.name} (ID: {endpoint_guild.id})"
             channel_obj: discord.abc.GuildChannel | discord.Thread | None = (
@@ -97,7 +206,11 @@ class _BridgeRouteFormatter:
             channel_label = f"(取得失敗: Channel ID {endpoint.channel})"
 
         value = (guild_label, channel_label)
-        self._cache[cache_key] = value
+        self.cache.put(
+            endpoint.key(),
+            value,
+            resolved=endpoint_guild is not None and channel_obj is not None,
+        )
         return value
 
     async def _resolve_guild(self, guild_id: int) -> discord.Guild | None:
@@ -138,6 +251,24 @@ class _BridgeRouteFormatter:
         return None
 
 
+def chunk_message(header: str, lines: Sequence[str], *, limit: int = MESSAGE_CHAR_LIMIT) -> list[str]:
+    """見出しと行を、Discord の文字数上限に収まるメッセージへ行単位で分割する。"""
+    chunks: list[str] = []
+    current = header
+    for line in lines:
+        if len(line) > limit:
+            line = line[: limit - 1] + "…"
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 async def _send_ephemeral(interaction: discord.Interaction, message: str) -> None:
     if interaction.response.is_done():
         await interaction.followup.send(message, ephemeral=True)
@@ -145,4 +276,4 @@ async def _send_ephemeral(interaction: discord.Interaction, message: str) -> Non
         await interaction.response.send_message(message, ephemeral=True)
 
 
-__all__ = ["register_bridge_commands"]
+__all__ = ["EndpointLabelCache", "chunk_message", "register_bridge_commands"]
@@ -5,6 +5,7 @@ import logging
 
 from app import build_bridge_app, load_config
 from app.diagnostics import log_startup_diagnostics
+from app.logging_setup import configure_logging
 
 
 LOGGER = logging.getLogger(__name__)
@@ -17,9 +18,13 @@ async def run_bridge_bot() -> None:
         LOGGER.exception("bridge_base の設定読み込みに失敗しました。")
         return
 
-    log_startup_diagnostics(config)
-    app = await build_bridge_app(config)
-    await app.run()
+    logging_runtime = configure_logging(config.logging)
+    try:
+        log_startup_diagnostics(config)
+        app = await build_bridge_app(config)
+        await app.run()
+    finally:
+        logging_runtime.stop()
 
 
 def main() -> None:
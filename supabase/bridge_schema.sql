@@ -15,7 +15,26 @@ CREATE TABLE IF NOT EXISTS bridge_messages (
   dicebear_failed BOOLEAN NOT NULL,
   image_filename TEXT,
   attachment_notes JSONB NOT NULL DEFAULT '[]'::jsonb,
+  payload_hash TEXT,
+  message_locations JSONB NOT NULL DEFAULT '{}'::jsonb,
   updated_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
 );
 
+ALTER TABLE bridge_messages ADD COLUMN IF NOT EXISTS payload_hash TEXT;
+ALTER TABLE bridge_messages ADD COLUMN IF NOT EXISTS message_locations JSONB NOT NULL DEFAULT '{}'::jsonb;
+
+CREATE TABLE IF NOT EXISTS bridge_claims (
+  source_id BIGINT NOT NULL,
+  channel_id BIGINT NOT NULL,
+  claimed_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp(),
+  PRIMARY KEY (source_id, channel_id)
+);
+
+CREATE TABLE IF NOT EXISTS bridge_leases (
+  resource TEXT PRIMARY KEY,
+  owner TEXT NOT NULL,
+  expires_at TIMESTAMPTZ NOT NULL
+);
+
 CREATE INDEX IF NOT EXISTS bridge_messages_updated_at_idx ON bridge_messages (updated_at);
+CREATE INDEX IF NOT EXISTS bridge_messages_destination_ids_idx ON bridge_messages USING GIN (destination_ids jsonb_path_ops);
@@ -2,6 +2,8 @@ import asyncio
 import inspect
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterable
 
 import pytest
 
@@ -12,6 +14,81 @@ root_str = str(ROOT)
 if root_str not in sys.path:
     sys.path.insert(0, root_str)
 
+from benchmarks.fakes import FakeChannel, FakeDiscordClient, FakeMessage  # noqa: E402
+from bot.bridge.manager import ChannelBridgeManager  # noqa: E402
+from bot.bridge.messages import BridgeMessageStore  # noqa: E402
+from bot.bridge.profiles import BridgeProfileStore  # noqa: E402
+from bot.bridge.routes import ChannelEndpoint, ChannelRoute  # noqa: E402
+from bot.bridge.storage import BridgeStorageBackend, InMemoryStorageBackend  # noqa: E402
+
+
+class BridgeHarness:
+    """Fake Discord client and shared in-memory store for building bridge managers.
+
+    Channels are created on first use in guild ``channel_id // 100`` unless
+    added beforehand with an explicit guild.
+    """
+
+    def __init__(self) -> None:
+        self.client = FakeDiscordClient()
+        self.storage: BridgeStorageBackend = InMemoryStorageBackend()
+
+    def channel(self, channel_id: int, *, guild_id: int | None = None) -> FakeChannel:
+        channel = self.client.get_channel(channel_id)
+        if channel is None:
+            channel = self.client.add_channel(
+                guild_id=channel_id // 100 if guild_id is None else guild_id,
+                channel_id=channel_id,
+            )
+        return channel
+
+    def endpoint(self, channel_id: int) -> ChannelEndpoint:
+        return ChannelEndpoint(guild=self.channel(channel_id).guild.id, channel=channel_id)
+
+    def routes(self, source: int, destinations: Iterable[int]) -> list[ChannelRoute]:
+        """One route from ``source`` to each of ``destinations``."""
+        return [ChannelRoute(src=self.endpoint(source), dst=self.endpoint(destination)) for destination in destinations]
+
+    def manager(
+        self,
+        routes: Iterable[ChannelRoute],
+        *,
+        storage: BridgeStorageBackend | None = None,
+        **options: Any,
+    ) -> ChannelBridgeManager:
+        backend = self.storage if storage is None else storage
+        return ChannelBridgeManager(
+            client=self.client,  # type: ignore[arg-type]
+            profile_store=BridgeProfileStore(backend),
+            message_store=BridgeMessageStore(backend),
+            routes=list(routes),
+            **options,
+        )
+
+    def message(
+        self,
+        channel: FakeChannel,
+        content: str = "hello",
+        *,
+        message_id: int | None = None,
+        **kwargs: Any,
+    ) -> FakeMessage:
+        """A user message posted to ``channel``."""
+        message = FakeMessage(
+            message_id=self.client.snowflakes.next() if message_id is None else message_id,
+            channel=channel,
+            author=SimpleNamespace(id=42, bot=False),
+            content=content,
+            **kwargs,
+        )
+        channel.messages[message.id] = message
+        return message
+
+
+@pytest.fixture
+def bridge() -> BridgeHarness:
+    return BridgeHarness()
+
 
 def pytest_configure(config: pytest.Config) -> None:
     # Register the asyncio marker so pytest does not warn when the plugin
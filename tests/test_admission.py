@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from bot.bridge.admission import AdmissionController
+from bot.bridge.metrics import BridgeMetrics
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_channel_and_guild_buckets_shed_independently() -> None:
+    clock = _Clock()
+    metrics = BridgeMetrics()
+    controller = AdmissionController(
+        guild_rate=1.0,
+        guild_burst=3,
+        channel_rate=1.0,
+        channel_burst=2,
+        metrics=metrics,
+        clock=clock,
+    )
+
+    assert [controller.admit(1, 10).admitted for _ in range(3)] == [True, True, False]
+    assert controller.admit(1, 10).scope == "channel"
+    # 別チャンネルはチャンネル枠が残っているが、ギルド枠 (3) を使い切ると抑止される。
+    assert controller.admit(1, 11).admitted
+    assert controller.admit(1, 11).scope == "guild"
+    # 別ギルドには影響しない。
+    assert controller.admit(2, 20).admitted
+
+    clock.now += 1.0
+    assert controller.admit(1, 10).admitted
+
+    events = metrics.get("bridge_admission_events_total")
+    assert events.value(guild=1, result="shed_channel") == 2
+    assert events.value(guild=1, result="shed_guild") == 1
+    assert events.value(guild=1, result="admitted") == 4
+
+
+@pytest.mark.asyncio
+async def test_summarize_policy_posts_one_notice_per_burst(bridge) -> None:
+    clock = _Clock()
+    source = bridge.channel(100)
+    destination = bridge.channel(200)
+    manager = bridge.manager(
+        bridge.routes(100, [200]),
+        admission=AdmissionController(
+            guild_rate=1.0,
+            guild_burst=10,
+            channel_rate=1.0,
+            channel_burst=1,
+            policy="summarize",
+            clock=clock,
+        ),
+    )
+
+    async def send(content: str) -> None:
+        await manager.handle_message(bridge.message(source, content))  # type: ignore[arg-type]
+
+    for index in range(4):
+        await send(f"spam {index}")
+    assert destination.sent == 1
+
+    clock.now += 1.0
+    await send("after")
+
+    contents = [message.content for message in destination.messages.values()]
+    assert destination.sent == 3
+    assert any(content and "3 件" in content for content in contents)
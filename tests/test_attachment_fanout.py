@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, List
+
+import pytest
+
+from benchmarks.fakes import FakeAttachment, FakeMessage
+
+_DESTINATIONS = (200, 300, 400)
+
+
+def _setup(bridge, mode: str, *, relay_channel_id: int | None = None):
+    destinations = [bridge.channel(channel_id) for channel_id in _DESTINATIONS]
+    manager = bridge.manager(
+        bridge.routes(100, _DESTINATIONS),
+        attachment_fanout=mode,
+        relay_channel_id=relay_channel_id,
+    )
+    return destinations, manager
+
+
+def _record_uploads(channel) -> List[int]:
+    uploads: List[int] = []
+    original_send = channel.send
+
+    async def _recording_send(**kwargs: Any):
+        uploads.append(len(kwargs.get("files", ())))
+        return await original_send(**kwargs)
+
+    channel.send = _recording_send
+    return uploads
+
+
+def _message(bridge) -> FakeMessage:
+    return bridge.message(
+        bridge.channel(100),
+        "media",
+        attachments=[
+            FakeAttachment(attachment_id=1, filename="photo.png", content_type="image/png", size=1024, latency=0.0),
+            FakeAttachment(attachment_id=2, filename="notes.txt", content_type="text/plain", size=64, latency=0.0),
+        ],
+    )
+
+
+def _rendered(channel) -> str:
+    mirror = next(iter(channel.messages.values()))
+    return str(mirror.embeds[0].description)
+
+
+@pytest.mark.asyncio
+async def test_once_mode_uploads_to_the_first_destination_and_links_the_rest(bridge) -> None:
+    destinations, manager = _setup(bridge, "once")
+    uploads = [_record_uploads(channel) for channel in destinations]
+    message = _message(bridge)
+
+    await manager.handle_message(message)  # type: ignore[arg-type]
+
+    assert uploads == [[2], [0], [0]]
+    first_mirror = next(iter(destinations[0].messages.values()))
+    image, text = first_mirror.attachments
+    for channel in destinations[1:]:
+        mirror = next(iter(channel.messages.values()))
+        assert mirror.embeds[0].image.url == image.url
+        assert f"(ファイル) {text.url}" in _rendered(channel)
+    assert manager.metrics.get("bridge_attachments_total").value(result="reused") == 4
+
+    # 参照先の画像は編集後も埋め込みに残る。
+    message.content = "edited"
+    message.edited_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    await manager.handle_message_edit(message, message)  # type: ignore[arg-type]
+    mirror = next(iter(destinations[1].messages.values()))
+    assert mirror.edit_calls == 1
+    assert mirror.embeds[0].image.url == image.url
+
+
+@pytest.mark.asyncio
+async def test_relay_mode_uploads_once_to_the_relay_channel(bridge) -> None:
+    destinations, manager = _setup(bridge, "relay", relay_channel_id=900)
+    relay = bridge.channel(900)
+    relay_uploads = _record_uploads(relay)
+    uploads = [_record_uploads(channel) for channel in destinations]
+
+    await manager.handle_message(_message(bridge))  # type: ignore[arg-type]
+
+    assert relay_uploads == [2]
+    assert uploads == [[0], [0], [0]]
+    relay_message = next(iter(relay.messages.values()))
+    for channel in destinations:
+        mirror = next(iter(channel.messages.values()))
+        assert mirror.embeds[0].image.url == relay_message.attachments[0].url
+
+
+@pytest.mark.asyncio
+async def test_once_mode_falls_through_to_the_next_destination_when_the_first_send_fails(bridge) -> None:
+    destinations, manager = _setup(bridge, "once")
+    uploads = [_record_uploads(channel) for channel in destinations]
+    destinations[0].fail_sends = 1
+
+    await manager.handle_message(_message(bridge))  # type: ignore[arg-type]
+
+    assert uploads == [[2], [2], [0]]
+    assert destinations[0].sent == 0
+    assert [channel.sent for channel in destinations[1:]] == [1, 1]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+import pytest
+
+from benchmarks.fakes import FakeAttachment
+from bot.bridge.manager import ATTACHMENT_LABELS
+
+
+class _CountingAttachment(FakeAttachment):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(latency=0.0, **kwargs)
+        self.downloads = 0
+
+    async def to_file(self, **kwargs: Any):
+        self.downloads += 1
+        return await super().to_file(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_attachments_over_the_destination_limit_are_linked_without_download(bridge) -> None:
+    destination = bridge.channel(200)
+    destination.guild.filesize_limit = 1000
+    manager = bridge.manager(bridge.routes(100, [200]))
+    sent_files: List[List[str]] = []
+    original_send = destination.send
+
+    async def _recording_send(**kwargs: Any):
+        sent_files.append([file.filename for file in kwargs.get("files", ())])
+        return await original_send(**kwargs)
+
+    destination.send = _recording_send  # type: ignore[method-assign]
+
+    small = _CountingAttachment(attachment_id=1, filename="small.png", content_type="image/png", size=600)
+    # 単体では上限内だが、先の添付と合わせると上限を超える。
+    second = _CountingAttachment(attachment_id=2, filename="second.png", content_type="image/png", size=600)
+    huge = _CountingAttachment(attachment_id=3, filename="movie.mp4", content_type="video/mp4", size=5000)
+    message = bridge.message(bridge.channel(100), "files", attachments=[small, second, huge])
+
+    await manager.handle_message(message)  # type: ignore[arg-type]
+
+    assert destination.sent == 1
+    assert sent_files == [["small.png"]]
+    assert (small.downloads, second.downloads, huge.downloads) == (1, 0, 0)
+    mirror = next(iter(destination.messages.values()))
+    rendered = " ".join(str(embed.description) for embed in mirror.embeds) + (mirror.content or "")
+    assert f"{ATTACHMENT_LABELS['image']} {second.url}" in rendered
+    assert f"{ATTACHMENT_LABELS['video']} {huge.url}" in rendered
+    results = manager.metrics.get("bridge_attachments_total")
+    assert results.value(result="uploaded") == 1
+    assert results.value(result="linked") == 2
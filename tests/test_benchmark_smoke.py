@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.bridge_bench import BenchmarkConfig, run_benchmark, save_results
+
+
+@pytest.mark.asyncio
+async def test_benchmark_runs_all_scenarios_and_saves_results(tmp_path) -> None:
+    config = BenchmarkConfig(messages=5, fanout=2, attachments=1, attachment_size=16, trace_memory=False)
+
+    results = await run_benchmark(config)
+
+    assert [result.scenario for result in results] == ["message", "edit", "reaction", "delete"]
+    assert all(result.operations == 5 for result in results)
+    assert all(result.ops_per_second > 0 for result in results)
+
+    path = save_results(config, results, output_dir=tmp_path)
+    document = json.loads(path.read_text(encoding="utf-8"))
+    assert document["config"]["fanout"] == 2
+    assert document["results"][0]["scenario"] == "message"
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from bot.bridge.routes import ChannelEndpoint, ChannelRoute
+from bot.commands import MESSAGE_CHAR_LIMIT, EndpointLabelCache, _BridgeRouteFormatter, chunk_message
+
+
+class _SlowClient:
+    def __init__(self) -> None:
+        self.guild_fetches: list[int] = []
+        self.channel_fetches: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_guild(self, _guild_id: int) -> None:
+        return None
+
+    def get_channel(self, _channel_id: int) -> None:
+        return None
+
+    async def _simulate(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def fetch_guild(self, guild_id: int) -> SimpleNamespace:
+        self.guild_fetches.append(guild_id)
+        await self._simulate()
+        return SimpleNamespace(id=guild_id, name=f"guild-{guild_id}", get_channel=lambda _channel_id: None)
+
+    async def fetch_channel(self, channel_id: int) -> discord.TextChannel:
+        self.channel_fetches.append(channel_id)
+        await self._simulate()
+        channel = MagicMock(spec=discord.TextChannel)
+        channel.id = channel_id
+        channel.name = f"channel-{channel_id}"
+        return channel
+
+
+def _routes() -> list[ChannelRoute]:
+    return [
+        ChannelRoute(src=ChannelEndpoint(guild=1, channel=100), dst=ChannelEndpoint(guild=2, channel=channel_id))
+        for channel_id in range(200, 206)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_endpoint_labels_are_resolved_concurrently_and_shared_between_calls() -> None:
+    client = _SlowClient()
+    cache = EndpointLabelCache()
+    home = SimpleNamespace(id=1, name="home", get_channel=lambda _channel_id: None)
+
+    lines = await _BridgeRouteFormatter(client=client, guild=home, cache=cache).describe_routes(_routes())  # type: ignore[arg-type]
+
+    assert len(lines) == 6
+    assert "連携先: guild-2 (ID: 2) / channel-203 (ID: 203)" in lines[3]
+    assert client.guild_fetches == [2]
+    assert sorted(client.channel_fetches) == [100, *range(200, 206)]
+    assert client.max_in_flight > 1
+
+    await _BridgeRouteFormatter(client=client, guild=home, cache=cache).describe_routes(_routes())  # type: ignore[arg-type]
+    assert client.guild_fetches == [2]
+    assert len(client.channel_fetches) == 7
+
+
+def test_endpoint_label_cache_expires_entries() -> None:
+    now = [0.0]
+    cache = EndpointLabelCache(ttl=10, failure_ttl=1, clock=lambda: now[0])
+    cache.put((1, 100), ("guild", "channel"))
+    cache.put((1, 101), ("guild", "(取得失敗)"), resolved=False)
+
+    now[0] = 5
+    assert cache.get((1, 100)) == ("guild", "channel")
+    assert cache.get((1, 101)) is None
+    now[0] = 10
+    assert cache.get((1, 100)) is None
+
+
+def test_chunk_message_keeps_every_chunk_under_the_limit() -> None:
+    lines = [f"{index}. " + "x" * 300 for index in range(1, 31)]
+
+    chunks = chunk_message("header", lines)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= MESSAGE_CHAR_LIMIT for chunk in chunks)
+    assert chunks[0].startswith("header\n1. ")
+    assert "\n".join(chunks) == "header\n" + "\n".join(lines)
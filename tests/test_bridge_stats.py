@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from benchmarks.fakes import DISCORD_EPOCH_MS
+from bot.bridge.routes import ChannelEndpoint, ChannelRoute
+from bot.bridge.stats import RollingPercentiles, format_bridge_stats, snowflake_lag
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rolling_percentiles_use_nearest_rank_and_expire_old_samples() -> None:
+    clock = _Clock()
+    window = RollingPercentiles(window=60, clock=clock)
+    for value in range(1, 101):
+        window.observe(value / 100)
+
+    assert window.percentiles() == {0.5: 0.5, 0.95: 0.95, 0.99: 0.99}
+    clock.now += 30
+    assert window.rate() == pytest.approx(100 / 30)
+
+    clock.now += 31
+    assert len(window) == 0
+    assert window.percentiles() == {0.5: None, 0.95: None, 0.99: None}
+
+
+def test_snowflake_lag_reads_the_embedded_timestamps() -> None:
+    assert snowflake_lag(1500 << 22, (2750 << 22) | 7) == pytest.approx(1.25)
+    # 時計のずれで逆転しても負の遅延にはしない。
+    assert snowflake_lag(2000 << 22, 1000 << 22) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_manager_reports_mirror_lag_and_route_errors(bridge) -> None:
+    routes = bridge.routes(100, [200])
+    # 3/300 はクライアントに存在しないチャンネルなので送信に失敗する。
+    routes.append(ChannelRoute(src=bridge.endpoint(100), dst=ChannelEndpoint(guild=3, channel=300)))
+    manager = bridge.manager(routes)
+    # 2 秒前に投稿されたメッセージとして扱う。
+    created_ms = int(time.time() * 1000) - DISCORD_EPOCH_MS - 2000
+    message = bridge.message(bridge.channel(100), message_id=created_ms << 22)
+
+    await manager.handle_message(message)  # type: ignore[arg-type]
+
+    snapshot = manager.stats_snapshot()
+    assert snapshot.lag_samples == 1
+    assert 2.0 <= snapshot.lag_percentiles[0.5] < 10.0
+    assert snapshot.mirrored_total == 1
+    assert snapshot.failed_total == 1
+    assert [(route.dst, route.error_rate) for route in snapshot.routes] == [("3/300", 1.0), ("2/200", 0.0)]
+    assert manager.metrics.get("bridge_mirror_lag_seconds").labels().count == 1
+
+    # 他ギルドのルートは内訳に出さない。
+    assert [route.dst for route in manager.stats_snapshot(guild_id=2).routes] == ["2/200"]
+
+    lines = format_bridge_stats(snapshot)
+    assert any(line.startswith("遅延 (直近 5 分, 1 件): p50 ") for line in lines)
+    assert "- 1/100 → 3/300: 100.0% (成功 0 / 失敗 1)" in lines
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.fakes import FakeDiscordClient, FakeMessage
+from bot.bridge.manager import ChannelBridgeManager
+from bot.bridge.messages import BridgeMessageStore
+from bot.bridge.profiles import BridgeProfileStore
+from bot.bridge.storage import InMemoryStorageBackend
+from bot.client import BridgeClientMixin, ShardedBridgeBotClient
+
+
+def _manager(shard_count: int | None) -> ChannelBridgeManager:
+    storage = InMemoryStorageBackend()
+    return ChannelBridgeManager(
+        client=FakeDiscordClient(shard_count=shard_count),  # type: ignore[arg-type]
+        profile_store=BridgeProfileStore(storage),
+        message_store=BridgeMessageStore(storage),
+        routes=[],
+    )
+
+
+def test_shard_for_guild_follows_discord_formula() -> None:
+    guild_id = (7 << 22) | 12345
+    assert _manager(4).shard_for_guild(guild_id) == 3
+    assert _manager(None).shard_for_guild(guild_id) == 0
+    assert _manager(4).shard_for_guild(None) == 0
+
+
+@pytest.mark.asyncio
+async def test_sharded_client_records_events_and_readiness_per_shard() -> None:
+    manager = _manager(2)
+    client = ShardedBridgeBotClient(bridge_manager=manager, shard_count=2)
+    assert isinstance(client, BridgeClientMixin)
+
+    fakes = FakeDiscordClient()
+    for guild_id in ((1 << 22), (2 << 22), (3 << 22)):
+        channel = fakes.add_channel(guild_id=guild_id, channel_id=guild_id + 1)
+        message = FakeMessage(
+            message_id=fakes.snowflakes.next(),
+            channel=channel,
+            author=SimpleNamespace(id=42, bot=False),
+            content="hi",
+        )
+        await client.on_message(message)  # type: ignore[arg-type]
+
+    await client.on_shard_ready(0)
+    await client.on_shard_ready(1)
+    await client.on_shard_disconnect(1)
+
+    events = manager.metrics.get("bridge_shard_events_total")
+    assert events.value(shard=1, event="message") == 2
+    assert events.value(shard=0, event="message") == 1
+    ready = manager.metrics.get("bridge_shard_ready")
+    assert ready.value(shard=0) == 1
+    assert ready.value(shard=1) == 0
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from bot.bridge.cluster import LeaseCoordinator, channel_resource
+from bot.bridge.messages import BridgeMessageStore
+from bot.bridge.storage import SqliteStorageBackend
+
+_RESOURCES = [channel_resource(channel_id) for channel_id in (100, 101, 200, 201)]
+
+
+def _coordinator(backend: SqliteStorageBackend, owner_id: str, *, ttl: float = 30.0) -> LeaseCoordinator:
+    return LeaseCoordinator(
+        backend,
+        owner_id=owner_id,
+        scope="channel",
+        resources=_RESOURCES,
+        ttl=ttl,
+        renew_interval=ttl / 3,
+    )
+
+
+def test_processes_split_channels_and_take_over_expired_leases(tmp_path) -> None:
+    path = tmp_path / "bridge.sqlite3"
+    backend_a = SqliteStorageBackend(path)
+    backend_b = SqliteStorageBackend(path)
+    try:
+        node_a = _coordinator(backend_a, "a", ttl=0.3)
+        node_b = _coordinator(backend_b, "b", ttl=0.3)
+
+        assert node_a.rebalance() == frozenset(_RESOURCES)
+        # 後から参加したプロセスは、既存プロセスが余剰分を手放した後に引き継ぐ。
+        assert node_b.rebalance() == frozenset()
+        assert len(node_a.rebalance()) == 2
+        assert len(node_b.rebalance()) == 2
+        assert node_a.owned.isdisjoint(node_b.owned)
+        assert node_a.owns_event(1, 100) != node_b.owns_event(1, 100)
+
+        # a が更新を止めると、TTL 経過後に b が全チャンネルを引き継ぐ。
+        time.sleep(0.35)
+        assert not node_a.owns(next(iter(node_a.owned)))
+        assert node_b.rebalance() == frozenset(_RESOURCES)
+    finally:
+        backend_a.close()
+        backend_b.close()
+
+
+def test_lease_is_exclusive_until_released(tmp_path) -> None:
+    path = tmp_path / "bridge.sqlite3"
+    backend_a = SqliteStorageBackend(path)
+    backend_b = SqliteStorageBackend(path)
+    try:
+        assert backend_a.acquire_lease("shard:0", "a", ttl=30)
+        assert not backend_b.acquire_lease("shard:0", "b", ttl=30)
+        assert backend_a.acquire_lease("shard:0", "a", ttl=30)
+        assert [row["owner"] for row in backend_b.list_active_leases()] == ["a"]
+
+        backend_b.release_lease("shard:0", "b")
+        assert not backend_b.acquire_lease("shard:0", "b", ttl=30)
+        backend_a.release_lease("shard:0", "a")
+        assert backend_b.acquire_lease("shard:0", "b", ttl=30)
+    finally:
+        backend_a.close()
+        backend_b.close()
+
+
+def _manager(bridge, backend: SqliteStorageBackend):
+    return bridge.manager(bridge.routes(100, [200]), storage=backend, propagate_deletes=True, shared_links=True)
+
+
+@pytest.mark.asyncio
+async def test_edit_and_delete_resolve_mirrors_created_by_another_process(bridge, tmp_path) -> None:
+    path = tmp_path / "bridge.sqlite3"
+    backend_a = SqliteStorageBackend(path)
+    backend_b = SqliteStorageBackend(path)
+    destination = bridge.channel(200)
+    try:
+        process_a = _manager(bridge, backend_a)
+        process_b = _manager(bridge, backend_b)
+
+        message = bridge.message(bridge.channel(100), "before")
+        await process_a.handle_message(message)  # type: ignore[arg-type]
+        mirror = next(iter(destination.messages.values()))
+
+        message.content = "after"
+        message.edited_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        await process_b.handle_message_edit(message, message)  # type: ignore[arg-type]
+        assert mirror.edit_calls == 1
+        assert "after" in " ".join(str(embed.description) for embed in mirror.embeds) + (mirror.content or "")
+
+        await process_b.handle_raw_message_delete(message.id, channel_id=100)
+        assert destination.messages == {}
+        assert BridgeMessageStore(backend_a).get(message.id) is None
+        hydrations = process_b.metrics.get("bridge_link_hydrations_total")
+        assert hydrations.value(result="hit") == 1
+    finally:
+        backend_a.close()
+        backend_b.close()
+
+
+@pytest.mark.asyncio
+async def test_unknown_messages_are_looked_up_in_the_store_once(bridge) -> None:
+    manager = bridge.manager(bridge.routes(100, [200]), shared_links=True)
+    store = manager._message_store
+    lookups: list[int] = []
+    original_find = store.find_linked
+    store.find_linked = lambda message_id: (  # type: ignore[method-assign]
+        lookups.append(message_id) or original_find(message_id)
+    )
+    # ブリッジ導入前のメッセージなど、どのプロセスもミラーしていないメッセージ。
+    message = bridge.message(bridge.channel(100))
+
+    for _ in range(3):
+        reaction = SimpleNamespace(message=message, emoji="👍")
+        await manager.handle_reaction(reaction, SimpleNamespace(id=7, bot=False), add=True)  # type: ignore[arg-type]
+
+    assert lookups == [message.id]
+    assert manager.metrics.get("bridge_link_hydrations_total").value(result="miss") == 1
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+_DESTINATIONS = (200, 201)
+
+
+def _build(bridge, *, propagate: bool, window: float = 0.0):
+    manager = bridge.manager(
+        bridge.routes(100, _DESTINATIONS),
+        propagate_deletes=propagate,
+        delete_batch_window=window,
+    )
+    return manager, bridge.storage
+
+
+async def _send_source(bridge, manager):
+    message = bridge.message(bridge.channel(100))
+    await manager.handle_message(message)  # type: ignore[arg-type]
+    return message
+
+
+@pytest.mark.asyncio
+async def test_delete_propagation_removes_mirrors_and_record(bridge) -> None:
+    manager, storage = _build(bridge, propagate=True)
+    message = await _send_source(bridge, manager)
+    assert all(len(bridge.channel(channel_id).messages) == 1 for channel_id in _DESTINATIONS)
+
+    await manager.handle_raw_message_delete(message.id)
+
+    assert all(bridge.channel(channel_id).messages == {} for channel_id in _DESTINATIONS)
+    assert storage.get_message(message.id) is None
+    assert len(manager._links) == 0
+    assert manager.metrics.get("bridge_mirror_deletes_total").value(method="single", result="success") == 2
+
+    # 自分で削除したミラーの削除イベントはストアに問い合わせずに無視される。
+    mirror_ids = list(manager._self_deleted_ids)
+    assert len(mirror_ids) == 2
+    storage.delete_message = MagicMock(side_effect=AssertionError)  # type: ignore[method-assign]
+    storage.find_message_by_destination = MagicMock(side_effect=AssertionError)  # type: ignore[method-assign]
+    for mirror_id in mirror_ids:
+        await manager.handle_raw_message_delete(mirror_id)
+    assert manager._self_deleted_ids == {}
+
+
+@pytest.mark.asyncio
+async def test_delete_propagation_batches_a_sweep_into_bulk_deletes(bridge) -> None:
+    manager, _storage = _build(bridge, propagate=True, window=30.0)
+    messages = [await _send_source(bridge, manager) for _ in range(5)]
+
+    for message in messages:
+        await manager.handle_raw_message_delete(message.id)
+    assert all(len(bridge.channel(channel_id).messages) == 5 for channel_id in _DESTINATIONS)
+
+    await manager.flush_mirror_deletes()
+    manager._mirror_delete_flush.cancel()
+    await asyncio.sleep(0)
+
+    for channel_id in _DESTINATIONS:
+        channel = bridge.channel(channel_id)
+        assert channel.messages == {}
+        assert channel.bulk_delete_calls == 1
+        assert channel.single_delete_calls == 0
+    assert manager.metrics.get("bridge_mirror_deletes_total").value(method="bulk", result="success") == 10
+
+
+@pytest.mark.asyncio
+async def test_delete_without_propagation_keeps_mirrors(bridge) -> None:
+    manager, storage = _build(bridge, propagate=False)
+    message = await _send_source(bridge, manager)
+
+    await manager.handle_raw_message_delete(message.id)
+
+    assert all(len(bridge.channel(channel_id).messages) == 1 for channel_id in _DESTINATIONS)
+    assert storage.get_message(message.id) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_event_uses_one_store_call_and_bulk_mirror_deletes(bridge) -> None:
+    manager, storage = _build(bridge, propagate=True, window=30.0)
+    messages = [await _send_source(bridge, manager) for _ in range(4)]
+    mirror_of_last = manager._links.mirrors(messages[-1].id)[0]
+    storage_calls = MagicMock(wraps=storage.delete_messages_by_ids)
+    storage.delete_messages_by_ids = storage_calls  # type: ignore[method-assign]
+
+    await manager.handle_raw_bulk_message_delete([message.id for message in messages[:3]])
+
+    storage_calls.assert_called_once()
+    for channel_id in _DESTINATIONS:
+        channel = bridge.channel(channel_id)
+        assert len(channel.messages) == 1
+        assert channel.bulk_delete_calls == 1
+    assert all(storage.get_message(message.id) is None for message in messages[:3])
+    assert storage.get_message(messages[-1].id) is not None
+
+    # 送信先チャンネル側の一括削除は残った記録から ID だけを取り除く。
+    await manager.handle_raw_bulk_message_delete([mirror_of_last])
+    remaining = storage.get_message(messages[-1].id)["destination_ids"]
+    assert mirror_of_last not in remaining
+    assert len(remaining) == 1
+
+
+@pytest.mark.asyncio
+async def test_deletes_outside_bridged_channels_skip_the_store(bridge) -> None:
+    manager, storage = _build(bridge, propagate=True)
+    storage.delete_message = MagicMock(side_effect=AssertionError)  # type: ignore[method-assign]
+    storage.find_message_by_destination = MagicMock(side_effect=AssertionError)  # type: ignore[method-assign]
+    storage.delete_messages_by_ids = MagicMock(side_effect=AssertionError)  # type: ignore[method-assign]
+
+    await manager.handle_raw_message_delete(12345, channel_id=999)
+    await manager.handle_raw_bulk_message_delete([12345, 12346], channel_id=999)
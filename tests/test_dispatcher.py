@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bot.bridge.dispatcher import BridgeEventDispatcher
+from bot.bridge.metrics import BridgeMetrics
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_keeps_channel_order_and_runs_channels_in_parallel() -> None:
+    dispatcher = BridgeEventDispatcher(shards=2, queue_size=10)
+    await dispatcher.start()
+    handled: list[tuple[int, str]] = []
+    gate = asyncio.Event()
+
+    def handler(channel_id: int, label: str, *, wait: bool = False):
+        async def run() -> None:
+            if wait:
+                await gate.wait()
+            handled.append((channel_id, label))
+
+        return run
+
+    # チャンネル 10 の作成処理が止まっていても、別シャードのチャンネル 11 は先に進む。
+    await dispatcher.submit(10, "message", handler(10, "create", wait=True))
+    await dispatcher.submit(10, "edit", handler(10, "edit"))
+    await dispatcher.submit(11, "message", handler(11, "create"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert handled == [(11, "create")]
+
+    gate.set()
+    await dispatcher.join()
+    assert [label for channel_id, label in handled if channel_id == 10] == ["create", "edit"]
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [("drop_newest", ["a", "b"]), ("drop_oldest", ["b", "c"])],
+)
+async def test_dispatcher_overflow_policies(policy: str, expected: list[str]) -> None:
+    metrics = BridgeMetrics()
+    dispatcher = BridgeEventDispatcher(shards=1, queue_size=2, overflow=policy, metrics=metrics)
+    handled: list[str] = []
+
+    def handler(label: str):
+        async def run() -> None:
+            handled.append(label)
+
+        return run
+
+    # ワーカー起動前に積み、満杯時の挙動を確認する。
+    results = [await dispatcher.submit(1, "message", handler(label)) for label in ("a", "b", "c")]
+    await dispatcher.start()
+    await dispatcher.close(drain_timeout=1.0)
+
+    assert handled == expected
+    assert results == ([True, True, False] if policy == "drop_newest" else [True, True, True])
+    assert metrics.get("bridge_dispatch_events_total").value(kind="message", result="dropped") == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_continues_after_handler_failure() -> None:
+    metrics = BridgeMetrics()
+    dispatcher = BridgeEventDispatcher(shards=1, queue_size=4, metrics=metrics)
+    await dispatcher.start()
+    handled: list[str] = []
+
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    async def ok() -> None:
+        handled.append("ok")
+
+    await dispatcher.submit(1, "message", boom)
+    await dispatcher.submit(1, "edit", ok)
+    await dispatcher.close(drain_timeout=1.0)
+
+    assert handled == ["ok"]
+    events = metrics.get("bridge_dispatch_events_total")
+    assert events.value(kind="message", result="failed") == 1
+    assert events.value(kind="edit", result="processed") == 1
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from benchmarks.fakes import FakeMessage
+
+_EDITED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+async def _build(bridge, *, debounce: float, latency: float = 0.0):
+    manager = bridge.manager(bridge.routes(100, [200]), edit_debounce=debounce)
+    message = bridge.message(bridge.channel(100), "v0")
+    await manager.handle_message(message)  # type: ignore[arg-type]
+    bridge.client.latency = latency
+    mirror = next(iter(bridge.channel(200).messages.values()))
+    return manager, message, mirror
+
+
+def _edited(message: FakeMessage, content: str, seconds: int) -> FakeMessage:
+    message.content = content
+    message.edited_at = _EDITED_AT + timedelta(seconds=seconds)
+    return message
+
+
+def _rendered(mirror: FakeMessage) -> str:
+    return " ".join(str(embed.description) for embed in mirror.embeds) + (mirror.content or "")
+
+
+@pytest.mark.asyncio
+async def test_rapid_edits_are_coalesced_into_the_latest_version(bridge) -> None:
+    manager, message, mirror = await _build(bridge, debounce=0.05)
+
+    for index in range(1, 4):
+        await manager.handle_message_edit(message, _edited(message, f"v{index}", index))  # type: ignore[arg-type]
+    assert mirror.edit_calls == 0
+
+    await asyncio.sleep(0.1)
+    assert mirror.edit_calls == 1
+    assert "v3" in _rendered(mirror)
+
+
+@pytest.mark.asyncio
+async def test_older_edit_never_overwrites_newer_one(bridge) -> None:
+    manager, message, mirror = await _build(bridge, debounce=0.0, latency=0.01)
+
+    newest = _edited(message, "v2", 2)
+    stale = FakeMessage(
+        message_id=message.id,
+        channel=message.channel,
+        author=message.author,
+        content="v1",
+    )
+    stale.edited_at = _EDITED_AT + timedelta(seconds=1)
+
+    await asyncio.gather(
+        manager.handle_message_edit(message, newest),  # type: ignore[arg-type]
+        manager.handle_message_edit(message, stale),  # type: ignore[arg-type]
+    )
+
+    assert mirror.edit_calls == 1
+    assert "v2" in _rendered(mirror)
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_edits(bridge) -> None:
+    manager, message, mirror = await _build(bridge, debounce=30.0)
+
+    await manager.handle_message_edit(message, _edited(message, "final", 1))  # type: ignore[arg-type]
+    await manager.close()
+
+    assert mirror.edit_calls == 1
+    assert "final" in _rendered(mirror)
+
+
+@pytest.mark.asyncio
+async def test_edit_without_content_change_skips_discord_and_store(bridge) -> None:
+    manager, message, mirror = await _build(bridge, debounce=0.0)
+    store = manager._message_store
+    calls: list[str] = []
+    original_get = store.get
+    store.get = lambda source_id: calls.append("get") or original_get(source_id)  # type: ignore[method-assign]
+
+    # リンクプレビューの展開など、本文が変わらない編集イベント。
+    await manager.handle_message_edit(message, _edited(message, "v0", 1))  # type: ignore[arg-type]
+    assert mirror.edit_calls == 0
+    assert calls == []
+
+    await manager.handle_message_edit(message, _edited(message, "v1", 2))  # type: ignore[arg-type]
+    assert mirror.edit_calls == 1
+    record = original_get(message.id)
+    assert record is not None and record.payload_hash == manager._payload_hashes[message.id]
+
+    # メモリ上のキャッシュが無くても、保存済みのハッシュで判定できる。
+    manager._payload_hashes.clear()
+    await manager.handle_message_edit(message, _edited(message, "v1", 3))  # type: ignore[arg-type]
+    assert mirror.edit_calls == 1
+    edits = manager.metrics.get("bridge_edits_total")
+    assert edits.value(result="unchanged") == 2
+    assert edits.value(result="applied") == 1
+
+
+@pytest.mark.asyncio
+async def test_partially_failed_edit_does_not_skip_reverting_to_the_original_text(bridge) -> None:
+    manager, message, mirror = await _build(bridge, debounce=0.0)
+    failing = bridge.message(bridge.channel(300), "v0")
+    manager._store_message_location(failing)
+    manager._link_messages(message.id, failing.id)
+
+    async def _fail_edit(**_kwargs) -> None:
+        raise discord.HTTPException(SimpleNamespace(status=500, reason="error"), "boom")
+
+    failing.edit = _fail_edit  # type: ignore[method-assign]
+
+    await manager.handle_message_edit(message, _edited(message, "v1", 1))  # type: ignore[arg-type]
+    assert "v1" in _rendered(mirror)
+    assert message.id not in manager._payload_hashes
+    record = manager._message_store.get(message.id)
+    assert record is not None and record.payload_hash is None
+
+    # 元の本文へ戻す編集は「変更なし」として捨てずに反映する。
+    await manager.handle_message_edit(message, _edited(message, "v0", 2))  # type: ignore[arg-type]
+    assert "v0" in _rendered(mirror)
+    edits = manager.metrics.get("bridge_edits_total")
+    assert edits.value(result="unchanged") == 0
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_a_debounced_edit_already_being_applied(bridge) -> None:
+    manager, message, mirror = await _build(bridge, debounce=0.01, latency=0.05)
+
+    await manager.handle_message_edit(message, _edited(message, "v1", 1))  # type: ignore[arg-type]
+    await asyncio.sleep(0.03)
+    assert mirror.edit_calls == 0 and message.id in manager._edit_timers
+
+    await manager.close()
+    assert mirror.edit_calls == 1
+    assert "v1" in _rendered(mirror)
+
+
+@pytest.mark.asyncio
+async def test_failed_debounced_edit_is_logged(bridge, caplog: pytest.LogCaptureFixture) -> None:
+    manager, message, _mirror = await _build(bridge, debounce=0.01)
+
+    async def _broken(_after) -> None:
+        raise RuntimeError("store down")
+
+    manager._push_edit = _broken  # type: ignore[method-assign]
+    await manager.handle_message_edit(message, _edited(message, "v1", 1))  # type: ignore[arg-type]
+    await manager.flush_pending_edits()
+
+    assert "編集の反映に失敗しました" in caplog.text
+    assert manager._edit_timers == {}
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_duplicate_message_events_are_mirrored_once(bridge) -> None:
+    destination = bridge.channel(200)
+    routes = bridge.routes(100, [200])
+    manager = bridge.manager(routes, delivery_claims=True)
+    message = bridge.message(bridge.channel(100))
+
+    await manager.handle_message(message)  # type: ignore[arg-type]
+    # ゲートウェイ再開後の再配信: メモリ上のキャッシュで弾かれ、ストアには問い合わせない。
+    store = manager._message_store
+    calls: list[int] = []
+    original_claim = store.claim_deliveries
+    store.claim_deliveries = lambda source_id, channel_ids: calls.append(source_id) or original_claim(  # type: ignore[method-assign]
+        source_id, channel_ids
+    )
+    await manager.handle_message(message)  # type: ignore[arg-type]
+    assert destination.sent == 1
+    assert calls == []
+
+    # 再起動後の再配信: キャッシュは空だが、ストアの送信権で弾かれる。
+    restarted = bridge.manager(routes, delivery_claims=True)
+    await restarted.handle_message(message)  # type: ignore[arg-type]
+    assert destination.sent == 1
+    assert manager.metrics.get("bridge_duplicate_deliveries_total").value(layer="memory") == 1
+    assert restarted.metrics.get("bridge_duplicate_deliveries_total").value(layer="store") == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_send_releases_its_claim(bridge) -> None:
+    destination = bridge.channel(200)
+    routes = bridge.routes(100, [200])
+    message = bridge.message(bridge.channel(100))
+
+    destination.fail_sends = 1
+    await bridge.manager(routes, delivery_claims=True).handle_message(message)  # type: ignore[arg-type]
+    assert destination.sent == 0
+
+    await bridge.manager(routes, delivery_claims=True).handle_message(message)  # type: ignore[arg-type]
+    assert destination.sent == 1
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from bot.bridge.links import LinkGroupIndex
+
+_CHANNELS = (100, 200, 300)
+
+
+def test_link_group_index_tracks_siblings_per_channel() -> None:
+    links = LinkGroupIndex()
+    links.link(1, 100, 2, 200)
+    links.link(1, 100, 3, 300)
+
+    assert links.mirrors(1) == [2, 3]
+    assert links.siblings(2) == [1, 3]
+    assert links.copy_in(3, 200) == 2
+    assert links.copy_in(2, 100) == 1
+    assert links.is_mirror(2) and not links.is_mirror(1)
+    assert (len(links), links.member_count()) == (1, 3)
+
+    assert links.discard(2) == []
+    assert links.members(1) == [(100, 1), (300, 3)]
+    # 送信元だけが残るとグループは解消される。
+    assert links.discard(3) == [1]
+    assert len(links) == 0 and 1 not in links
+
+
+def _mesh_manager(bridge):
+    return bridge.manager(
+        route
+        for channel_id in _CHANNELS
+        for route in bridge.routes(channel_id, [other for other in _CHANNELS if other != channel_id])
+    )
+
+
+@pytest.mark.asyncio
+async def test_reaction_on_a_mirror_reaches_the_source_and_sibling_mirrors(bridge) -> None:
+    manager = _mesh_manager(bridge)
+    original = bridge.message(bridge.channel(100), "hello")
+    await manager.handle_message(original)  # type: ignore[arg-type]
+    mirror_200 = next(iter(bridge.channel(200).messages.values()))
+    mirror_300 = next(iter(bridge.channel(300).messages.values()))
+
+    reaction = SimpleNamespace(message=mirror_200, emoji="👍")
+    await manager.handle_reaction(reaction, SimpleNamespace(id=7, bot=False), add=True)  # type: ignore[arg-type]
+
+    assert original.reactions == {"👍": 1}
+    assert mirror_300.reactions == {"👍": 1}
+    assert mirror_200.reactions == {}
+
+
+@pytest.mark.asyncio
+async def test_reply_to_a_mirror_links_to_the_sibling_mirror_in_each_destination(bridge) -> None:
+    channels = {channel_id: bridge.channel(channel_id) for channel_id in _CHANNELS}
+    manager = _mesh_manager(bridge)
+    original = bridge.message(channels[100], "question")
+    await manager.handle_message(original)  # type: ignore[arg-type]
+    mirror_200 = next(iter(channels[200].messages))
+    mirror_300 = next(iter(channels[300].messages))
+
+    reply = bridge.message(channels[200], "answer")
+    reply.reference = SimpleNamespace(resolved=None, guild_id=2, channel_id=200, message_id=mirror_200)
+    await manager.handle_message(reply)  # type: ignore[arg-type]
+
+    expected = {
+        100: f"https://discord.com/channels/1/100/{original.id}",
+        300: f"https://discord.com/channels/3/300/{mirror_300}",
+    }
+    for channel_id, url in expected.items():
+        mirrored_reply = channels[channel_id].messages[max(channels[channel_id].messages)]
+        assert f"▶ Reply to {url}" in str(mirrored_reply.embeds[0].description)
+    assert manager.metrics.get("bridge_reference_remaps_total").value(result="miss") == 0
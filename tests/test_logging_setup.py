@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from app.config import LoggingSettings
+from app.logging_setup import (
+    EventSamplingFilter,
+    JsonLogFormatter,
+    RateLimitFilter,
+    configure_logging,
+)
+
+
+def _record(
+    msg: str,
+    *args: object,
+    level: int = logging.INFO,
+    **extra: object,
+) -> logging.LogRecord:
+    record = logging.LogRecord("bot.bridge.manager", level, __file__, 1, msg, args, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_json_formatter_includes_event_and_context() -> None:
+    record = _record(
+        "ブリッジ受信: message_id=%s",
+        42,
+        event="bridge.received",
+        context={"message_id": 42},
+    )
+
+    payload = json.loads(JsonLogFormatter().format(record))
+
+    assert payload["message"] == "ブリッジ受信: message_id=42"
+    assert payload["event"] == "bridge.received"
+    assert payload["context"] == {"message_id": 42}
+    assert payload["level"] == "INFO"
+
+
+def test_sampling_filter_applies_per_event_rates() -> None:
+    log_filter = EventSamplingFilter(
+        {"bridge.send_start": 0.0, "bridge.received": 0.5},
+        random_source=lambda: 0.7,
+    )
+
+    assert log_filter.filter(_record("x", event="bridge.send_start")) is False
+    assert log_filter.filter(_record("x", event="bridge.received")) is False
+    assert log_filter.filter(_record("x", event="bridge.send_success")) is True
+    assert log_filter.filter(_record("x")) is True
+
+
+def test_rate_limit_filter_suppresses_repeated_warnings() -> None:
+    now = [0.0]
+    log_filter = RateLimitFilter(10.0, clock=lambda: now[0])
+    template = "チャンネル取得に失敗しました: message_id=%s error=%s"
+
+    assert log_filter.filter(_record(template, 1, "x", level=logging.WARNING)) is True
+    assert log_filter.filter(_record(template, 2, "x", level=logging.WARNING)) is False
+    assert log_filter.filter(_record(template, 3, "x", level=logging.WARNING)) is False
+    assert log_filter.filter(_record("info %s", 1)) is True
+
+    now[0] = 11.0
+    record = _record(template, 4, "x", level=logging.WARNING)
+    assert log_filter.filter(record) is True
+    assert record.suppressed == 2
+
+
+def test_configure_logging_routes_through_queue_listener(capsys) -> None:
+    runtime = configure_logging(
+        LoggingSettings(format="json", sample_rates={"bridge.send_start": 0.0})
+    )
+    try:
+        logger = logging.getLogger("bot.bridge.manager")
+        logger.info("dropped", extra={"event": "bridge.send_start"})
+        logger.info("kept %s", 1, extra={"event": "bridge.received"})
+    finally:
+        runtime.stop()
+        for handler in list(logging.getLogger().handlers):
+            logging.getLogger().removeHandler(handler)
+
+    lines = [line for line in capsys.readouterr().err.splitlines() if line.strip()]
+    assert [json.loads(line)["message"] for line in lines] == ["kept 1"]
+
+
+def test_queued_json_logs_keep_the_traceback_in_exc_info(capsys) -> None:
+    runtime = configure_logging(LoggingSettings(format="json"))
+    try:
+        try:
+            raise ValueError("bad payload")
+        except ValueError:
+            logging.getLogger("bot.bridge.manager").exception("boom %s", 1)
+    finally:
+        runtime.stop()
+        for handler in list(logging.getLogger().handlers):
+            logging.getLogger().removeHandler(handler)
+
+    payload = json.loads(capsys.readouterr().err.strip())
+    assert payload["message"] == "boom 1"
+    assert "ValueError: bad payload" in payload["exc_info"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import discord
+
+from bot.bridge.manager import ChannelBridgeManager
+from bot.bridge.messages import BridgeMessageStore
+from bot.bridge.metrics import BridgeMetrics, MetricsServer
+from bot.bridge.profiles import BridgeProfile, BridgeProfileStore
+from bot.bridge.routes import ChannelEndpoint, ChannelRoute
+
+
+def test_render_uses_prometheus_text_format() -> None:
+    metrics = BridgeMetrics()
+    counter = metrics.counter("demo_total", "Demo counter.", ("route",))
+    counter.labels(route="1/2").inc()
+    counter.labels(route="1/2").inc(2)
+    histogram = metrics.histogram("demo_seconds", "Demo histogram.", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    text = metrics.render()
+
+    assert "# TYPE demo_total counter" in text
+    assert 'demo_total{route="1/2"} 3' in text
+    assert 'demo_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{le="1"} 2' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 3' in text
+    assert "demo_seconds_count 3" in text
+
+
+def test_registry_returns_existing_family_and_rejects_type_mismatch() -> None:
+    metrics = BridgeMetrics()
+    first = metrics.counter("events_total", "Events.")
+
+    assert metrics.counter("events_total", "Events.") is first
+    with pytest.raises(ValueError):
+        metrics.gauge("events_total", "Events.")
+
+
+@pytest.mark.asyncio
+async def test_metrics_server_serves_registry() -> None:
+    metrics = BridgeMetrics()
+    metrics.gauge("demo_depth", "Demo gauge.").set(4)
+    server = MetricsServer(metrics, host="127.0.0.1", port=0)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await writer.drain()
+        response = (await reader.read()).decode("utf-8")
+        writer.close()
+    finally:
+        await server.close()
+
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert "demo_depth 4" in response
+
+
+@pytest.mark.asyncio
+async def test_manager_records_route_outcomes_and_stage_latency() -> None:
+    route = ChannelRoute(
+        src=ChannelEndpoint(guild=1, channel=10),
+        dst=ChannelEndpoint(guild=2, channel=20),
+    )
+    client = MagicMock(spec=discord.Client)
+    client.user = None
+    destination = MagicMock()
+    destination.id = 20
+    mirrored = SimpleNamespace(id=500, guild=SimpleNamespace(id=2), channel=destination)
+    destination.send = AsyncMock(return_value=mirrored)
+    client.get_channel.return_value = destination
+
+    profile_store = MagicMock(spec=BridgeProfileStore)
+    profile_store.get_profile.return_value = BridgeProfile(seed="s", display_name="name", avatar_url="")
+    profile_store.get_guild_color.return_value = None
+    message_store = MagicMock(spec=BridgeMessageStore)
+
+    metrics = BridgeMetrics()
+    manager = ChannelBridgeManager(
+        client=client,
+        profile_store=profile_store,
+        message_store=message_store,
+        routes=[route],
+        metrics=metrics,
+    )
+    message = SimpleNamespace(
+        id=100,
+        author=SimpleNamespace(id=7, bot=False),
+        guild=SimpleNamespace(id=1),
+        channel=SimpleNamespace(id=10),
+        content="hello",
+        attachments=[],
+        stickers=[],
+        reference=None,
+    )
+
+    await manager.handle_message(message)
+
+    routes_counter = metrics.get("bridge_route_messages_total")
+    assert routes_counter.value(src="1/10", dst="2/20", result="success") == 1
+    text = metrics.render()
+    assert 'bridge_stage_duration_seconds_count{stage="send"} 1' in text
+    assert 'bridge_store_duration_seconds_count{operation="upsert"} 1' in text
+    assert 'bridge_link_state_size{structure="message_links"} 2' in text
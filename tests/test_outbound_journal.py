@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from bot.bridge.journal import (
+    OUTBOUND_NONCE_WINDOW,
+    OutboundEntry,
+    OutboundJournal,
+    OutboundRetryQueue,
+    is_retryable_error,
+    outbound_nonce,
+)
+from bot.bridge.metrics import BridgeMetrics
+
+
+def _server_error() -> discord.DiscordServerError:
+    return discord.DiscordServerError(SimpleNamespace(status=503, reason="Service Unavailable"), "down")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_journal_replays_pending_entries_and_compacts(tmp_path) -> None:
+    path = tmp_path / "journal.jsonl"
+    journal = OutboundJournal(path)
+    journal.put(OutboundEntry(key="send:1:2", kind="send", data={"source_id": 1}))
+    journal.put(OutboundEntry(key="edit:3", kind="edit", data={"target_id": 3}))
+    journal.put(OutboundEntry(key="edit:3", kind="edit", data={"target_id": 3}, attempts=2))
+    journal.done("send:1:2")
+    journal.flush()
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"op":"put","entry":')  # 書き込み途中で停止した行
+
+    entries = OutboundJournal(path).load()
+
+    assert [(entry.key, entry.attempts) for entry in entries] == [("edit:3", 2)]
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_retryable_errors() -> None:
+    assert is_retryable_error(_server_error())
+    assert is_retryable_error(
+        discord.HTTPException(SimpleNamespace(status=429, reason="Too Many Requests"), "slow down")
+    )
+    assert not is_retryable_error(discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "no"))
+    assert outbound_nonce(1, 2) == outbound_nonce(1, 2) != outbound_nonce(1, 3)
+    assert len(outbound_nonce(1, 2)) <= 25
+
+
+@pytest.mark.asyncio
+async def test_retry_queue_backs_off_then_drops(tmp_path) -> None:
+    clock = _Clock()
+    queue = OutboundRetryQueue(OutboundJournal(tmp_path / "journal.jsonl"), max_attempts=2, clock=clock)
+    calls: list[str] = []
+
+    async def executor(entry: OutboundEntry) -> None:
+        calls.append(entry.key)
+        raise _server_error()
+
+    queue.bind(executor)
+    queue.submit("edit", "edit:3", {"target_id": 3})
+    assert await queue.run_due() == 0
+
+    clock.now += 10
+    assert await queue.run_due() == 1
+    assert queue.pending()[0].attempts == 2
+
+    clock.now += 10
+    await queue.run_due()
+    assert calls == ["edit:3", "edit:3"]
+    assert len(queue) == 0
+
+    await queue.close()
+    assert OutboundJournal(tmp_path / "journal.jsonl").load() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_send_is_journaled_and_replayed_without_duplicates(bridge, tmp_path) -> None:
+    destination = bridge.channel(200)
+    clock = _Clock()
+    metrics = BridgeMetrics()
+    queue = OutboundRetryQueue(OutboundJournal(tmp_path / "journal.jsonl"), metrics=metrics, clock=clock)
+    manager = bridge.manager(bridge.routes(100, [200]), metrics=metrics, retry_queue=queue)
+    message = bridge.message(bridge.channel(100))
+
+    destination.fail_sends = 1
+    await manager.handle_message(message)  # type: ignore[arg-type]
+    assert destination.messages == {}
+    assert [entry.key for entry in queue.pending()] == [f"send:{message.id}:200"]
+
+    clock.now += 10
+    await queue.run_due()
+
+    assert len(destination.messages) == 1
+    mirror_id = next(iter(destination.messages))
+    assert destination._nonces[outbound_nonce(message.id, 200)].id == mirror_id
+    record = bridge.storage.get_message(message.id)
+    assert record is not None and record["destination_ids"] == [mirror_id]
+    assert manager._links.mirrors(message.id) == [mirror_id]
+    assert len(queue) == 0
+    assert metrics.get("bridge_outbound_retries_total").value(kind="send", result="succeeded") == 1
+
+
+def _restarted(bridge, tmp_path):
+    """A manager that starts with empty link state and a journal restored from disk."""
+    clock = _Clock()
+    queue = OutboundRetryQueue(OutboundJournal(tmp_path / "journal.jsonl"), clock=clock)
+    return bridge.manager(bridge.routes(100, [200]), retry_queue=queue), queue, clock
+
+
+def _journal_send(queue: OutboundRetryQueue, source_id: int) -> None:
+    data = {"source_guild_id": 1, "source_channel_id": 100, "source_id": source_id, "dst_guild_id": 2, "dst_channel_id": 200}
+    queue.submit("send", f"send:{source_id}:200", data)
+
+
+@pytest.mark.asyncio
+async def test_replayed_send_after_restart_skips_a_stored_mirror(bridge, tmp_path) -> None:
+    destination = bridge.channel(200)
+    message = bridge.message(bridge.channel(100))
+    await bridge.manager(bridge.routes(100, [200])).handle_message(message)  # type: ignore[arg-type]
+
+    manager, queue, clock = _restarted(bridge, tmp_path)
+    _journal_send(queue, message.id)
+    # Discord が nonce を忘れた後の再送でも、ストアの記録で送信済みと分かる。
+    destination._nonces.clear()
+    clock.now += 10
+    await queue.run_due()
+
+    assert destination.sent == 1
+    assert manager._links.mirrors(message.id) == list(destination.messages)
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_unverifiable_send_is_dropped_after_the_nonce_window(bridge, tmp_path) -> None:
+    destination = bridge.channel(200)
+    message = bridge.message(bridge.channel(100))
+    manager, queue, clock = _restarted(bridge, tmp_path)
+
+    def _store_down(source_id: int) -> None:
+        raise ConnectionError("down")
+
+    manager._message_store.get = _store_down  # type: ignore[method-assign]
+    _journal_send(queue, message.id)
+
+    clock.now += OUTBOUND_NONCE_WINDOW + 1
+    await queue.run_due()
+
+    assert destination.sent == 0
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_replayed_edit_after_restart_loads_the_mirror_from_the_store(bridge, tmp_path) -> None:
+    destination = bridge.channel(200)
+    message = bridge.message(bridge.channel(100), "before")
+    await bridge.manager(bridge.routes(100, [200])).handle_message(message)  # type: ignore[arg-type]
+    mirror = next(iter(destination.messages.values()))
+
+    _manager, queue, clock = _restarted(bridge, tmp_path)
+    message.content = "after"
+    data = {"source_channel_id": 100, "source_id": message.id, "target_id": mirror.id}
+    queue.submit("edit", f"edit:{mirror.id}", data)
+    clock.now += 10
+    await queue.run_due()
+
+    assert mirror.edit_calls == 1
+    assert "after" in str(mirror.embeds[0].description) + (mirror.content or "")
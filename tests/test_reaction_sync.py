@@ -39,9 +39,9 @@ def _build_manager_fixture() -> tuple[ChannelBridgeManager, dict[str, object]]:
     source_message = SimpleNamespace(id=1111, guild=source_guild, channel=source_channel)
 
     target_message_id = 9999
-    manager._message_links[source_message.id] = {target_message_id}
-    manager._message_links[target_message_id] = {source_message.id}
+    manager._store_message_location(source_message)
     manager._message_locations[target_message_id] = (789, target_channel.id)
+    manager._link_messages(source_message.id, target_message_id)
 
     reaction = SimpleNamespace(message=source_message, emoji="🔥")
 
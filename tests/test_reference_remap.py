@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+_DESTINATIONS = (200, 300)
+
+
+@pytest.mark.asyncio
+async def test_reply_after_restart_links_to_the_mirror_in_each_destination(bridge) -> None:
+    source = bridge.channel(100)
+    destinations = [bridge.channel(channel_id) for channel_id in _DESTINATIONS]
+    routes = bridge.routes(100, _DESTINATIONS)
+
+    original = bridge.message(source, "question")
+    await bridge.manager(routes).handle_message(original)  # type: ignore[arg-type]
+    original_mirrors = {channel.id: next(iter(channel.messages)) for channel in destinations}
+
+    # 再起動後のプロセスはメモリ上にリンクを持たないため、ストアから 1 回だけ読み込む。
+    restarted = bridge.manager(routes)
+    reply = bridge.message(source, "answer")
+    reply.reference = SimpleNamespace(resolved=None, guild_id=1, channel_id=100, message_id=original.id)
+    await restarted.handle_message(reply)  # type: ignore[arg-type]
+
+    for channel in destinations:
+        mirror = channel.messages[max(channel.messages)]
+        expected = f"https://discord.com/channels/{channel.guild.id}/{channel.id}/{original_mirrors[channel.id]}"
+        assert f"▶ Reply to {expected}" in str(mirror.embeds[0].description)
+    remaps = restarted.metrics.get("bridge_reference_remaps_total")
+    assert remaps.value(result="store") == 1
+    assert remaps.value(result="memory") == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_reply_target_is_looked_up_once(bridge) -> None:
+    source = bridge.channel(100)
+    manager = bridge.manager(bridge.routes(100, _DESTINATIONS))
+    lookups: list[int] = []
+    store = manager._message_store
+    original_find = store.find_linked
+    store.find_linked = lambda message_id: (  # type: ignore[method-assign]
+        lookups.append(message_id) or original_find(message_id)
+    )
+
+    for _ in range(2):
+        reply = bridge.message(source, "answer")
+        reply.reference = SimpleNamespace(resolved=None, guild_id=1, channel_id=100, message_id=12345)
+        await manager.handle_message(reply)  # type: ignore[arg-type]
+
+    assert lookups == [12345]
+    assert manager.metrics.get("bridge_reference_remaps_total").value(result="miss") == 4
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from bot.bridge.manager import ChannelBridgeManager
+from bot.bridge.messages import BridgeMessageAttachmentMetadata, BridgeMessageStore
+from bot.bridge.metrics import BridgeMetrics
+from bot.bridge.profiles import BridgeProfileStore
+from bot.bridge.retention import BridgeRetentionTask
+from bot.bridge.storage import InMemoryStorageBackend
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _snowflake(hours_ago: float, sequence: int = 0) -> int:
+    return discord.utils.time_snowflake(NOW - timedelta(hours=hours_ago)) + sequence
+
+
+def _upsert(store: BridgeMessageStore, source_id: int, destination_ids: list[int]) -> None:
+    store.upsert(
+        source_id=source_id,
+        destination_ids=destination_ids,
+        profile_seed="seed",
+        display_name="name",
+        avatar_url="https://example.invalid/avatar.png",
+        dicebear_failed=False,
+        attachments=BridgeMessageAttachmentMetadata(image_filename=None, notes=[]),
+    )
+
+
+def _build_manager() -> ChannelBridgeManager:
+    return ChannelBridgeManager(
+        client=MagicMock(spec=discord.Client),
+        profile_store=MagicMock(spec=BridgeProfileStore),
+        message_store=MagicMock(spec=BridgeMessageStore),
+        routes=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_retention_purges_old_records_in_batches_and_evicts_links() -> None:
+    store = BridgeMessageStore(InMemoryStorageBackend())
+    old_ids = [_snowflake(48, sequence) for sequence in range(5)]
+    fresh_id = _snowflake(1)
+    for source_id in old_ids:
+        _upsert(store, source_id, [source_id + 1000])
+    _upsert(store, fresh_id, [fresh_id + 1000])
+
+    manager = _build_manager()
+    manager._message_locations[old_ids[0] + 1000] = (1, 2)
+    manager._link_messages(old_ids[0], old_ids[0] + 1000)
+    manager._link_messages(fresh_id, fresh_id + 1000)
+
+    metrics = BridgeMetrics()
+    task = BridgeRetentionTask(
+        store,
+        retention=timedelta(hours=24),
+        interval=60,
+        batch_size=2,
+        evict_links=manager.evict_links_before,
+        metrics=metrics,
+        clock=lambda: NOW,
+    )
+
+    result = await task.run_once()
+
+    assert result.purged_rows == 5
+    assert result.batches == 3
+    assert all(store.get(source_id) is None for source_id in old_ids)
+    assert store.get(fresh_id) is not None
+    assert result.evicted_links == 2
+    assert old_ids[0] not in manager._links
+    assert old_ids[0] + 1000 not in manager._links
+    assert old_ids[0] + 1000 not in manager._message_locations
+    assert manager._links.mirrors(fresh_id) == [fresh_id + 1000]
+    assert metrics.get("bridge_retention_purged_rows_total").value() == 5
+    assert metrics.get("bridge_retention_runs_total").value(result="success") == 1
+
+
+def test_evict_links_drops_mirrors_orphaned_by_an_expired_source() -> None:
+    manager = _build_manager()
+    threshold = _snowflake(24)
+    source_id = _snowflake(30)
+    mirror_id = _snowflake(23)
+    manager._message_locations[mirror_id] = (1, 2)
+    manager._link_messages(source_id, mirror_id)
+
+    assert manager.evict_links_before(threshold) == 2
+    assert len(manager._links) == 0
+    assert manager._message_locations == {}
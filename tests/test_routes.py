@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+
+from bot.bridge.routes import load_channel_routes
+
+
+def _load(payload: list, **kwargs):
+    return load_channel_routes(env_enabled=True, env_payload=json.dumps(payload), **kwargs)
+
+
+def _pairs(routes) -> set[tuple[int, int]]:
+    return {(route.src.channel, route.dst.channel) for route in routes}
+
+
+def test_route_groups_expand_into_directed_routes() -> None:
+    routes = _load(
+        [
+            {"group": "mesh", "channels": ["1/10", "2/20", {"guild": 3, "channel": 30}]},
+            {"group": "hub", "hub": "9/90", "spokes": ["1/10", "4/40"]},
+            {"group": "broadcast", "src": "5/50", "dst": ["1/10", "4/40"]},
+        ]
+    )
+
+    assert _pairs(routes) == {
+        (10, 20), (10, 30), (20, 10), (20, 30), (30, 10), (30, 20),
+        (90, 10), (10, 90), (90, 40), (40, 90),
+        (50, 10), (50, 40),
+    }
+    # 同じチャンネルのエンドポイントは共有される。
+    assert len({id(route.src) for route in routes if route.src.channel == 10}) == 1
+
+
+def test_overlapping_groups_merge_but_explicit_duplicates_are_rejected_in_strict_mode() -> None:
+    explicit = {"src": "1/10", "dst": "2/20"}
+
+    routes = _load([{"group": "mesh", "channels": ["1/10", "2/20"]}, explicit], strict=True)
+    assert _pairs(routes) == {(10, 20), (20, 10)}
+
+    with pytest.raises(ValueError, match="重複"):
+        _load([explicit, explicit], strict=True)
+    with pytest.raises(ValueError, match="未対応のルートグループ"):
+        _load([{"group": "ring", "channels": ["1/10", "2/20"]}], strict=True)
+
+
+def test_large_payload_logs_a_summary(caplog: pytest.LogCaptureFixture) -> None:
+    channels = [f"1/{channel}" for channel in range(1, 101)]
+    payload = [{"group": "mesh", "channels": channels}]
+    payload += [{"src": "1/1", "dst": "0/0"}] * 50
+
+    with caplog.at_level(logging.INFO, logger="bot.bridge.routes"):
+        routes = _load(payload, require_reciprocal=True)
+
+    assert len(routes) == 100 * 99
+    assert len(caplog.records) < 20
+    assert "ほかに 40 件" in caplog.text
+
+
+def test_routes_are_loaded_from_a_file(tmp_path) -> None:
+    path = tmp_path / "channel_routes.json"
+    path.write_text(json.dumps([{"group": "broadcast", "src": "1/10", "dst": ["2/20"]}]), encoding="utf-8")
+
+    routes = load_channel_routes(env_enabled=True, routes_file=path)
+    assert _pairs(routes) == {(10, 20)}
+
+    with pytest.raises(ValueError, match="どちらか一方"):
+        load_channel_routes(env_enabled=True, env_payload="[]", routes_file=path)
+    with pytest.raises(ValueError, match="BRIDGE_ROUTES_FILE を読み込めません"):
+        load_channel_routes(env_enabled=True, routes_file=tmp_path / "missing.json")
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from bot.bridge.routes_cli import _generate_reciprocals, _validate_routes_payload
+import json
+
+import pytest
+
+from bot.bridge.capacity import TrafficProfile, analyze_routes
+from bot.bridge.routes import load_channel_routes
+from bot.bridge.routes_cli import _generate_reciprocals, _validate_routes_payload, main
 
 
 def test_generate_reciprocals_adds_missing_reverse():
@@ -64,3 +70,39 @@ def test_validate_routes_payload_uses_loader_for_validation():
     else:  # pragma: no cover - 期待した例外が出なかった場合の保険
         raise AssertionError("invalid routes payload must raise ValueError")
 
+
+
+def test_analyze_routes_projects_fanout_and_channel_load():
+    routes = load_channel_routes(
+        env_enabled=True,
+        env_payload=json.dumps(
+            [
+                {"group": "mesh", "channels": ["1/10", "2/20", "3/30"]},
+                {"group": "broadcast", "src": "9/90", "dst": ["1/10"]},
+            ]
+        ),
+    )
+
+    report = analyze_routes(routes, traffic=TrafficProfile(messages_per_minute=30, edit_ratio=0.5))
+
+    assert [(source.endpoint.channel, source.fanout) for source in report.sources][-1] == (90, 1)
+    assert report.sources[0].calls_per_message == 2
+    assert report.sources[0].calls_per_edit == 4
+    busiest = report.destinations[0]
+    # 3 つの送信元から毎秒 0.5 件ずつ届くため、チャンネル単位の送信上限 (1 req/s) を超える。
+    assert (busiest.endpoint.channel, busiest.sources) == (10, 3)
+    assert busiest.message_rate == pytest.approx(1.5)
+    assert report.saturated
+
+
+def test_analyze_subcommand_fails_when_limits_would_be_exceeded(tmp_path, capsys):
+    routes_file = tmp_path / "channel_routes.json"
+    routes_file.write_text(json.dumps([{"group": "hub", "hub": "1/10", "spokes": ["2/20", "3/30"]}]))
+
+    assert main(["analyze", str(routes_file), "--message-rate", "6"]) == 0
+    output = capsys.readouterr().out
+    assert "ルート数: 4" in output
+    assert "guild=1, channel=10: 流入元 2" in output
+
+    assert main(["analyze", str(routes_file), "--message-rate", "60"]) == 1
+    assert "[超過]" in capsys.readouterr().out
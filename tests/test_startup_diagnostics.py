@@ -39,11 +39,13 @@ def _run_diags(
     tmp_path,
     *,
     database_probe: Callable[[Client], None] | None = None,
+    schema_probe: Callable[[Client], list[str]] | None = None,
 ):
     runner = StartupDiagnostics(
         config=config,
         data_dir=tmp_path,
         database_probe=database_probe or (lambda _: None),
+        schema_probe=schema_probe or (lambda _: []),
     )
     return {result.name: result for result in runner.run()}
 
@@ -101,3 +103,29 @@ def test_startup_diagnostics_reports_database_error(tmp_path):
     results = _run_diags(config, tmp_path, database_probe=failing_probe)
 
     assert results["Supabase 接続"].status is DiagnosticStatus.ERROR
+
+
+def test_startup_diagnostics_names_missing_message_columns(tmp_path):
+    results = _run_diags(_config(), tmp_path, schema_probe=lambda _: ["payload_hash"])
+
+    schema = results["bridge_messages スキーマ"]
+    assert schema.status is DiagnosticStatus.WARNING
+    assert "ALTER TABLE bridge_messages ADD COLUMN IF NOT EXISTS payload_hash TEXT;" in schema.detail
+    assert "message_locations" not in schema.detail
+
+
+def test_startup_diagnostics_reads_routes_file(tmp_path):
+    routes_file = tmp_path / "channel_routes.json"
+    routes_file.write_text(json.dumps([{"group": "mesh", "channels": ["1/10", "2/20", "3/30"]}]))
+    routes_env = BridgeRouteEnvSettings(
+        enabled=True,
+        routes_json=None,
+        require_reciprocal=True,
+        strict=True,
+        routes_file=str(routes_file),
+    )
+
+    results = _run_diags(_config(routes_env=routes_env), tmp_path)
+
+    assert results["ブリッジルート"].status is DiagnosticStatus.OK
+    assert "6 件" in results["ブリッジルート"].detail
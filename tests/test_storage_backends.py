@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from benchmarks.fakes import FakeSupabaseClient
+from bot.bridge.messages import (
+    BridgeMessageAttachmentMetadata,
+    BridgeMessageStore,
+)
+from bot.bridge.profiles import DEFAULT_ADJECTIVES, BridgeProfileStore
+from bot.bridge.storage import (
+    BridgeStorageBackend,
+    InMemoryStorageBackend,
+    PostgresStorageBackend,
+    SqliteStorageBackend,
+    SupabaseStorageBackend,
+)
+
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "supabase" / "bridge_schema.sql"
+
+
+def _postgres_backend() -> PostgresStorageBackend:
+    dsn = os.getenv("BRIDGE_TEST_POSTGRES_DSN")
+    if not dsn:
+        pytest.skip("BRIDGE_TEST_POSTGRES_DSN が未設定のため PostgreSQL テストをスキップします。")
+    psycopg = pytest.importorskip("psycopg")
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        connection.execute(SCHEMA_PATH.read_text(encoding="utf-8"))
+        connection.execute("TRUNCATE bridge_messages, bridge_profiles, bridge_claims, bridge_leases")
+    return PostgresStorageBackend(dsn, min_size=1, max_size=2)
+
+
+@pytest.fixture(params=["memory", "sqlite", "supabase", "postgres"])
+def backend(request, tmp_path) -> Iterator[BridgeStorageBackend]:
+    if request.param == "memory":
+        instance: BridgeStorageBackend = InMemoryStorageBackend()
+    elif request.param == "sqlite":
+        instance = SqliteStorageBackend(tmp_path / "bridge.sqlite3")
+    elif request.param == "postgres":
+        instance = _postgres_backend()
+    else:
+        instance = SupabaseStorageBackend(FakeSupabaseClient())  # type: ignore[arg-type]
+    yield instance
+    instance.close()
+
+
+def _upsert(store: BridgeMessageStore, source_id: int, destination_ids: list[int]) -> None:
+    store.upsert(
+        source_id=source_id,
+        destination_ids=destination_ids,
+        profile_seed="seed",
+        display_name="name",
+        avatar_url="https://example.invalid/avatar.png",
+        dicebear_failed=False,
+        attachments=BridgeMessageAttachmentMetadata(image_filename="a.png", notes=["(画像) x"]),
+    )
+
+
+def test_message_store_round_trip(backend: BridgeStorageBackend) -> None:
+    store = BridgeMessageStore(backend)
+    _upsert(store, 1, [30, 20, 20])
+
+    record = store.get(1)
+    assert record is not None
+    assert record.destination_ids == [20, 30]
+    assert record.attachments.image_filename == "a.png"
+    assert record.dicebear_failed is False
+
+    store.update_metadata(
+        source_id=1,
+        attachments=BridgeMessageAttachmentMetadata(image_filename=None, notes=["note"]),
+    )
+    updated = store.get(1)
+    assert updated is not None
+    assert updated.attachments.image_filename is None
+    assert updated.attachments.notes == ["note"]
+
+    store.remove_destination(20)
+    assert store.get(1).destination_ids == [30]
+    store.remove_destination(30)
+    assert store.get(1) is None
+
+    assert store.delete(1) is False
+
+
+def test_message_store_omits_columns_missing_from_the_table() -> None:
+    backend = InMemoryStorageBackend()
+    store = BridgeMessageStore(backend, omitted_columns=["payload_hash", "message_locations"])
+    store.upsert(
+        source_id=1,
+        destination_ids=[10],
+        profile_seed="seed",
+        display_name="name",
+        avatar_url="https://example.invalid/avatar.png",
+        dicebear_failed=False,
+        attachments=BridgeMessageAttachmentMetadata(image_filename=None, notes=[]),
+        payload_hash="abc",
+        locations={1: (1, 100), 10: (2, 200)},
+    )
+    store.update_metadata(source_id=1, payload_hash="def")
+
+    row = backend.get_message(1)
+    assert row is not None and row["destination_ids"] == [10]
+    assert "payload_hash" not in row
+    assert "message_locations" not in row
+
+
+def test_message_store_finds_a_record_by_source_or_mirror(backend: BridgeStorageBackend) -> None:
+    store = BridgeMessageStore(backend)
+    _upsert(store, 1, [10, 11])
+    _upsert(store, 2, [20])
+
+    assert store.find_linked(1).source_id == 1
+    assert store.find_linked(11).source_id == 1
+    assert store.find_linked(20).source_id == 2
+    assert store.find_linked(99) is None
+
+
+def test_message_store_purges_old_rows(backend: BridgeStorageBackend) -> None:
+    store = BridgeMessageStore(backend)
+    _upsert(store, 1, [10])
+
+    assert store.purge_older_than(threshold=datetime.now(timezone.utc) - timedelta(hours=1)) == 0
+    assert store.purge_older_than(threshold=datetime.now(timezone.utc) + timedelta(seconds=1)) == 1
+    assert store.get(1) is None
+
+
+def test_message_store_delete_many_handles_sources_and_destinations(
+    backend: BridgeStorageBackend,
+) -> None:
+    store = BridgeMessageStore(backend)
+    _upsert(store, 1, [11, 12])
+    _upsert(store, 2, [21, 22])
+    _upsert(store, 3, [31])
+
+    # 1 は送信元、21 と 31 は送信先、99 は未知の ID。
+    assert store.delete_many([1, 21, 31, 99]) == 2
+
+    assert store.get(1) is None
+    assert store.get(2).destination_ids == [22]
+    assert store.get(3) is None
+    assert backend.find_message_by_destination(11) is None
+    assert backend.find_message_by_destination(22)["source_id"] == 2
+    assert store.delete_many([]) == 0
+
+
+def test_backend_deletes_bounded_batches_by_source_id(backend: BridgeStorageBackend) -> None:
+    store = BridgeMessageStore(backend)
+    for source_id in (10, 20, 30, 40):
+        _upsert(store, source_id, [source_id + 1])
+
+    assert backend.delete_messages_before_source(35, limit=2) == 2
+    assert backend.delete_messages_before_source(35, limit=2) == 1
+    assert backend.delete_messages_before_source(35, limit=2) == 0
+    assert [store.get(source_id) is not None for source_id in (10, 20, 30, 40)] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert backend.find_message_by_destination(11) is None
+
+
+def test_profile_store_seeds_dictionary_and_persists_guild_colors(
+    backend: BridgeStorageBackend,
+) -> None:
+    store = BridgeProfileStore(backend)
+    assert backend.get_profile_record("dictionary")["adjectives"] == DEFAULT_ADJECTIVES
+
+    colors = store.ensure_guild_colors([111, 222])
+
+    reloaded = BridgeProfileStore(backend)
+    assert reloaded.get_guild_color(111) == colors[111]
+    assert reloaded.get_guild_color(222) == colors[222]
+
+
+def test_sqlite_backend_uses_wal_and_survives_reopen(tmp_path) -> None:
+    path = tmp_path / "bridge.sqlite3"
+    backend = SqliteStorageBackend(path)
+    _upsert(BridgeMessageStore(backend), 5, [50])
+    journal_mode = backend._connection.execute("PRAGMA journal_mode").fetchone()[0]
+    backend.close()
+
+    reopened = SqliteStorageBackend(path)
+    try:
+        assert journal_mode == "wal"
+        assert BridgeMessageStore(reopened).get(5).destination_ids == [50]
+    finally:
+        reopened.close()
+
+
+def test_backend_leases_are_exclusive_until_expired(backend: BridgeStorageBackend) -> None:
+    assert backend.acquire_lease("channel:1", "a", ttl=30)
+    assert not backend.acquire_lease("channel:1", "b", ttl=30)
+    assert backend.acquire_lease("channel:1", "a", ttl=30)
+    assert backend.acquire_lease("channel:2", "b", ttl=-1)
+    # 期限切れのリースは他のオーナーが引き継げる。
+    assert backend.acquire_lease("channel:2", "a", ttl=30)
+    assert sorted((row["resource"], row["owner"]) for row in backend.list_active_leases()) == [
+        ("channel:1", "a"),
+        ("channel:2", "a"),
+    ]
+
+    backend.release_lease("channel:1", "b")
+    backend.release_lease("channel:2", "a")
+    assert [row["resource"] for row in backend.list_active_leases()] == ["channel:1"]
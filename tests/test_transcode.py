@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import io
+import os
+from typing import Any
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+from benchmarks.fakes import FakeAttachment  # noqa: E402
+from bot.bridge.manager import ATTACHMENT_LABELS  # noqa: E402
+from bot.bridge.transcode import MediaTranscoder  # noqa: E402
+
+_LIMIT = 512 * 1024
+
+
+class _ImageAttachment(FakeAttachment):
+    def __init__(self, *, attachment_id: int, data: bytes) -> None:
+        super().__init__(
+            attachment_id=attachment_id,
+            filename="photo.png",
+            content_type="image/png",
+            size=len(data),
+            latency=0.0,
+        )
+        self._data = data
+        self.reads = 0
+
+    async def read(self, **_kwargs: Any) -> bytes:
+        self.reads += 1
+        return self._data
+
+
+def _noisy_png(side: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", (side, side), os.urandom(side * side * 3)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_oversized_image_is_downscaled_once_for_every_destination(bridge) -> None:
+    destinations = [bridge.channel(channel_id) for channel_id in (200, 300)]
+    for destination in destinations:
+        destination.guild.filesize_limit = _LIMIT
+    transcoder = MediaTranscoder(workers=1, max_dimension=1024)
+    manager = bridge.manager(bridge.routes(100, (200, 300)), transcoder=transcoder)
+    uploads: list[list[tuple[str, int]]] = []
+    for destination in destinations:
+        original_send = destination.send
+
+        async def _recording_send(_send=original_send, **kwargs: Any):
+            uploads.append([(file.filename, len(file.fp.getvalue())) for file in kwargs.get("files", ())])
+            return await _send(**kwargs)
+
+        destination.send = _recording_send  # type: ignore[method-assign]
+
+    attachment = _ImageAttachment(attachment_id=bridge.client.snowflakes.next(), data=_noisy_png(1200))
+    assert attachment.size > _LIMIT
+    message = bridge.message(bridge.channel(100), "photo", attachments=[attachment])
+
+    try:
+        await manager.handle_message(message)  # type: ignore[arg-type]
+    finally:
+        await manager.close()
+
+    assert [destination.sent for destination in destinations] == [1, 1]
+    assert attachment.reads == 1
+    for files in uploads:
+        [(filename, size)] = files
+        assert filename == "photo.jpg"
+        assert size <= _LIMIT
+    mirror = next(iter(destinations[0].messages.values()))
+    assert mirror.embeds[0].image.url == "attachment://photo.jpg"
+    assert f"{ATTACHMENT_LABELS['image']} {attachment.url}" in str(mirror.embeds[0].description)
+    transcodes = manager.metrics.get("bridge_attachments_total")
+    assert transcodes.value(result="transcoded") == 2